@@ -0,0 +1,94 @@
+"""Benchmark title deduplication at 1k, 10k and 100k papers.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_deduplication [--reference]
+
+``--reference`` also times the original pairwise scan, which is only
+practical at the smallest size.
+"""
+import argparse
+import difflib
+import random
+import string
+import time
+from typing import List
+
+from deep_research.api.models import Paper
+from deep_research.core.deduplication import DeduplicationEngine, normalize_title
+
+SIZES = [1_000, 10_000, 100_000]
+# Relative English letter frequencies, so generated words have realistic q-grams.
+LETTER_WEIGHTS = {
+    "e": 12.7, "t": 9.1, "a": 8.2, "o": 7.5, "i": 7.0, "n": 6.7, "s": 6.3, "h": 6.1,
+    "r": 6.0, "d": 4.3, "l": 4.0, "c": 2.8, "u": 2.8, "m": 2.4, "w": 2.4, "f": 2.2,
+    "g": 2.0, "y": 2.0, "p": 1.9, "b": 1.5, "v": 1.0, "k": 0.8, "j": 0.2, "x": 0.2,
+    "q": 0.1, "z": 0.1
+}
+CONNECTIVES = ["of", "in", "for", "with", "and", "the", "a", "on", "using", "among"]
+
+
+def make_vocabulary(size: int, rng: random.Random) -> List[str]:
+    letters, weights = zip(*LETTER_WEIGHTS.items())
+    return [
+        "".join(rng.choices(letters, weights=weights, k=rng.randint(3, 12)))
+        for _ in range(size)
+    ]
+
+
+def make_titles(count: int, duplicate_rate: float = 0.2, seed: int = 0) -> List[str]:
+    """Generate titles with Zipf-Mandelbrot distributed words and near-duplicate variants."""
+    rng = random.Random(seed)
+    vocabulary = make_vocabulary(50_000, rng)
+    weights = [1 / (rank + 10) for rank in range(1, len(vocabulary) + 1)]
+    titles: List[str] = []
+    for _ in range(count):
+        if titles and rng.random() < duplicate_rate:
+            title = list(rng.choice(titles))
+            position = rng.randrange(len(title))
+            title[position] = rng.choice(string.ascii_lowercase)
+            titles.append("".join(title))
+            continue
+        length = rng.randint(6, 16)
+        words = rng.choices(vocabulary, weights=weights, k=length)
+        words = [
+            rng.choice(CONNECTIVES) if rng.random() < 0.25 else word
+            for word in words
+        ]
+        titles.append(" ".join(words).capitalize())
+    return titles
+
+
+def reference_deduplicate(titles: List[str]) -> int:
+    kept: List[str] = []
+    for title in titles:
+        if not any(difflib.SequenceMatcher(None, title, other).ratio() > 0.95 for other in kept):
+            kept.append(title)
+    return len(kept)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--reference", action="store_true", help="also time the pairwise scan at 1k")
+    args = parser.parse_args()
+
+    engine = DeduplicationEngine()
+    for size in SIZES:
+        titles = make_titles(size)
+        papers = [Paper(paper_id=str(i), title=title) for i, title in enumerate(titles)]
+
+        start = time.perf_counter()
+        kept = engine.deduplicate(papers)
+        elapsed = time.perf_counter() - start
+        print(f"{size:>7} titles: {elapsed:8.2f}s, kept {len(kept)}")
+
+        if args.reference and size == SIZES[0]:
+            normalized = [normalize_title(title) for title in titles]
+            start = time.perf_counter()
+            reference_kept = reference_deduplicate(normalized)
+            elapsed = time.perf_counter() - start
+            print(f"{size:>7} titles: {elapsed:8.2f}s, kept {reference_kept} (pairwise scan)")
+
+
+if __name__ == "__main__":
+    main()
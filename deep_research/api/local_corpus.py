@@ -0,0 +1,93 @@
+import asyncio
+from typing import Any, Optional, Union
+
+from deep_research.api.models import SearchResult
+from deep_research.storage.ann_index import IVFIndex
+from deep_research.storage.async_cache import AsyncCacheManager
+from deep_research.storage.cache import CacheManager
+from deep_research.storage.embedding_store import DEFAULT_MODEL, EmbeddingStore
+from deep_research.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class LocalCorpusClient:
+    """Semantic search over papers already embedded and cached on this machine.
+
+    An ``IVFIndex`` is built from the embedding store on the first search
+    (or passed in), the query is encoded with the same model the papers were
+    embedded with, and the nearest papers are read back from the paper cache.
+    No API call is made. Papers embedded after the index was built are only
+    found after ``refresh``. Await ``close`` when done; it stops the cache
+    thread if ``cache`` was given as a ``CacheManager``.
+    """
+
+    def __init__(
+        self,
+        cache: Union[CacheManager, AsyncCacheManager],
+        embedding_store: EmbeddingStore,
+        model_name: str = DEFAULT_MODEL,
+        model: Optional[Any] = None,
+        index: Optional[IVFIndex] = None,
+        nprobe: int = 8
+    ):
+        self._owns_cache = isinstance(cache, CacheManager)
+        if self._owns_cache:
+            cache = AsyncCacheManager(cache)
+        self.cache = cache
+        self.embedding_store = embedding_store
+        self.model_name = model_name
+        self.nprobe = nprobe
+        self._model = model
+        self._index = index
+        self._index_lock = asyncio.Lock()
+
+    async def search_papers(
+        self,
+        query: str,
+        limit: int = 100,
+        offset: int = 0,
+        fields: Optional[str] = None
+    ) -> SearchResult:
+        """Return the cached papers nearest to ``query``, most similar first.
+
+        ``fields`` is accepted for compatibility with ``SemanticScholarClient``
+        and ignored, since cached papers are returned whole.
+        """
+        index = await self._get_index()
+        if self._model is None:
+            # Imported here so that sources which never search locally do not
+            # pay for importing sentence-transformers.
+            from deep_research.core.relevance import get_model
+            self._model = await asyncio.to_thread(get_model, self.model_name)
+        query_embedding = await asyncio.to_thread(self._model.encode, query)
+        hits = await asyncio.to_thread(index.search, query_embedding, offset + limit)
+
+        paper_ids = [paper_id for paper_id, _ in hits[offset:]]
+        cached = await self.cache.get_many(paper_ids)
+        papers = [cached[paper_id] for paper_id in paper_ids if paper_id in cached]
+        logger.debug(f"LocalCorpus: {len(papers)} papers for '{query}' from {len(index)} indexed")
+        return SearchResult(papers=papers, total=len(index), offset=offset)
+
+    async def refresh(self):
+        """Rebuild the index from the embeddings stored so far."""
+        async with self._index_lock:
+            self._index = await asyncio.to_thread(self._build_index)
+
+    async def close(self):
+        if self._owns_cache:
+            await self.cache.close()
+        else:
+            await self.cache.flush()
+
+    async def _get_index(self) -> IVFIndex:
+        async with self._index_lock:
+            if self._index is None:
+                self._index = await asyncio.to_thread(self._build_index)
+            return self._index
+
+    def _build_index(self) -> IVFIndex:
+        paper_ids, vectors = self.embedding_store.export(self.model_name)
+        index = IVFIndex.build(paper_ids, vectors, nprobe=self.nprobe)
+        logger.info(f"LocalCorpus: indexed {len(index)} papers in {index.num_lists} lists")
+        return index
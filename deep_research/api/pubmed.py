@@ -1,21 +1,58 @@
 import httpx
 import xml.etree.ElementTree as ET
-from typing import List
+from typing import Dict, List, Optional, Union
 from deep_research.api.models import Paper, Author, ExternalIds
+from deep_research.storage.async_cache import AsyncCacheManager
+from deep_research.storage.cache import CacheManager, make_search_key
 from deep_research.utils.logging import get_logger
+from deep_research.utils.singleflight import SingleFlight
 
 logger = get_logger(__name__)
 
 
 class PubMedClient:
+    """NCBI E-utilities client for PubMed search and records.
+    
+    As with ``SemanticScholarClient``, a ``CacheManager`` passed as ``cache``
+    is written to in the background until ``close()`` is awaited.
+    """
+    
     BASE_URL = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils"
     
-    def __init__(self, api_key: str = "", email: str = ""):
+    def __init__(
+        self,
+        api_key: str = "",
+        email: str = "",
+        cache: Optional[Union[CacheManager, AsyncCacheManager]] = None,
+        ttl_days: int = 30,
+        search_ttl_days: int = 7
+    ):
         self.api_key = api_key
         self.email = email
+        self._owns_cache = isinstance(cache, CacheManager)
+        if self._owns_cache:
+            cache = AsyncCacheManager(cache)
+        self.cache = cache
+        self.ttl_days = ttl_days
+        self.search_ttl_days = search_ttl_days
         self.client = httpx.AsyncClient(timeout=30)
+        self._inflight = SingleFlight()
+        self._inflight_records = SingleFlight()
     
     async def search(self, query: str, max_results: int = 100) -> List[str]:
+        cache_key = make_search_key("pubmed", query, retmax=max_results)
+        return await self._inflight.do(
+            cache_key,
+            lambda: self._search(query, max_results, cache_key)
+        )
+    
+    async def _search(self, query: str, max_results: int, cache_key: str) -> List[str]:
+        if self.cache:
+            cached = await self.cache.get_search(cache_key, ttl_days=self.search_ttl_days)
+            if cached is not None:
+                logger.debug(f"Search cache hit for '{query}'")
+                return cached[0]
+        
         url = f"{self.BASE_URL}/esearch.fcgi"
         params = {
             "db": "pubmed",
@@ -31,12 +68,48 @@ class PubMedClient:
         response.raise_for_status()
         
         data = response.json()
-        return data.get("esearchresult", {}).get("idlist", [])
+        result = data.get("esearchresult", {})
+        pmids = result.get("idlist", [])
+        
+        if self.cache:
+            total = int(result.get("count", len(pmids)))
+            await self.cache.set_search(cache_key, "pubmed", query, pmids, total)
+        
+        return pmids
     
     async def fetch_details(self, pmids: List[str]) -> List[Paper]:
         if not pmids:
             return []
         
+        pmids = list(dict.fromkeys(pmids))
+        cached = {}
+        if self.cache:
+            cached = await self.cache.get_many(
+                [self._paper_id(pmid) for pmid in pmids],
+                ttl_days=self.ttl_days
+            )
+            logger.debug(f"PubMed cache: {len(cached)}/{len(pmids)} records cached")
+        
+        missing = [pmid for pmid in pmids if self._paper_id(pmid) not in cached]
+        fetched = {}
+        if missing:
+            # Coalesce per PMID so overlapping concurrent batches share requests.
+            fetched = await self._inflight_records.do_many(missing, self._fetch_missing)
+        
+        papers = dict(cached)
+        papers.update((self._paper_id(pmid), paper) for pmid, paper in fetched.items())
+        return [papers[self._paper_id(pmid)] for pmid in pmids if self._paper_id(pmid) in papers]
+    
+    async def _fetch_missing(self, pmids: List[str]) -> Dict[str, Paper]:
+        papers = await self._fetch_records(pmids)
+        if self.cache and papers:
+            await self.cache.set_many(papers, "pubmed")
+        return {paper.external_ids.pmid: paper for paper in papers}
+    
+    def _paper_id(self, pmid: str) -> str:
+        return f"PMID:{pmid}"
+    
+    async def _fetch_records(self, pmids: List[str]) -> List[Paper]:
         url = f"{self.BASE_URL}/efetch.fcgi"
         params = {
             "db": "pubmed",
@@ -84,7 +157,7 @@ class PubMedClient:
                         authors.append(Author(name=name))
                 
                 papers.append(Paper(
-                    paper_id=f"PMID:{pmid}",
+                    paper_id=self._paper_id(pmid),
                     title=title,
                     abstract=abstract,
                     year=year,
@@ -98,4 +171,8 @@ class PubMedClient:
         return papers
     
     async def close(self):
+        if self._owns_cache:
+            await self.cache.close()
+        elif self.cache:
+            await self.cache.flush()
         await self.client.aclose()
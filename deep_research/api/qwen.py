@@ -1,23 +1,100 @@
 import httpx
 import asyncio
+from typing import Optional, Union
 from deep_research.config import APIConfig
 from deep_research.api.models import QwenResponse
+from deep_research.storage.async_cache import AsyncCacheManager
+from deep_research.storage.cache import CacheManager, make_llm_key
 from deep_research.utils.logging import get_logger
+from deep_research.utils.singleflight import SingleFlight
 
 logger = get_logger(__name__)
 
 
 class QwenClient:
-    def __init__(self, config: APIConfig):
+    def __init__(
+        self,
+        config: APIConfig,
+        cache: Optional[Union[CacheManager, AsyncCacheManager]] = None,
+        cache_max_temperature: Optional[float] = None
+    ):
+        """
+        Create a chat completions client.
+        
+        Args:
+            config: API settings
+            cache: Optional response cache shared with the paper cache. A
+                ``CacheManager`` is wrapped in an ``AsyncCacheManager`` that
+                this client shuts down in ``close()``, which must be awaited
+            cache_max_temperature: If set, completions sampled above this
+                temperature are never cached; None caches every temperature
+        """
         self.config = config
+        self._owns_cache = isinstance(cache, CacheManager)
+        if self._owns_cache:
+            cache = AsyncCacheManager(cache)
+        self.cache = cache
+        self.cache_max_temperature = cache_max_temperature
         self.client = httpx.AsyncClient(timeout=config.timeout)
+        self._inflight = SingleFlight()
     
     async def complete(
         self,
         prompt: str,
         max_tokens: int = 4096,
-        temperature: float = 0.7
+        temperature: float = 0.7,
+        prompt_version: str = "",
+        use_cache: Optional[bool] = None
+    ) -> QwenResponse:
+        """
+        Complete a prompt, reusing a cached response for identical requests.
+        
+        Identical cacheable requests that run concurrently share one API call.
+        
+        Args:
+            prompt: User message to send
+            max_tokens: Completion length limit
+            temperature: Sampling temperature
+            prompt_version: Version of the calling prompt template; bump it to
+                invalidate cached responses when parsing or semantics change
+            use_cache: Force caching on or off for this call; None applies
+                ``cache_max_temperature``
+        """
+        if not self._is_cacheable(temperature, use_cache):
+            return await self._request(prompt, max_tokens, temperature)
+        
+        cache_key = make_llm_key(self.config.model, prompt, temperature, max_tokens, prompt_version)
+        return await self._inflight.do(
+            cache_key,
+            lambda: self._complete_cached(cache_key, prompt, max_tokens, temperature)
+        )
+    
+    async def _complete_cached(
+        self,
+        cache_key: str,
+        prompt: str,
+        max_tokens: int,
+        temperature: float
     ) -> QwenResponse:
+        if self.cache:
+            cached = await self.cache.get_llm_response(cache_key)
+            if cached is not None:
+                logger.debug("LLM cache hit")
+                return cached
+        
+        response = await self._request(prompt, max_tokens, temperature)
+        if self.cache:
+            await self.cache.set_llm_response(cache_key, response)
+        return response
+    
+    def _is_cacheable(self, temperature: float, use_cache: Optional[bool]) -> bool:
+        if use_cache is not None:
+            return use_cache
+        if self.cache_max_temperature is None:
+            return True
+        return temperature <= self.cache_max_temperature
+    
+    async def _request(self, prompt: str, max_tokens: int, temperature: float) -> QwenResponse:
         url = f"{self.config.base_url}/chat/completions"
         headers = {
             "Authorization": f"Bearer {self.config.api_key}",
@@ -64,4 +141,8 @@ class QwenClient:
         raise Exception("Max retries exceeded")
     
     async def close(self):
+        if self._owns_cache:
+            await self.cache.close()
+        elif self.cache:
+            await self.cache.flush()
         await self.client.aclose()
@@ -1,21 +1,59 @@
+import asyncio
 import httpx
-from typing import List, Optional, TYPE_CHECKING
+from typing import AsyncIterator, Dict, List, Optional, Tuple, Union
 from deep_research.api.models import Paper, SearchResult, Author, ExternalIds
+from deep_research.storage.async_cache import AsyncCacheManager
+from deep_research.storage.cache import CacheManager, make_search_key
+from deep_research.storage.edge_store import EdgeStore
+from deep_research.utils.fetcher import fetch_parallel
 from deep_research.utils.logging import get_logger
-
-if TYPE_CHECKING:
-    from deep_research.storage.cache import CacheManager
+from deep_research.utils.rate_limiter import RateLimiter
+from deep_research.utils.singleflight import SingleFlight
 
 logger = get_logger(__name__)
 
 
 class SemanticScholarClient:
+    """Semantic Scholar Graph API client with optional caching.
+    
+    A ``CacheManager`` passed as ``cache`` is wrapped in a write-behind
+    ``AsyncCacheManager``, so callers must ``await close()`` for the last
+    papers to be stored. Requests are throttled to ``CALLS_PER_SECOND``
+    unless another ``rate_limiter`` is given, and responses with status 429
+    are retried with exponential backoff.
+    """
+    
     BASE_URL = "https://api.semanticscholar.org/graph/v1"
+    PAPER_FIELDS = "paperId,title,abstract,year,authors,venue,citationCount,externalIds,url"
+    MAX_BATCH_SIZE = 500
+    LINK_FIELDS = "paperId,title,year,citationCount"
+    LINK_PAGE_SIZE = 1000
+    # Semantic Scholar's default limit for API keys.
+    CALLS_PER_SECOND = 1.0
+    MAX_RETRIES = 4
+    RETRY_BASE_DELAY = 1.0
     
-    def __init__(self, api_key: Optional[str] = None, cache: Optional["CacheManager"] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        cache: Optional[Union[CacheManager, AsyncCacheManager]] = None,
+        ttl_days: int = 30,
+        search_ttl_days: int = 7,
+        rate_limiter: Optional[RateLimiter] = None,
+        edge_store: Optional[EdgeStore] = None
+    ):
         self.api_key = api_key
+        self.rate_limiter = rate_limiter or RateLimiter(self.CALLS_PER_SECOND)
+        self.ttl_days = ttl_days
+        self.search_ttl_days = search_ttl_days
+        self._owns_cache = isinstance(cache, CacheManager)
+        if self._owns_cache:
+            cache = AsyncCacheManager(cache)
         self.cache = cache
+        self.edge_store = edge_store
         self.client = httpx.AsyncClient(timeout=30)
+        self._inflight = SingleFlight()
+        self._inflight_papers = SingleFlight()
     
     def _get_headers(self):
         headers = {}
@@ -23,6 +61,34 @@ class SemanticScholarClient:
             headers["x-api-key"] = self.api_key
         return headers
     
+    async def _get(self, url: str, params: dict) -> httpx.Response:
+        return await self._send(
+            lambda: self.client.get(url, params=params, headers=self._get_headers())
+        )
+    
+    async def _post(self, url: str, params: dict, json: dict) -> httpx.Response:
+        return await self._send(
+            lambda: self.client.post(url, params=params, json=json, headers=self._get_headers())
+        )
+    
+    async def _send(self, request) -> httpx.Response:
+        # One client talks to one host, so its limiter is the per-host limit.
+        for attempt in range(self.MAX_RETRIES):
+            async with self.rate_limiter:
+                response = await request()
+            if response.status_code != 429 or attempt == self.MAX_RETRIES - 1:
+                return response
+            wait_time = self._retry_delay(response, attempt)
+            logger.warning(f"Rate limited, retrying in {wait_time}s")
+            await asyncio.sleep(wait_time)
+        return response
+    
+    def _retry_delay(self, response: httpx.Response, attempt: int) -> float:
+        retry_after = response.headers.get("Retry-After", "")
+        if retry_after.isdigit():
+            return float(retry_after)
+        return self.RETRY_BASE_DELAY * 2 ** attempt
+    
     def _parse_paper(self, data: dict) -> Paper:
         authors = [Author(name=a.get("name", ""), author_id=a.get("authorId")) 
                    for a in data.get("authors", [])]
@@ -67,7 +133,28 @@ class SemanticScholarClient:
             "fields": fields
         }
         
-        response = await self.client.get(url, params=params, headers=self._get_headers())
+        cache_key = make_search_key(
+            "semantic_scholar",
+            query,
+            limit=params["limit"],
+            offset=offset,
+            fields=fields
+        )
+        return await self._inflight.do(
+            ("search", cache_key),
+            lambda: self._search(url, params, cache_key)
+        )
+    
+    async def _search(self, url: str, params: dict, cache_key: str) -> SearchResult:
+        query = params["query"]
+        offset = params["offset"]
+        if self.cache:
+            cached = await self._cached_search(cache_key, offset)
+            if cached is not None:
+                logger.debug(f"Search cache hit for '{query}'")
+                return cached
+        
+        response = await self._get(url, params)
         
         if response.status_code == 404:
             raise Exception(f"Paper not found (404)")
@@ -78,26 +165,52 @@ class SemanticScholarClient:
         papers = [self._parse_paper(p) for p in data.get("data", [])]
         
         if self.cache:
-            for paper in papers:
-                self.cache.set(paper.paper_id, paper, "semantic_scholar")
+            await self.cache.set_many(papers, "semantic_scholar")
+            await self.cache.set_search(
+                cache_key,
+                "semantic_scholar",
+                query,
+                [paper.paper_id for paper in papers],
+                data.get("total", 0)
+            )
             logger.debug(f"Cached {len(papers)} papers from search")
         
         return SearchResult(papers=papers, total=data.get("total", 0), offset=offset)
     
+    async def _cached_search(self, cache_key: str, offset: int) -> Optional[SearchResult]:
+        cached = await self.cache.get_search(cache_key, ttl_days=self.search_ttl_days)
+        if cached is None:
+            return None
+        result_ids, total = cached
+        papers = await self.cache.get_many(result_ids, ttl_days=self.ttl_days)
+        if len(papers) < len(set(result_ids)):
+            return None
+        return SearchResult(
+            papers=[papers[paper_id] for paper_id in result_ids],
+            total=total,
+            offset=offset
+        )
+    
     async def get_paper(self, paper_id: str, fields: Optional[str] = None) -> Paper:
+        return await self._inflight.do(
+            ("paper", paper_id, fields),
+            lambda: self._get_paper(paper_id, fields)
+        )
+    
+    async def _get_paper(self, paper_id: str, fields: Optional[str]) -> Paper:
         if self.cache:
-            cached = self.cache.get(paper_id)
-            if cached and not self.cache.is_expired(paper_id, 30):
+            cached = await self.cache.get(paper_id, ttl_days=self.ttl_days)
+            if cached:
                 logger.debug(f"Cache hit for paper {paper_id}")
                 return cached
         
         if fields is None:
-            fields = "paperId,title,abstract,year,authors,venue,citationCount,externalIds,url"
+            fields = self.PAPER_FIELDS
         
         url = f"{self.BASE_URL}/paper/{paper_id}"
         params = {"fields": fields}
         
-        response = await self.client.get(url, params=params, headers=self._get_headers())
+        response = await self._get(url, params)
         
         if response.status_code == 404:
             raise Exception(f"Paper not found (404)")
@@ -106,36 +219,262 @@ class SemanticScholarClient:
         paper = self._parse_paper(response.json())
         
         if self.cache:
-            self.cache.set(paper_id, paper, "semantic_scholar")
+            await self.cache.set(paper_id, paper, "semantic_scholar")
             logger.debug(f"Cached paper {paper_id}")
         
         return paper
     
-    async def get_citations(self, paper_id: str, limit: int = 100) -> List[Paper]:
-        url = f"{self.BASE_URL}/paper/{paper_id}/citations"
-        params = {
-            "limit": min(limit, 100),
-            "fields": "paperId,title,year,citationCount"
-        }
+    async def get_papers(
+        self,
+        paper_ids: List[str],
+        fields: Optional[str] = None,
+        max_concurrent: int = 4
+    ) -> List[Paper]:
+        """
+        Hydrate many papers through the /paper/batch endpoint.
+        
+        Cached papers are returned without a request; the misses are split into
+        batches of up to 500 IDs that are posted concurrently.
+        
+        Args:
+            paper_ids: Paper identifiers accepted by Semantic Scholar
+            fields: Comma-separated fields to request
+            max_concurrent: Maximum number of batch requests in flight
+        
+        Returns:
+            Papers in the order of ``paper_ids``; unknown IDs are omitted
+        """
+        ids = list(dict.fromkeys(paper_ids))
+        if fields is None:
+            fields = self.PAPER_FIELDS
+        
+        found: Dict[str, Paper] = {}
+        if self.cache:
+            found = await self.cache.get_many(ids, ttl_days=self.ttl_days)
         
-        response = await self.client.get(url, params=params, headers=self._get_headers())
+        missing = [paper_id for paper_id in ids if paper_id not in found]
+        if missing:
+            logger.debug(f"Batch hydrating {len(missing)} of {len(ids)} papers")
+            found.update(await self._inflight_papers.do_many(
+                missing,
+                lambda keys: self._fetch_batches(keys, fields, max_concurrent)
+            ))
+        
+        return [found[paper_id] for paper_id in ids if paper_id in found]
+    
+    async def _fetch_batches(
+        self,
+        paper_ids: List[str],
+        fields: str,
+        max_concurrent: int
+    ) -> Dict[str, Paper]:
+        batches = [
+            paper_ids[start:start + self.MAX_BATCH_SIZE]
+            for start in range(0, len(paper_ids), self.MAX_BATCH_SIZE)
+        ]
+        results = await fetch_parallel(
+            batches,
+            lambda batch: self._fetch_batch(batch, fields),
+            max_concurrent=max_concurrent
+        )
+        
+        papers: Dict[str, Paper] = {}
+        for result in results:
+            if isinstance(result, Exception):
+                logger.warning(f"Paper batch request failed with {result}")
+                continue
+            papers.update(result)
+        
+        if self.cache and papers:
+            await self.cache.set_many(papers.values(), "semantic_scholar")
+            # Alias IDs such as "DOI:..." are cached too, as get_paper does, so
+            # that asking by the same alias again is a cache hit.
+            for requested_id, paper in papers.items():
+                if requested_id != paper.paper_id:
+                    await self.cache.set(requested_id, paper, "semantic_scholar")
+        return papers
+    
+    async def _fetch_batch(self, paper_ids: List[str], fields: str) -> Dict[str, Paper]:
+        url = f"{self.BASE_URL}/paper/batch"
+        response = await self._post(url, params={"fields": fields}, json={"ids": paper_ids})
         response.raise_for_status()
         
-        data = response.json()
-        return [self._parse_paper(item["citingPaper"]) for item in data.get("data", [])]
+        # The endpoint answers positionally, with null for unknown IDs.
+        return {
+            paper_id: self._parse_paper(item)
+            for paper_id, item in zip(paper_ids, response.json())
+            if item is not None
+        }
+    
+    async def get_citations(self, paper_id: str, limit: int = 100) -> List[Paper]:
+        return await self._inflight.do(
+            ("citations", paper_id, limit),
+            lambda: self._get_linked(paper_id, "citations", "citingPaper", limit)
+        )
     
     async def get_references(self, paper_id: str, limit: int = 100) -> List[Paper]:
-        url = f"{self.BASE_URL}/paper/{paper_id}/references"
+        return await self._inflight.do(
+            ("references", paper_id, limit),
+            lambda: self._get_linked(paper_id, "references", "citedPaper", limit)
+        )
+    
+    async def iter_citations(
+        self,
+        paper_id: str,
+        limit: int = 1000,
+        max_concurrent: int = 4,
+        total: Optional[int] = None
+    ) -> AsyncIterator[Paper]:
+        """
+        Yield up to ``limit`` citing papers as their pages arrive.
+        
+        When ``total``, the paper's known citation count, is given, the pages
+        it covers are requested ``max_concurrent`` at a time. Pages past it,
+        or every page without it, are only requested once the previous page
+        reported that more follow.
+        """
+        async for paper in self._iter_linked(
+            paper_id, "citations", "citingPaper", limit, max_concurrent, total
+        ):
+            yield paper
+    
+    async def iter_references(
+        self,
+        paper_id: str,
+        limit: int = 1000,
+        max_concurrent: int = 4,
+        total: Optional[int] = None
+    ) -> AsyncIterator[Paper]:
+        """Yield up to ``limit`` referenced papers as their pages arrive.
+        
+        ``total`` is the paper's known reference count, as in ``iter_citations``.
+        """
+        async for paper in self._iter_linked(
+            paper_id, "references", "citedPaper", limit, max_concurrent, total
+        ):
+            yield paper
+    
+    async def _get_linked(self, paper_id: str, endpoint: str, key: str, limit: int) -> List[Paper]:
+        return [paper async for paper in self._iter_linked(paper_id, endpoint, key, limit)]
+    
+    async def _iter_linked(
+        self,
+        paper_id: str,
+        endpoint: str,
+        key: str,
+        limit: int,
+        max_concurrent: int = 4,
+        total: Optional[int] = None
+    ) -> AsyncIterator[Paper]:
+        if self.edge_store:
+            known_ids = await asyncio.to_thread(
+                self.edge_store.get_linked,
+                paper_id,
+                endpoint,
+                limit,
+                ttl_days=self.ttl_days
+            )
+            if known_ids is not None:
+                logger.debug(f"Edge store hit for {endpoint} of {paper_id}")
+                stored = await asyncio.to_thread(self.edge_store.get_linked_papers, known_ids)
+                # Only edges stored before their records were kept need a request.
+                missing = [related_id for related_id in known_ids if related_id not in stored]
+                if missing:
+                    stored.update(
+                        (paper.paper_id, paper) for paper in await self.get_papers(missing)
+                    )
+                for related_id in known_ids:
+                    if related_id in stored:
+                        yield stored[related_id]
+                return
+        
+        # The first page tells whether there is more. Pages known to exist,
+        # from ``total`` or from the previous page's ``next``, are then
+        # requested up to ``max_concurrent`` at a time and their papers are
+        # yielded in arrival order.
+        page_size = min(limit, self.LINK_PAGE_SIZE)
+        papers, has_next = await self._fetch_link_page(paper_id, endpoint, key, 0, page_size)
+        fetched = list(papers)
+        for paper in papers:
+            yield paper
+        
+        end = limit if has_next else len(papers)
+        known_end = max(page_size + 1, total or 0)
+        next_offset = page_size
+        pending: Dict[asyncio.Task, int] = {}
+        
+        def schedule():
+            nonlocal next_offset
+            while len(pending) < max_concurrent:
+                offset = next_offset
+                if offset >= min(end, known_end):
+                    return
+                next_offset += page_size
+                size = min(page_size, limit - offset)
+                task = asyncio.ensure_future(
+                    self._fetch_link_page(paper_id, endpoint, key, offset, size)
+                )
+                pending[task] = offset
+        
+        try:
+            schedule()
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in sorted(done, key=pending.get):
+                    offset = pending.pop(task)
+                    if offset >= end:
+                        # Past the last page; its outcome no longer matters.
+                        if not task.cancelled():
+                            task.exception()
+                        continue
+                    papers, has_next = task.result()
+                    if has_next:
+                        known_end = max(known_end, offset + len(papers) + 1)
+                    else:
+                        end = min(end, offset + len(papers))
+                    fetched.extend(papers)
+                    for paper in papers:
+                        yield paper
+                schedule()
+        finally:
+            for task in pending:
+                task.cancel()
+        
+        if self.edge_store:
+            await asyncio.to_thread(self.edge_store.add_linked_papers, fetched)
+            await asyncio.to_thread(
+                self.edge_store.add_edges,
+                paper_id,
+                endpoint,
+                [paper.paper_id for paper in fetched if paper.paper_id],
+                limit
+            )
+    
+    async def _fetch_link_page(
+        self,
+        paper_id: str,
+        endpoint: str,
+        key: str,
+        offset: int,
+        limit: int
+    ) -> Tuple[List[Paper], bool]:
+        url = f"{self.BASE_URL}/paper/{paper_id}/{endpoint}"
         params = {
-            "limit": min(limit, 100),
-            "fields": "paperId,title,year,citationCount"
+            "offset": offset,
+            "limit": limit,
+            "fields": self.LINK_FIELDS
         }
         
-        response = await self.client.get(url, params=params, headers=self._get_headers())
+        response = await self._get(url, params)
         response.raise_for_status()
         
         data = response.json()
-        return [self._parse_paper(item["citedPaper"]) for item in data.get("data", [])]
+        papers = [self._parse_paper(item[key]) for item in data.get("data", [])]
+        return papers, "next" in data and len(papers) == limit
     
     async def close(self):
+        if self._owns_cache:
+            await self.cache.close()
+        elif self.cache:
+            await self.cache.flush()
         await self.client.aclose()
@@ -1,5 +1,6 @@
 from pydantic import BaseModel, Field
 from pathlib import Path
+from typing import Optional
 import os
 
 
@@ -13,7 +14,11 @@ class APIConfig(BaseModel):
 class CacheConfig(BaseModel):
     path: Path = Path.home() / ".deep-research" / "cache.db"
     ttl_days: int = 30
+    search_ttl_days: int = 7
     enabled: bool = True
+    memory_max_entries: int = 2048
+    memory_max_mb: int = 64
+    max_size_mb: Optional[int] = 1024
 
 
 class SearchConfig(BaseModel):
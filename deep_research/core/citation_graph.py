@@ -1,18 +1,36 @@
 import asyncio
+import heapq
+import itertools
 from datetime import datetime, timedelta, timezone
-from typing import List, Optional
+from typing import AsyncIterator, Callable, Dict, List, Optional, Tuple
 
 from deep_research.api.models import Paper
 from deep_research.api.semantic_scholar import SemanticScholarClient
+from deep_research.storage.edge_store import CSRGraph
+from deep_research.utils.fetcher import fetch_parallel
 from deep_research.utils.logging import get_logger
 
 
 logger = get_logger(__name__)
 
+# Age assumed for papers without any date when computing citation velocity.
+UNDATED_PAPER_AGE_YEARS = 10.0
+
 
 class CitationGraphExplorer:
-    def __init__(self, semantic_client: Optional[SemanticScholarClient] = None):
+    def __init__(
+        self,
+        semantic_client: Optional[SemanticScholarClient] = None,
+        max_concurrent: int = 8,
+        links_limit: int = 100
+    ):
         self.semantic_client = semantic_client or SemanticScholarClient()
+        self.max_concurrent = max_concurrent
+        # Citations and references fetched per paper; above one page the
+        # client pages through the API.
+        self.links_limit = links_limit
+        # (citing ID, cited ID) pairs seen while expanding, in discovery order.
+        self.edges: Dict[Tuple[str, str], None] = {}
 
     async def explore(self, seed_papers: List[Paper], max_depth: int = 2) -> List[Paper]:
         logger.info(f"CitationGraph: exploring with max_depth={max_depth}")
@@ -22,24 +40,22 @@ class CitationGraphExplorer:
         results: List[Paper] = []
 
         for depth in range(1, max_depth + 1):
+            frontier = [paper for paper in current_level if self._should_traverse(paper)]
+            expansions = await fetch_parallel(
+                frontier,
+                self._expand,
+                max_concurrent=self.max_concurrent
+            )
+
+            # Merge in frontier order so results do not depend on response timing.
             next_level: List[Paper] = []
-            for paper in current_level:
-                if not self._should_traverse(paper):
+            for paper, related_papers in zip(frontier, expansions):
+                if isinstance(related_papers, Exception):
+                    logger.warning(
+                        f"CitationGraph: expanding {paper.paper_id} failed with {related_papers}"
+                    )
                     continue
-
-                citations_task = asyncio.create_task(
-                    self.semantic_client.get_citations(paper.paper_id)
-                )
-                references_task = asyncio.create_task(
-                    self.semantic_client.get_references(paper.paper_id)
-                )
-
-                citations, references = await asyncio.gather(
-                    citations_task,
-                    references_task
-                )
-
-                for related in list(citations) + list(references):
+                for related in related_papers:
                     if related.paper_id in visited:
                         continue
                     visited.add(related.paper_id)
@@ -51,6 +67,179 @@ class CitationGraphExplorer:
 
         return results
 
+    async def _expand(self, paper: Paper) -> List[Paper]:
+        citations, references = await asyncio.gather(
+            self.semantic_client.get_citations(paper.paper_id, limit=self.links_limit),
+            self.semantic_client.get_references(paper.paper_id, limit=self.links_limit)
+        )
+        for citing in citations:
+            self.edges[(citing.paper_id, paper.paper_id)] = None
+        for cited in references:
+            self.edges[(paper.paper_id, cited.paper_id)] = None
+        return list(citations) + list(references)
+
+    async def iter_related(self, paper: Paper) -> AsyncIterator[Paper]:
+        """
+        Yield a paper's citations and references as their pages arrive.
+        
+        Both directions are paged concurrently, so callers can start working
+        on the first related papers while later pages are still downloading.
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        done = object()
+        
+        async def drain(stream: AsyncIterator[Paper], edge: Callable[[Paper], Tuple[str, str]]):
+            try:
+                async for related in stream:
+                    self.edges[edge(related)] = None
+                    await queue.put(related)
+            finally:
+                await queue.put(done)
+        
+        # Zero counts are treated as unknown, since sources that omit the
+        # field leave it at its default.
+        tasks = [
+            asyncio.ensure_future(drain(
+                self.semantic_client.iter_citations(
+                    paper.paper_id,
+                    limit=self.links_limit,
+                    total=paper.citation_count or None
+                ),
+                lambda citing: (citing.paper_id, paper.paper_id)
+            )),
+            asyncio.ensure_future(drain(
+                self.semantic_client.iter_references(
+                    paper.paper_id,
+                    limit=self.links_limit,
+                    total=paper.reference_count or None
+                ),
+                lambda cited: (paper.paper_id, cited.paper_id)
+            ))
+        ]
+        try:
+            remaining = len(tasks)
+            while remaining:
+                item = await queue.get()
+                if item is done:
+                    remaining -= 1
+                    continue
+                yield item
+            for task in tasks:
+                # Surface a failed direction once the other one has finished.
+                task.result()
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def graph(self) -> CSRGraph:
+        """Return the citation edges explored so far as a CSR adjacency."""
+        return CSRGraph.from_pairs(self.edges)
+
+    async def explore_best_first(
+        self,
+        seed_papers: List[Paper],
+        max_nodes: int = 500,
+        max_expansions: int = 100,
+        max_seconds: float = 60.0,
+        priority: Optional[Callable[[Paper], float]] = None
+    ) -> List[Paper]:
+        """
+        Explore the citation graph best-first under hard budgets.
+        
+        The highest-priority unexpanded papers are expanded first, up to
+        ``max_concurrent`` at a time. Exploration stops as soon as any budget
+        runs out, and the papers found so far are returned, including those
+        from expansions that finished before the time budget did.
+        
+        Args:
+            seed_papers: Papers to start from
+            max_nodes: Maximum number of papers to discover
+            max_expansions: Maximum number of papers whose citations and
+                references are fetched. Each expansion makes two requests when
+                both lists fit in one page, more when they are paged, and none
+                when the edge store already holds them.
+            max_seconds: Wall-time budget for the whole traversal
+            priority: Score for ordering the frontier, higher first. Defaults
+                to citation velocity; pass e.g. an embedding similarity to the
+                query to steer the traversal towards the topic.
+        
+        Returns:
+            Discovered papers, excluding seeds, ordered by priority
+        """
+        score = priority or self._citation_velocity
+        counter = itertools.count()
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + max_seconds
+        logger.info(
+            f"CitationGraph: best-first with max_nodes={max_nodes}, "
+            f"max_expansions={max_expansions}, max_seconds={max_seconds}"
+        )
+
+        visited = {paper.paper_id for paper in seed_papers}
+        frontier: List[Tuple[float, int, Paper]] = [
+            (-score(paper), next(counter), paper) for paper in seed_papers
+        ]
+        heapq.heapify(frontier)
+        found: List[Tuple[float, int, Paper]] = []
+        expanded = 0
+        exhausted = None
+
+        while frontier and exhausted is None:
+            batch_size = min(self.max_concurrent, max_expansions - expanded, len(frontier))
+            if batch_size <= 0:
+                exhausted = "expansion"
+                break
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                exhausted = "time"
+                break
+            batch = [heapq.heappop(frontier)[2] for _ in range(batch_size)]
+            expanded += batch_size
+
+            tasks = [asyncio.ensure_future(self._expand(paper)) for paper in batch]
+            _, pending = await asyncio.wait(tasks, timeout=remaining)
+            if pending:
+                # Keep what finished in time and give up on the rest.
+                exhausted = "time"
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
+
+            for paper, task in zip(batch, tasks):
+                if task in pending:
+                    continue
+                if task.exception() is not None:
+                    logger.warning(
+                        f"CitationGraph: expanding {paper.paper_id} failed with {task.exception()}"
+                    )
+                    continue
+                for related in task.result():
+                    if related.paper_id in visited:
+                        continue
+                    if len(found) >= max_nodes:
+                        exhausted = "nodes"
+                        break
+                    visited.add(related.paper_id)
+                    entry = (-score(related), next(counter), related)
+                    found.append(entry)
+                    heapq.heappush(frontier, entry)
+
+        logger.info(
+            f"CitationGraph: best-first found {len(found)} papers in {expanded} expansions"
+            + (f" ({exhausted} budget exhausted)" if exhausted else "")
+        )
+        found.sort()
+        return [paper for _, _, paper in found]
+
+    def _citation_velocity(self, paper: Paper) -> float:
+        publication_date = self._parse_date(paper)
+        if publication_date is None:
+            age_years = UNDATED_PAPER_AGE_YEARS
+        else:
+            age_days = (datetime.now(timezone.utc) - publication_date).days
+            age_years = max(age_days / 365.25, 1.0)
+        return paper.citation_count / age_years
+
     def _should_traverse(self, paper: Paper) -> bool:
         if self._is_recent(paper):
             return True
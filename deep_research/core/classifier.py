@@ -1,13 +1,24 @@
+import asyncio
+import json
 import re
 from typing import Dict, List, Optional
 
 from deep_research.api.models import Paper
 from deep_research.api.qwen import QwenClient
+from deep_research.storage.annotations import AnnotationStore
 from deep_research.utils.logging import get_logger
 
 
 logger = get_logger(__name__)
 
+# Parallel LLM requests while classifying.
+MAX_CONCURRENT_REQUESTS = 8
+# Abstracts are cut to this many characters in batched prompts.
+BATCH_ABSTRACT_CHARS = 1500
+STUDY_TYPES = "RCT, Meta-Analysis, Systematic Review, Observational, Case Study, Opinion, Other"
+# Bump when the classification prompts change so stored annotations are not reused.
+CLASSIFY_PROMPT_VERSION = "1"
+
 STRONG_CITATION_THRESHOLD = 100
 JOURNAL_IMPACT_THRESHOLD = 10000
 
@@ -34,24 +45,65 @@ OBSERVATIONAL_PHRASES = [
 
 
 class StudyClassifier:
+    """Assigns each paper a study type and quality badges.
+
+    Keyword rules settle most papers; the rest go to the LLM. Those requests
+    run concurrently, at most ``max_concurrent`` at a time, and with
+    ``batch_size`` above one each request classifies several papers and
+    answers with a JSON object keyed by their index. Any paper whose entry is
+    missing or unreadable is retried on its own. LLM answers are recorded in
+    the annotation store, if one is given, so no paper is sent twice.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int = MAX_CONCURRENT_REQUESTS,
+        batch_size: int = 1,
+        annotations: Optional[AnnotationStore] = None
+    ):
+        self.max_concurrent = max_concurrent
+        self.batch_size = batch_size
+        self.annotations = annotations
+
     async def classify_studies(
         self,
         papers: List[Paper],
         qwen_client: QwenClient
     ) -> List[Dict]:
         logger.info("Classifying studies...")
-        results = []
-        for paper in papers:
-            study_type = self._classify_by_keywords(paper)
-            if study_type is None:
-                study_type = await self._classify_with_llm(paper, qwen_client)
-            badges = self._assign_badges(paper)
-            results.append({
+        study_types = [
+            self._classify_by_keywords(paper) or self._stored_study_type(paper)
+            for paper in papers
+        ]
+        unresolved = [i for i, study_type in enumerate(study_types) if study_type is None]
+        if unresolved:
+            logger.info(f"Classifying {len(unresolved)} studies with the LLM")
+            classified = await self._classify_many_with_llm(
+                [papers[i] for i in unresolved],
+                qwen_client
+            )
+            for i, study_type in zip(unresolved, classified):
+                study_types[i] = study_type
+            if self.annotations is not None:
+                self.annotations.set_many(
+                    "study_type",
+                    [(papers[i].paper_id, study_types[i]) for i in unresolved],
+                    prompt_version=CLASSIFY_PROMPT_VERSION
+                )
+
+        return [
+            {
                 "paper": paper,
                 "study_type": study_type,
-                "badges": badges
-            })
-        return results
+                "badges": self._assign_badges(paper)
+            }
+            for paper, study_type in zip(papers, study_types)
+        ]
+
+    def _stored_study_type(self, paper: Paper) -> Optional[str]:
+        if self.annotations is None:
+            return None
+        return self.annotations.get(paper.paper_id, "study_type", CLASSIFY_PROMPT_VERSION)
 
     def _classify_by_keywords(self, paper: Paper) -> Optional[str]:
         text = self._paper_text(paper)
@@ -79,17 +131,90 @@ class StudyClassifier:
     def _contains_any(self, text: str, phrases: List[str]) -> bool:
         return any(phrase in text for phrase in phrases)
 
+    async def _classify_many_with_llm(
+        self,
+        papers: List[Paper],
+        qwen_client: QwenClient
+    ) -> List[str]:
+        semaphore = asyncio.Semaphore(self.max_concurrent)
+
+        async def bounded(func, *args):
+            async with semaphore:
+                return await func(*args)
+
+        if self.batch_size <= 1:
+            return list(await asyncio.gather(*(
+                bounded(self._classify_with_llm, paper, qwen_client) for paper in papers
+            )))
+
+        batches = [
+            papers[start:start + self.batch_size]
+            for start in range(0, len(papers), self.batch_size)
+        ]
+        results = await asyncio.gather(*(
+            bounded(self._classify_batch_with_llm, batch, qwen_client) for batch in batches
+        ))
+        study_types = [study_type for batch in results for study_type in batch]
+
+        # Retry papers the batched answer left out, one request each.
+        missing = [i for i, study_type in enumerate(study_types) if study_type is None]
+        if missing:
+            logger.debug(f"Batched classification missed {len(missing)} papers; retrying singly")
+            retried = await asyncio.gather(*(
+                bounded(self._classify_with_llm, papers[i], qwen_client) for i in missing
+            ))
+            for i, study_type in zip(missing, retried):
+                study_types[i] = study_type
+        return study_types
+
     async def _classify_with_llm(self, paper: Paper, qwen_client: QwenClient) -> str:
         abstract = paper.abstract or ""
         prompt = (
             "Classify the study type of the paper titled "
             f"'{paper.title}' with abstract '{abstract}'. Output EXACTLY one of: "
-            "RCT, Meta-Analysis, Systematic Review, Observational, Case Study, Opinion, Other."
+            f"{STUDY_TYPES}."
         )
         response = await qwen_client.complete(prompt)
         return self._normalize_llm_choice(response.content)
 
+    async def _classify_batch_with_llm(
+        self,
+        papers: List[Paper],
+        qwen_client: QwenClient
+    ) -> List[Optional[str]]:
+        entries = "\n\n".join(
+            f"[{i}] Title: {paper.title}\nAbstract: {(paper.abstract or '')[:BATCH_ABSTRACT_CHARS]}"
+            for i, paper in enumerate(papers)
+        )
+        prompt = (
+            "Classify the study type of each numbered paper below. Return ONLY a JSON "
+            "object mapping each paper's number to EXACTLY one of: "
+            f"{STUDY_TYPES}. Example: {{\"0\": \"RCT\", \"1\": \"Other\"}}\n\n"
+            f"{entries}"
+        )
+        response = await qwen_client.complete(prompt, max_tokens=32 * len(papers) + 64)
+        return self._parse_batch_choices(response.content, len(papers))
+
+    def _parse_batch_choices(self, content: str, count: int) -> List[Optional[str]]:
+        """Read a batched answer; entries that are missing or not a known type are None."""
+        match = re.search(r"\{.*\}", content, re.DOTALL)
+        try:
+            data = json.loads(match.group(0)) if match else None
+        except json.JSONDecodeError:
+            data = None
+        if not isinstance(data, dict):
+            return [None] * count
+
+        choices = []
+        for i in range(count):
+            value = data.get(str(i))
+            choices.append(self._match_llm_choice(value) if isinstance(value, str) else None)
+        return choices
+
     def _normalize_llm_choice(self, content: str) -> str:
+        return self._match_llm_choice(content) or "Other"
+
+    def _match_llm_choice(self, content: str) -> Optional[str]:
         choices = {
             "RCT": "RCT",
             "META-ANALYSIS": "Meta-Analysis",
@@ -106,7 +231,7 @@ class StudyClassifier:
         for key, value in choices.items():
             if key in content.upper():
                 return value
-        return "Other"
+        return None
 
     def _assign_badges(self, paper: Paper) -> List[str]:
         badges = []
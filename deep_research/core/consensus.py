@@ -1,8 +1,12 @@
+import asyncio
+import json
 import re
 from typing import Dict, List, Optional
 
 from deep_research.api.models import Paper
 from deep_research.api.qwen import QwenClient
+from deep_research.core.classifier import BATCH_ABSTRACT_CHARS, MAX_CONCURRENT_REQUESTS
+from deep_research.storage.annotations import AnnotationStore
 from deep_research.utils.logging import get_logger
 
 
@@ -10,9 +14,35 @@ logger = get_logger(__name__)
 
 CONSENSUS_MIN_PAPERS = 5
 CONSENSUS_FULL_CONFIDENCE = 10
+# Bump when the consensus prompts change so stored verdicts are not reused.
+CONSENSUS_PROMPT_VERSION = "2"
+STANCES = ["YES", "NO", "MIXED", "POSSIBLY"]
+# Verdict for papers that do not address the question.
+IRRELEVANT = "IRRELEVANT"
 
 
 class ConsensusAnalyzer:
+    """Measures how the papers that address a yes/no question answer it.
+
+    Each paper gets one request that returns its relevance and stance
+    together as JSON. Requests run concurrently, at most ``max_concurrent``
+    at a time, and with ``batch_size`` above one each request judges several
+    papers keyed by index. Papers whose answer cannot be read fall back to
+    a single-paper request, and then to separate relevance and stance
+    questions. Verdicts are recorded in the annotation store, if one is
+    given.
+    """
+
+    def __init__(
+        self,
+        annotations: Optional[AnnotationStore] = None,
+        max_concurrent: int = MAX_CONCURRENT_REQUESTS,
+        batch_size: int = 1
+    ):
+        self.annotations = annotations
+        self.max_concurrent = max_concurrent
+        self.batch_size = batch_size
+
     async def quantify_consensus(
         self,
         papers: List[Paper],
@@ -20,33 +50,12 @@ class ConsensusAnalyzer:
         qwen_client: QwenClient
     ) -> Dict:
         logger.info("Quantifying consensus...")
-        relevant = []
-        for paper in papers:
-            prompt = (
-                "Does the paper '[title]' with abstract '[abstract]' provide an answer "
-                "or evidence regarding the question: '[question]'? Answer YES or NO."
-            )
-            prompt = prompt.replace("[title]", paper.title)
-            prompt = prompt.replace("[abstract]", paper.abstract or "")
-            prompt = prompt.replace("[question]", question)
-            response = await qwen_client.complete(prompt)
-            answer = self._normalize_binary(response.content)
-            if answer == "YES":
-                relevant.append(paper)
-
-        counts = {"YES": 0, "NO": 0, "MIXED": 0, "POSSIBLY": 0}
-        for paper in relevant:
-            prompt = (
-                "What is this paper's answer to the question: '[question]'? "
-                "Based on the abstract, choose exactly one: YES, NO, MIXED, POSSIBLY. "
-                "Title: [title]. Abstract: [abstract]."
-            )
-            prompt = prompt.replace("[question]", question)
-            prompt = prompt.replace("[title]", paper.title)
-            prompt = prompt.replace("[abstract]", paper.abstract or "")
-            response = await qwen_client.complete(prompt)
-            stance = self._normalize_choice(response.content, list(counts.keys()))
-            counts[stance or "POSSIBLY"] += 1
+        verdicts = await self._judge_all(papers, question, qwen_client)
+
+        counts = {stance: 0 for stance in STANCES}
+        for verdict in verdicts:
+            if verdict != IRRELEVANT:
+                counts[verdict] += 1
 
         total = sum(counts.values())
         if total < CONSENSUS_MIN_PAPERS:
@@ -68,6 +77,170 @@ class ConsensusAnalyzer:
             "confidence": confidence
         }
 
+    async def _judge_all(
+        self,
+        papers: List[Paper],
+        question: str,
+        qwen_client: QwenClient
+    ) -> List[str]:
+        verdicts = [self._stored_verdict(paper, question) for paper in papers]
+        pending = [i for i, verdict in enumerate(verdicts) if verdict is None]
+        if not pending:
+            return verdicts
+
+        semaphore = asyncio.Semaphore(self.max_concurrent)
+
+        async def bounded(func, *args):
+            async with semaphore:
+                return await func(*args)
+
+        pending_papers = [papers[i] for i in pending]
+        if self.batch_size <= 1:
+            judged = list(await asyncio.gather(*(
+                bounded(self._judge, paper, question, qwen_client) for paper in pending_papers
+            )))
+        else:
+            batches = [
+                pending_papers[start:start + self.batch_size]
+                for start in range(0, len(pending_papers), self.batch_size)
+            ]
+            results = await asyncio.gather(*(
+                bounded(self._judge_batch, batch, question, qwen_client) for batch in batches
+            ))
+            judged = [verdict for batch in results for verdict in batch]
+            # Retry papers the batched answer left out, one request each.
+            missing = [i for i, verdict in enumerate(judged) if verdict is None]
+            retried = await asyncio.gather(*(
+                bounded(self._judge, pending_papers[i], question, qwen_client) for i in missing
+            ))
+            for i, verdict in zip(missing, retried):
+                judged[i] = verdict
+
+        for i, verdict in zip(pending, judged):
+            verdicts[i] = verdict
+        self._store_verdicts(pending_papers, judged, question)
+        return verdicts
+
+    def _stored_verdict(self, paper: Paper, question: str) -> Optional[str]:
+        if self.annotations is None:
+            return None
+        relevance = self.annotations.get(
+            paper.paper_id, "relevance", CONSENSUS_PROMPT_VERSION, question
+        )
+        if relevance == "NO":
+            return IRRELEVANT
+        if relevance == "YES":
+            return self.annotations.get(
+                paper.paper_id, "stance", CONSENSUS_PROMPT_VERSION, question
+            )
+        return None
+
+    def _store_verdicts(self, papers: List[Paper], verdicts: List[str], question: str):
+        if self.annotations is None:
+            return
+        self.annotations.set_many(
+            "relevance",
+            [
+                (paper.paper_id, "NO" if verdict == IRRELEVANT else "YES")
+                for paper, verdict in zip(papers, verdicts)
+            ],
+            prompt_version=CONSENSUS_PROMPT_VERSION,
+            context=question
+        )
+        self.annotations.set_many(
+            "stance",
+            [
+                (paper.paper_id, verdict)
+                for paper, verdict in zip(papers, verdicts)
+                if verdict != IRRELEVANT
+            ],
+            prompt_version=CONSENSUS_PROMPT_VERSION,
+            context=question
+        )
+
+    async def _judge(self, paper: Paper, question: str, qwen_client: QwenClient) -> str:
+        prompt = (
+            f"Question: '{question}'\n"
+            f"Title: {paper.title}\nAbstract: {paper.abstract or ''}\n\n"
+            "Does this paper provide an answer or evidence regarding the question, and "
+            "if so, what is its answer based on the abstract? Return ONLY a JSON object "
+            '{"relevant": true or false, "stance": one of "YES", "NO", "MIXED", "POSSIBLY"}.'
+        )
+        response = await qwen_client.complete(prompt, max_tokens=64)
+        verdict = self._parse_verdict(self._parse_json_object(response.content))
+        if verdict is not None:
+            return verdict
+
+        # Unreadable answer: ask the two questions separately.
+        if await self._judge_relevance(paper, question, qwen_client) != "YES":
+            return IRRELEVANT
+        return await self._judge_stance(paper, question, qwen_client)
+
+    async def _judge_batch(
+        self,
+        papers: List[Paper],
+        question: str,
+        qwen_client: QwenClient
+    ) -> List[Optional[str]]:
+        entries = "\n\n".join(
+            f"[{i}] Title: {paper.title}\nAbstract: {(paper.abstract or '')[:BATCH_ABSTRACT_CHARS]}"
+            for i, paper in enumerate(papers)
+        )
+        prompt = (
+            f"Question: '{question}'\n\n"
+            "For each numbered paper below, decide whether it provides an answer or "
+            "evidence regarding the question and, if so, its answer based on the abstract. "
+            "Return ONLY a JSON object mapping each paper's number to "
+            '{"relevant": true or false, "stance": one of "YES", "NO", "MIXED", "POSSIBLY"}.'
+            f"\n\n{entries}"
+        )
+        response = await qwen_client.complete(prompt, max_tokens=48 * len(papers) + 64)
+        data = self._parse_json_object(response.content) or {}
+        return [self._parse_verdict(data.get(str(i))) for i in range(len(papers))]
+
+    def _parse_json_object(self, content: str) -> Optional[dict]:
+        match = re.search(r"\{.*\}", content, re.DOTALL)
+        try:
+            data = json.loads(match.group(0)) if match else None
+        except json.JSONDecodeError:
+            return None
+        return data if isinstance(data, dict) else None
+
+    def _parse_verdict(self, data) -> Optional[str]:
+        """Turn one {"relevant", "stance"} entry into a verdict; None if unreadable."""
+        if not isinstance(data, dict) or not isinstance(data.get("relevant"), bool):
+            return None
+        if not data["relevant"]:
+            return IRRELEVANT
+        stance = data.get("stance")
+        if not isinstance(stance, str):
+            return None
+        return self._normalize_choice(stance, STANCES)
+
+    async def _judge_relevance(self, paper: Paper, question: str, qwen_client: QwenClient) -> str:
+        prompt = (
+            "Does the paper '[title]' with abstract '[abstract]' provide an answer "
+            "or evidence regarding the question: '[question]'? Answer YES or NO."
+        )
+        prompt = prompt.replace("[title]", paper.title)
+        prompt = prompt.replace("[abstract]", paper.abstract or "")
+        prompt = prompt.replace("[question]", question)
+        response = await qwen_client.complete(prompt)
+        return self._normalize_binary(response.content)
+
+    async def _judge_stance(self, paper: Paper, question: str, qwen_client: QwenClient) -> str:
+        prompt = (
+            "What is this paper's answer to the question: '[question]'? "
+            "Based on the abstract, choose exactly one: YES, NO, MIXED, POSSIBLY. "
+            "Title: [title]. Abstract: [abstract]."
+        )
+        prompt = prompt.replace("[question]", question)
+        prompt = prompt.replace("[title]", paper.title)
+        prompt = prompt.replace("[abstract]", paper.abstract or "")
+        response = await qwen_client.complete(prompt)
+        stance = self._normalize_choice(response.content, STANCES)
+        return stance or "POSSIBLY"
+
     def _normalize_binary(self, content: str) -> str:
         tokens = re.findall(r"[A-Z]+", content.upper())
         if "YES" in tokens:
@@ -1,53 +1,385 @@
 import difflib
+import json
 import string
-from typing import List
+from collections import Counter
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Set, Tuple
 
-from deep_research.api.models import Paper
+import numpy as np
 
+from deep_research.api.models import ExternalIds, Paper
+from deep_research.storage.crosswalk import IDENTIFIER_KINDS, IdentityCrosswalk, paper_identifiers
 
-class DeduplicationEngine:
-    def deduplicate(self, papers: List[Paper]) -> List[Paper]:
-        seen_ids = set()
-        seen_titles = []
-        result = []
+# Titles are duplicates when difflib's ratio exceeds this.
+TITLE_SIMILARITY_THRESHOLD = 0.95
+# Length of the disjoint chunks titles are indexed under.
+CHUNK_SIZE = 4
+# Number of hash buckets in the bigram profiles used to prefilter candidates.
+BIGRAM_BUCKETS = 256
+# Absorbs float rounding so the filter bounds never reject a real match.
+_EPSILON = 1e-9
+# Records with different identifiers of these kinds are never merged by title.
+CONFLICTING_KINDS = ("doi", "pmid")
 
-        for paper in papers:
-            external_ids = paper.external_ids
-            if external_ids.doi and external_ids.doi in seen_ids:
-                continue
-            if external_ids.pmid and external_ids.pmid in seen_ids:
+
+class TitleIndex:
+    """Finds earlier titles whose difflib ratio with a new title exceeds a threshold.
+
+    Two strings with ratio ``r`` share a common subsequence of at least
+    ``r * (la + lb) / 2`` characters, so one turns into the other with fewer
+    than ``d = (1 - r) * (la + lb)`` single-character insertions and
+    deletions. Each edit breaks at most one of a title's disjoint fixed-length
+    chunks, so out of any ``d + 1`` chunks at least one survives as a
+    substring of every similar title. Each title is indexed under its ``d + 1``
+    rarest chunks, lookups probe every substring of the new title with the
+    chunk lengths of compatible titles. Candidates are narrowed with a bigram
+    count bound and then verified with ``SequenceMatcher`` exactly as a full
+    scan would, so the result is identical to comparing against every title.
+    """
+
+    def __init__(self, threshold: float = TITLE_SIMILARITY_THRESHOLD, chunk_size: int = CHUNK_SIZE):
+        self.threshold = threshold
+        self.chunk_size = chunk_size
+        self._titles: List[str] = []
+        self._postings: Dict[str, List[int]] = {}
+        self._chunk_counts: Counter = Counter()
+        self._profiles: List[np.ndarray] = []
+        self._empty: List[int] = []
+        self._bounds: Dict[int, Tuple[int, int, int]] = {}
+        self._probe_sizes: Dict[int, List[int]] = {}
+
+    def contains_similar(self, title: str) -> bool:
+        """Return True if an indexed title is more similar than the threshold."""
+        return self.find_similar(title) is not None
+
+    def find_similar(
+        self,
+        title: str,
+        accept: Optional[Callable[[int], bool]] = None
+    ) -> Optional[int]:
+        """Return the position of the earliest indexed title similar enough, if any.
+
+        With ``accept``, positions it rejects are skipped.
+        """
+        low, high, _ = self._length_bounds(len(title))
+        candidates = set(self._empty) if low == 0 else set()
+        for size in self._probe_lengths(len(title)):
+            for start in range(len(title) - size + 1):
+                candidates.update(self._postings.get(title[start:start + size], ()))
+
+        candidates = sorted(
+            candidate for candidate in candidates
+            if low <= len(self._titles[candidate]) <= high
+        )
+        if not candidates:
+            return None
+
+        # Cheap upper bound first: each edit removes at most two bigrams of
+        # either title, so a match keeps most of the bigram multiset.
+        profile = self._bigram_profile(title)
+        shared = np.minimum(np.stack([self._profiles[c] for c in candidates]), profile).sum(axis=1)
+        for candidate, shared_bigrams in zip(candidates, shared):
+            if accept is not None and not accept(candidate):
                 continue
-            if external_ids.s2_id and external_ids.s2_id in seen_ids:
+            other = self._titles[candidate]
+            max_edits = int((1 - self.threshold + _EPSILON) * (len(title) + len(other)))
+            if shared_bigrams < max(len(title), len(other)) - 1 - 2 * max_edits:
                 continue
+            matcher = difflib.SequenceMatcher(None, title, other)
+            if matcher.quick_ratio() > self.threshold and matcher.ratio() > self.threshold:
+                return candidate
+        return None
 
-            normalized_title = self._normalize_title(paper.title)
-            is_duplicate_title = False
-            for existing_title in seen_titles:
-                similarity = difflib.SequenceMatcher(
-                    None,
-                    normalized_title,
-                    existing_title
-                ).ratio()
-                if similarity > 0.95:
-                    is_duplicate_title = True
-                    break
-
-            if is_duplicate_title:
-                continue
+    def add(self, title: str) -> int:
+        """Index a title and return its position."""
+        position = len(self._titles)
+        self._titles.append(title)
+        self._profiles.append(self._bigram_profile(title))
+        if not title:
+            self._empty.append(position)
+            return position
+        size = self._chunk_length(len(title))
+        chunks = [title[start:start + size] for start in range(0, len(title) - size + 1, size)]
+        self._chunk_counts.update(chunks)
+        # Any d + 1 chunks will do; the rarest ones keep posting lists short.
+        keep = self._length_bounds(len(title))[2] + 1
+        rarest = sorted(set(chunks), key=lambda chunk: (self._chunk_counts[chunk], chunk))
+        for chunk in rarest[:keep]:
+            self._postings.setdefault(chunk, []).append(position)
+        return position
 
-            result.append(paper)
-            seen_titles.append(normalized_title)
-            if external_ids.doi:
-                seen_ids.add(external_ids.doi)
-            if external_ids.pmid:
-                seen_ids.add(external_ids.pmid)
-            if external_ids.s2_id:
-                seen_ids.add(external_ids.s2_id)
+    @property
+    def titles(self) -> List[str]:
+        return list(self._titles)
 
-        return result
+    def __len__(self) -> int:
+        return len(self._titles)
 
-    def _normalize_title(self, title: str) -> str:
-        normalized = (title or "").lower().translate(
-            str.maketrans("", "", string.punctuation)
-        )
-        return " ".join(normalized.split())
+    def _bigram_profile(self, title: str) -> np.ndarray:
+        # Hashing into buckets can only merge bigrams, which raises the bound.
+        codes = np.frombuffer(title.encode("utf-32-le"), dtype=np.uint32).astype(np.uint64)
+        buckets = (codes[:-1] * 1_000_003 + codes[1:]) % BIGRAM_BUCKETS
+        return np.bincount(buckets.astype(np.intp), minlength=BIGRAM_BUCKETS).astype(np.uint16)
+
+    def _probe_lengths(self, length: int) -> List[int]:
+        sizes = self._probe_sizes.get(length)
+        if sizes is None:
+            low, high, _ = self._length_bounds(length)
+            sizes = sorted({self._chunk_length(other) for other in range(max(low, 1), high + 1)})
+            self._probe_sizes[length] = sizes
+        return sizes
+
+    def _chunk_length(self, length: int) -> int:
+        # Short titles need shorter chunks to have d + 1 of them.
+        return min(self.chunk_size, length // (self._length_bounds(length)[2] + 1))
+
+    def _length_bounds(self, length: int) -> Tuple[int, int, int]:
+        """Return the partner length range and the largest edit distance for ``length``."""
+        bounds = self._bounds.get(length)
+        if bounds is None:
+            # ratio <= 2 * min(la, lb) / (la + lb), so lengths must be close.
+            limit = self.threshold - _EPSILON
+            low = length
+            while low > 0 and 2 * (low - 1) > limit * (length + low - 1):
+                low -= 1
+            high = length
+            while 2 * length > limit * (length + high + 1):
+                high += 1
+            max_edits = int((1 - self.threshold + _EPSILON) * (length + high))
+            bounds = self._bounds[length] = (low, high, max_edits)
+        return bounds
+
+
+class DeduplicationIndex:
+    """Incremental duplicate detection for papers that arrive over time.
+
+    ``add`` tells whether a paper is new, matching it against everything added
+    before by paper ID, external identifier (widened through the crosswalk)
+    and near-duplicate title, exactly as ``DeduplicationEngine`` groups a
+    complete list. Titles never join a paper to a group holding a different
+    DOI or PMID. Only identifiers and normalized titles are kept, so the
+    index stays small and can be saved to disk and resumed in a later run.
+    """
+
+    FORMAT_VERSION = 1
+
+    def __init__(
+        self,
+        crosswalk: Optional[IdentityCrosswalk] = None,
+        threshold: float = TITLE_SIMILARITY_THRESHOLD
+    ):
+        self.crosswalk = crosswalk
+        self._parents: List[int] = []
+        self._owners: Dict[Tuple[str, str], int] = {}
+        self._titles = TitleIndex(threshold)
+        self._title_owners: List[int] = []
+        self._group_ids: Dict[int, Dict[str, Set[str]]] = {}
+        self._distinct = 0
+
+    def add(self, paper: Paper) -> bool:
+        """Index a paper and return True if it is not a duplicate of an earlier one."""
+        new_group = len(self._parents)
+        return self.assign(paper) == new_group
+
+    def assign(self, paper: Paper) -> int:
+        """Index a paper and return the group it belongs to.
+
+        A paper that links several earlier groups merges them into the
+        earliest, so ``find`` must be used to read group IDs returned earlier.
+        """
+        keys = self._identity_keys(paper)
+        matches = sorted({self.find(self._owners[key]) for key in keys if key in self._owners})
+        normalized_title = normalize_title(paper.title)
+
+        if not matches:
+            # Identifiers are authoritative; titles only decide when none match.
+            kinds = {kind for kind, _ in keys if kind in CONFLICTING_KINDS}
+            similar = self._titles.find_similar(
+                normalized_title,
+                accept=lambda position: not kinds & set(
+                    self._group_ids.get(self.find(self._title_owners[position]), ())
+                )
+            )
+            if similar is not None:
+                matches = [self.find(self._title_owners[similar])]
+
+        if matches:
+            group = matches[0]
+            for other in matches[1:]:
+                self._parents[other] = group
+                for kind, values in self._group_ids.pop(other, {}).items():
+                    self._group_ids.setdefault(group, {}).setdefault(kind, set()).update(values)
+            self._distinct -= len(matches) - 1
+        else:
+            group = len(self._parents)
+            self._parents.append(group)
+            self._titles.add(normalized_title)
+            self._title_owners.append(group)
+            self._distinct += 1
+
+        for key in keys:
+            self._owners.setdefault(key, group)
+            self._record_identifier(group, key)
+        return group
+
+    def find(self, group: int) -> int:
+        """Return the group that ``group`` has been merged into."""
+        parents = self._parents
+        while parents[group] != group:
+            parents[group] = parents[parents[group]]
+            group = parents[group]
+        return group
+
+    def __len__(self) -> int:
+        return self._distinct
+
+    def save(self, path: Path):
+        """Write the index to ``path`` as JSON, replacing any earlier file."""
+        state = {
+            "version": self.FORMAT_VERSION,
+            "threshold": self._titles.threshold,
+            "parents": [self.find(group) for group in range(len(self._parents))],
+            "owners": [[kind, value, group] for (kind, value), group in self._owners.items()],
+            "titles": self._titles.titles,
+            "title_owners": self._title_owners
+        }
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = path.with_name(path.name + ".tmp")
+        temporary.write_text(json.dumps(state))
+        temporary.replace(path)
+
+    @classmethod
+    def load(
+        cls,
+        path: Path,
+        crosswalk: Optional[IdentityCrosswalk] = None
+    ) -> "DeduplicationIndex":
+        """Read an index written by ``save``.
+
+        Raises:
+            ValueError: If the file uses an unknown format version
+        """
+        state = json.loads(path.read_text())
+        if state.get("version") != cls.FORMAT_VERSION:
+            raise ValueError(f"Unknown deduplication index version: {state.get('version')}")
+
+        index = cls(crosswalk=crosswalk, threshold=state["threshold"])
+        index._parents = state["parents"]
+        index._owners = {(kind, value): group for kind, value, group in state["owners"]}
+        # Re-adding in the original order rebuilds the same chunk postings.
+        for title in state["titles"]:
+            index._titles.add(title)
+        index._title_owners = state["title_owners"]
+        for key, group in index._owners.items():
+            index._record_identifier(index.find(group), key)
+        index._distinct = sum(1 for group, parent in enumerate(index._parents) if group == parent)
+        return index
+
+    def _record_identifier(self, group: int, key: Tuple[str, str]):
+        kind, value = key
+        if kind in CONFLICTING_KINDS:
+            self._group_ids.setdefault(group, {}).setdefault(kind, set()).add(value)
+
+    def _identity_keys(self, paper: Paper) -> List[Tuple[str, str]]:
+        keys = paper_identifiers(paper)
+        if self.crosswalk is not None:
+            keys = list(dict.fromkeys(
+                equivalent for key in keys for equivalent in sorted(self.crosswalk.equivalents(key))
+            ))
+        if paper.paper_id:
+            keys.append(("paper_id", paper.paper_id))
+        return keys
+
+
+class DeduplicationEngine:
+    """Merges records of the same paper from one or more sources.
+
+    Records are grouped by ``DeduplicationIndex``: they belong together when
+    they share a paper ID or external identifier, when the identity crosswalk
+    knows their identifiers to be equivalent, or when their titles are near
+    duplicates. Each group becomes one paper that keeps the first record's ID
+    and title and fills every other field from the richest record.
+    Identifiers of records joined by a shared identifier are written back to
+    the crosswalk so later runs recognise them at once; title matches are not.
+    """
+
+    def __init__(self, crosswalk: Optional[IdentityCrosswalk] = None):
+        self.crosswalk = crosswalk
+
+    def deduplicate(self, papers: List[Paper]) -> List[Paper]:
+        index = DeduplicationIndex(self.crosswalk)
+        assigned = [index.assign(paper) for paper in papers]
+
+        # Groups come out in order of their first record.
+        members: Dict[int, List[Paper]] = {}
+        for paper, group in zip(papers, assigned):
+            members.setdefault(index.find(group), []).append(paper)
+        groups = list(members.values())
+
+        if self.crosswalk is not None:
+            self.crosswalk.link_many(
+                identifiers for identifiers in self._linked_identifiers(index, papers)
+                if len(identifiers) > 1
+            )
+        return [self._merge(group) for group in groups]
+
+    def _linked_identifiers(
+        self,
+        index: DeduplicationIndex,
+        papers: List[Paper]
+    ) -> List[List[Tuple[str, str]]]:
+        """Group the papers' identifiers by shared paper ID or identifier, ignoring titles.
+
+        A title match is only a guess, so it is never written to the crosswalk.
+        """
+        parents = list(range(len(papers)))
+
+        def find(position: int) -> int:
+            while parents[position] != position:
+                parents[position] = parents[parents[position]]
+                position = parents[position]
+            return position
+
+        owners: Dict[Tuple[str, str], int] = {}
+        for position, paper in enumerate(papers):
+            for key in index._identity_keys(paper):
+                parents[find(owners.setdefault(key, position))] = find(position)
+
+        linked: Dict[int, List[Tuple[str, str]]] = {}
+        for position, paper in enumerate(papers):
+            linked.setdefault(find(position), []).extend(paper_identifiers(paper))
+        return list(linked.values())
+
+    def _merge(self, papers: List[Paper]) -> Paper:
+        if len(papers) == 1:
+            return papers[0]
+        first = papers[0]
+        abstracts = [paper.abstract for paper in papers if paper.has_abstract]
+        dates = [paper.publication_date for paper in papers if paper.publication_date]
+        external_ids = {
+            kind: next(filter(None, (getattr(paper.external_ids, kind) for paper in papers)), None)
+            for kind in IDENTIFIER_KINDS
+        }
+        return first.model_copy(update={
+            "abstract": max(abstracts, key=len) if abstracts else first.abstract,
+            "year": next(filter(None, (paper.year for paper in papers)), None),
+            "authors": max((paper.authors for paper in papers), key=len),
+            "venue": next(filter(None, (paper.venue for paper in papers)), first.venue),
+            "citation_count": max(paper.citation_count for paper in papers),
+            "reference_count": max(paper.reference_count for paper in papers),
+            "external_ids": ExternalIds(**external_ids),
+            "url": next(filter(None, (paper.url for paper in papers)), None),
+            "publication_types": list(dict.fromkeys(
+                publication_type for paper in papers for publication_type in paper.publication_types
+            )),
+            # The most specific date wins, e.g. "2021-03-04" over "2021".
+            "publication_date": max(dates, key=len) if dates else None
+        })
+
+
+def normalize_title(title: Optional[str]) -> str:
+    """Lower-case a title and strip punctuation and repeated whitespace."""
+    normalized = (title or "").lower().translate(
+        str.maketrans("", "", string.punctuation)
+    )
+    return " ".join(normalized.split())
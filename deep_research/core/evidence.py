@@ -1,9 +1,11 @@
+import asyncio
 import json
 from typing import Dict, List, Optional
 
 from deep_research.api.models import Paper
 from deep_research.api.qwen import QwenClient
-from deep_research.core.classifier import StudyClassifier
+from deep_research.core.classifier import MAX_CONCURRENT_REQUESTS, StudyClassifier
+from deep_research.storage.annotations import AnnotationStore
 from deep_research.utils.logging import get_logger
 
 
@@ -12,6 +14,8 @@ logger = get_logger(__name__)
 STRONG_CITATION_THRESHOLD = 100
 MODERATE_CITATION_THRESHOLD = 50
 MAX_CLAIMS = 3
+# Bump when the claim prompt or parsing changes so stored claims are not reused.
+CLAIMS_PROMPT_VERSION = "1"
 
 STRONG_TYPES = {"RCT", "Meta-Analysis", "Systematic Review"}
 MODERATE_TYPES = {"Observational", "Case-Control", "Cohort"}
@@ -19,8 +23,23 @@ WEAK_TYPES = {"Case Study", "Opinion", "Editorial"}
 
 
 class EvidenceExtractor:
-    def __init__(self, classifier: Optional[StudyClassifier] = None):
-        self.classifier = classifier or StudyClassifier()
+    """Collects the key claims of every paper strong enough to count as evidence.
+
+    Strength depends only on study type and citation count, so it is
+    planned first: papers under the citation floor are dropped without
+    being classified, the rest are classified and rated, and claims are
+    extracted, concurrently, only for papers that are not ``WEAK``.
+    """
+
+    def __init__(
+        self,
+        classifier: Optional[StudyClassifier] = None,
+        annotations: Optional[AnnotationStore] = None,
+        max_concurrent: int = MAX_CONCURRENT_REQUESTS
+    ):
+        self.classifier = classifier or StudyClassifier(annotations=annotations)
+        self.annotations = annotations
+        self.max_concurrent = max_concurrent
 
     async def extract_evidence(
         self,
@@ -31,28 +50,54 @@ class EvidenceExtractor:
         if not papers:
             return []
 
-        classifications = await self.classifier.classify_studies(papers, qwen_client)
+        # Below the floor every study type rates WEAK, so skip classifying those.
+        candidates = [
+            paper for paper in papers
+            if paper.citation_count >= MODERATE_CITATION_THRESHOLD
+        ]
+        classifications = (
+            await self.classifier.classify_studies(candidates, qwen_client) if candidates else []
+        )
         type_by_id = {
             item["paper"].paper_id: item["study_type"]
             for item in classifications
         }
 
-        evidence = []
-        for paper in papers:
-            claims = await self._extract_claims(paper, qwen_client)
+        plan = []
+        for paper in candidates:
             study_type = type_by_id.get(paper.paper_id, "Other")
             strength = self._rate_strength(study_type, paper.citation_count)
-            if strength == "WEAK":
-                continue
-            evidence.append({
+            if strength != "WEAK":
+                plan.append((paper, strength))
+        logger.info(f"Extracting claims from {len(plan)} of {len(papers)} papers")
+
+        semaphore = asyncio.Semaphore(self.max_concurrent)
+
+        async def extract(paper: Paper) -> List[str]:
+            async with semaphore:
+                return await self._extract_claims(paper, qwen_client)
+
+        claims = await asyncio.gather(*(extract(paper) for paper, _ in plan))
+        return [
+            {
                 "paper": paper,
-                "claims": claims,
+                "claims": paper_claims,
                 "strength": strength
-            })
-
-        return evidence
+            }
+            for (paper, strength), paper_claims in zip(plan, claims)
+        ]
 
     async def _extract_claims(self, paper: Paper, qwen_client: QwenClient) -> List[str]:
+        if self.annotations is None:
+            return await self._request_claims(paper, qwen_client)
+        return await self.annotations.get_or_compute(
+            paper.paper_id,
+            "claims",
+            lambda: self._request_claims(paper, qwen_client),
+            prompt_version=CLAIMS_PROMPT_VERSION
+        )
+
+    async def _request_claims(self, paper: Paper, qwen_client: QwenClient) -> List[str]:
         abstract = paper.abstract or ""
         prompt = (
             "Extract 1-3 key findings from this paper. "
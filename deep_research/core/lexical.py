@@ -0,0 +1,129 @@
+import math
+import re
+from collections import Counter
+from typing import List
+
+import numpy as np
+
+from deep_research.api.models import Paper
+from deep_research.core.relevance import RelevanceScorer
+from deep_research.utils.logging import get_logger
+
+
+logger = get_logger(__name__)
+
+_TOKEN = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> List[str]:
+    return _TOKEN.findall(text.lower())
+
+
+def bm25_scores(query: str, texts: List[str], k1: float = 1.5, b: float = 0.75) -> np.ndarray:
+    """Score each text against the query with Okapi BM25, using the texts as the corpus."""
+    documents = [Counter(tokenize(text)) for text in texts]
+    if not documents:
+        return np.zeros(0)
+    lengths = np.array([sum(document.values()) for document in documents], dtype=float)
+    norm = k1 * (1 - b + b * lengths / max(lengths.mean(), 1.0))
+
+    scores = np.zeros(len(documents))
+    for term in dict.fromkeys(tokenize(query)):
+        tf = np.array([document.get(term, 0) for document in documents], dtype=float)
+        df = np.count_nonzero(tf)
+        if not df:
+            continue
+        idf = math.log(1 + (len(documents) - df + 0.5) / (df + 0.5))
+        scores += idf * tf * (k1 + 1) / (tf + norm)
+    return scores
+
+
+class LexicalPrefilter:
+    """BM25 first stage that limits how many papers reach the encoder.
+
+    A random sample of the pool is scored semantically to estimate where the
+    relevant papers fall in the BM25 ranking. The BM25 cut-off is set at the
+    rank that keeps ``recall_target`` of the sampled relevant papers, widened
+    by ``safety_margin``, and only papers above it (plus the sample, which is
+    already scored) are embedded. Pools too small to save work are scored in
+    full.
+    """
+
+    def __init__(
+        self,
+        recall_target: float = 0.95,
+        safety_margin: float = 0.25,
+        sample_size: int = 200,
+        min_candidates: int = 100,
+        seed: int = 0
+    ):
+        self.recall_target = recall_target
+        self.safety_margin = safety_margin
+        self.sample_size = sample_size
+        self.min_candidates = min_candidates
+        self.seed = seed
+
+    async def screen(
+        self,
+        query: str,
+        papers: List[Paper],
+        scorer: RelevanceScorer,
+        threshold: float = 0.6
+    ) -> List[Paper]:
+        """Return the relevant papers, most relevant first, like ``score_papers``."""
+        if len(papers) <= self.sample_size + self.min_candidates:
+            return await scorer.score_papers(query, papers, threshold=threshold)
+
+        lexical = bm25_scores(query, [scorer.paper_text(paper) for paper in papers])
+        order = np.argsort(-lexical, kind="stable")
+        ranks = np.empty(len(papers), dtype=np.int64)
+        ranks[order] = np.arange(len(papers))
+
+        rng = np.random.default_rng(self.seed)
+        sample = rng.choice(len(papers), size=self.sample_size, replace=False)
+        sample_scores = await scorer.score(query, [papers[i] for i in sample])
+        relevant_ranks = np.sort(ranks[sample[np.array(sample_scores) >= threshold]])
+
+        depth = 0
+        if len(relevant_ranks):
+            needed = math.ceil(self.recall_target * len(relevant_ranks))
+            depth = math.ceil((relevant_ranks[needed - 1] + 1) * (1 + self.safety_margin))
+        depth = min(len(papers), max(depth, self.min_candidates))
+
+        sampled = set(sample.tolist())
+        candidates = [i for i in order[:depth] if i not in sampled]
+        candidate_scores = await scorer.score(query, [papers[i] for i in candidates])
+
+        scored = list(zip(sample, sample_scores)) + list(zip(candidates, candidate_scores))
+        relevant = sorted(
+            ((papers[i], score) for i, score in scored if score >= threshold),
+            key=lambda item: item[1],
+            reverse=True
+        )
+        # Sampled papers are kept whatever their rank, so this slightly
+        # understates recall over the whole pool.
+        estimated_recall = float(np.mean(relevant_ranks < depth)) if len(relevant_ranks) else 1.0
+        logger.info(
+            f"Prefilter: embedded {len(scored)}/{len(papers)} papers, "
+            f"estimated recall {estimated_recall:.1%}"
+        )
+        return [paper for paper, _ in relevant]
+
+    async def measure_recall(
+        self,
+        query: str,
+        papers: List[Paper],
+        scorer: RelevanceScorer,
+        threshold: float = 0.6
+    ) -> float:
+        """Score the pool in full and return the share of its relevant papers ``screen`` keeps.
+
+        This embeds every paper, so it is meant for tuning, not screening.
+        """
+        full = await scorer.score_papers(query, papers, threshold=threshold)
+        if not full:
+            return 1.0
+        kept = {paper.paper_id for paper in await self.screen(query, papers, scorer, threshold)}
+        recall = sum(paper.paper_id in kept for paper in full) / len(full)
+        logger.info(f"Prefilter: recall {recall:.1%} against full scoring ({1 - recall:.1%} lost)")
+        return recall
@@ -1,13 +1,61 @@
-from typing import List
+import asyncio
+import threading
+from typing import Dict, List, Optional
 
+import numpy as np
 from sentence_transformers import SentenceTransformer, util
 
 from deep_research.api.models import Paper
+from deep_research.storage.embedding_store import (
+    DEFAULT_MODEL,
+    EMBEDDING_DTYPE,
+    EmbeddingStore,
+    text_hash
+)
+
+# Papers encoded per worker-thread call; the event loop runs between batches.
+ENCODE_BATCH_SIZE = 64
+
+_models: Dict[str, SentenceTransformer] = {}
+_models_lock = threading.Lock()
+
+
+def get_model(name: str = DEFAULT_MODEL) -> SentenceTransformer:
+    """Return the process-wide model called ``name``, loading it on first use."""
+    with _models_lock:
+        model = _models.get(name)
+        if model is None:
+            model = _models[name] = SentenceTransformer(name)
+        return model
 
 
 class RelevanceScorer:
-    def __init__(self):
-        self.model = SentenceTransformer("all-MiniLM-L6-v2")
+    """Scores papers by embedding similarity with the query.
+
+    The model is loaded on the first call to ``score_papers`` and shared by
+    every scorer in the process. Loading and encoding run in a worker thread,
+    one batch at a time, so other coroutines keep running while papers are
+    encoded. With an embedding store, only papers whose text has not been
+    embedded before are encoded.
+    """
+
+    def __init__(
+        self,
+        model_name: str = DEFAULT_MODEL,
+        batch_size: int = ENCODE_BATCH_SIZE,
+        model: Optional[SentenceTransformer] = None,
+        embedding_store: Optional[EmbeddingStore] = None
+    ):
+        self.model_name = model_name
+        self.batch_size = batch_size
+        self.embedding_store = embedding_store
+        self._model = model
+
+    @property
+    def model(self) -> SentenceTransformer:
+        if self._model is None:
+            self._model = get_model(self.model_name)
+        return self._model
 
     async def score_papers(
         self,
@@ -15,23 +63,71 @@ class RelevanceScorer:
         papers: List[Paper],
         threshold: float = 0.6
     ) -> List[Paper]:
+        scores = await self.score(query, papers)
+        filtered = [(paper, score) for paper, score in zip(papers, scores) if score >= threshold]
+        filtered.sort(key=lambda item: item[1], reverse=True)
+        return [paper for paper, _ in filtered]
+
+    async def score(self, query: str, papers: List[Paper]) -> List[float]:
+        """Return the cosine similarity of each paper with the query."""
         if not papers:
             return []
 
-        query_embedding = self.model.encode(query, convert_to_tensor=True)
-        paper_texts = [self._paper_text(paper) for paper in papers]
-        paper_embeddings = self.model.encode(paper_texts, convert_to_tensor=True)
+        model = self._model or await asyncio.to_thread(lambda: self.model)
+        paper_texts = [self.paper_text(paper) for paper in papers]
+        if self.embedding_store is not None:
+            return await self._score_stored(model, query, papers, paper_texts)
 
-        cosine_scores = util.cos_sim(query_embedding, paper_embeddings)[0]
-        scored = []
-        for paper, score in zip(papers, cosine_scores):
-            scored.append((paper, float(score)))
+        query_embedding = await asyncio.to_thread(model.encode, query, convert_to_tensor=True)
+        scores: List[float] = []
+        for start in range(0, len(paper_texts), self.batch_size):
+            batch = paper_texts[start:start + self.batch_size]
+            scores.extend(
+                await asyncio.to_thread(self._score_batch, model, query_embedding, batch)
+            )
+        return scores
 
-        filtered = [item for item in scored if item[1] >= threshold]
-        filtered.sort(key=lambda item: item[1], reverse=True)
-        return [paper for paper, _ in filtered]
+    def _score_batch(
+        self,
+        model: SentenceTransformer,
+        query_embedding,
+        texts: List[str]
+    ) -> List[float]:
+        paper_embeddings = model.encode(texts, convert_to_tensor=True)
+        return [float(score) for score in util.cos_sim(query_embedding, paper_embeddings)[0]]
+
+    async def _score_stored(
+        self,
+        model: SentenceTransformer,
+        query: str,
+        papers: List[Paper],
+        paper_texts: List[str]
+    ) -> List[float]:
+        store = self.embedding_store
+        keys = [(paper.paper_id, text_hash(text)) for paper, text in zip(papers, paper_texts)]
+        vectors = await asyncio.to_thread(store.get_many, self.model_name, keys)
+
+        texts_by_key = dict(zip(keys, paper_texts))
+        missing = [key for key in texts_by_key if key not in vectors]
+        for start in range(0, len(missing), self.batch_size):
+            batch = missing[start:start + self.batch_size]
+            embeddings = await asyncio.to_thread(model.encode, [texts_by_key[key] for key in batch])
+            # Score fresh vectors at stored precision so reruns give identical scores.
+            embeddings = np.asarray(embeddings, dtype=EMBEDDING_DTYPE)
+            await asyncio.to_thread(store.add_many, self.model_name, batch, embeddings)
+            vectors.update(zip(batch, embeddings))
+
+        query_embedding = await asyncio.to_thread(model.encode, query)
+        return await asyncio.to_thread(
+            self._cosine_scores, query_embedding, [vectors[key] for key in keys]
+        )
+
+    def _cosine_scores(self, query_embedding, vectors: List[np.ndarray]) -> List[float]:
+        matrix = np.stack(vectors).astype(np.float32)
+        query_vector = np.asarray(query_embedding, dtype=np.float32)
+        return [float(score) for score in util.cos_sim(query_vector, matrix)[0]]
 
-    def _paper_text(self, paper: Paper) -> str:
+    def paper_text(self, paper: Paper) -> str:
         if paper.has_abstract:
             return f"{paper.title} {paper.abstract}".strip()
         return paper.title
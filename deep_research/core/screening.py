@@ -3,6 +3,7 @@ from typing import List, Optional
 from deep_research.api.models import Paper
 from deep_research.config import SearchConfig
 from deep_research.core.deduplication import DeduplicationEngine
+from deep_research.core.lexical import LexicalPrefilter
 from deep_research.core.quality import QualityChecker
 from deep_research.core.relevance import RelevanceScorer
 from deep_research.utils.logging import get_logger
@@ -16,11 +17,14 @@ class ScreeningPipeline:
         self,
         dedup_engine: Optional[DeduplicationEngine] = None,
         quality_checker: Optional[QualityChecker] = None,
-        relevance_scorer: Optional[RelevanceScorer] = None
+        relevance_scorer: Optional[RelevanceScorer] = None,
+        prefilter: Optional[LexicalPrefilter] = None
     ):
         self.dedup_engine = dedup_engine or DeduplicationEngine()
         self.quality_checker = quality_checker or QualityChecker()
         self.relevance_scorer = relevance_scorer or RelevanceScorer()
+        # Optional BM25 stage; without it every quality-filtered paper is embedded.
+        self.prefilter = prefilter
 
     async def run_screening(
         self,
@@ -36,11 +40,19 @@ class ScreeningPipeline:
         quality_filtered = self.quality_checker.filter_by_quality(deduped, config)
         after_quality = len(quality_filtered)
 
-        relevant = await self.relevance_scorer.score_papers(
-            query,
-            quality_filtered,
-            threshold=config.relevance_threshold
-        )
+        if self.prefilter is not None:
+            relevant = await self.prefilter.screen(
+                query,
+                quality_filtered,
+                self.relevance_scorer,
+                threshold=config.relevance_threshold
+            )
+        else:
+            relevant = await self.relevance_scorer.score_papers(
+                query,
+                quality_filtered,
+                threshold=config.relevance_threshold
+            )
         final = len(relevant)
 
         logger.info(
@@ -1,7 +1,8 @@
-from typing import List, Optional
+from typing import List, Optional, Set
 
 from deep_research.api.models import Paper, SearchResult
 from deep_research.core.citation_graph import CitationGraphExplorer
+from deep_research.core.deduplication import DeduplicationIndex
 from deep_research.core.query_builder import QueryBuilder
 from deep_research.core.strategy import StrategyGenerator
 from deep_research.core.survey import SurveyEngine
@@ -37,20 +38,25 @@ class SearchOrchestrator:
         logger.info("SearchOrchestrator: executing multi-angle queries")
         query_results = await self.query_builder.execute_queries(strategies)
 
-        seed_papers = self._dedupe_papers(survey_result.papers + query_results)
+        # Only repeated paper IDs are dropped here. Records of the same paper
+        # from different sources are all kept so that screening can merge
+        # their fields, but only the first of them seeds the citation search.
+        seen_ids: Set[str] = set()
+        records = self._new_papers(seen_ids, survey_result.papers + query_results)
+        groups = DeduplicationIndex()
+        seed_papers = [paper for paper in records if groups.add(paper)]
         logger.info("SearchOrchestrator: exploring citation graph")
         citation_results = await self.citation_graph.explore(seed_papers, max_depth=2)
 
-        combined = self._dedupe_papers(seed_papers + citation_results)
+        combined = records + self._new_papers(seen_ids, citation_results)
         logger.info(f"SearchOrchestrator: returning {len(combined)} papers")
         return SearchResult(papers=combined, total=len(combined), offset=0)
 
-    def _dedupe_papers(self, papers: List[Paper]) -> List[Paper]:
-        seen = set()
-        deduped = []
+    def _new_papers(self, seen_ids: Set[str], papers: List[Paper]) -> List[Paper]:
+        new_papers = []
         for paper in papers:
-            if paper.paper_id in seen:
+            if paper.paper_id in seen_ids:
                 continue
-            seen.add(paper.paper_id)
-            deduped.append(paper)
-        return deduped
+            seen_ids.add(paper.paper_id)
+            new_papers.append(paper)
+        return new_papers
@@ -1,9 +1,12 @@
 import asyncio
 from typing import List, Optional
 
+from deep_research.api.local_corpus import LocalCorpusClient
 from deep_research.api.models import Paper, SearchResult
 from deep_research.api.semantic_scholar import SemanticScholarClient
 from deep_research.api.pubmed import PubMedClient
+from deep_research.core.graph_ranking import rank_papers
+from deep_research.storage.edge_store import CSRGraph
 from deep_research.utils.logging import get_logger
 
 
@@ -14,10 +17,12 @@ class SurveyEngine:
     def __init__(
         self,
         semantic_client: Optional[SemanticScholarClient] = None,
-        pubmed_client: Optional[PubMedClient] = None
+        pubmed_client: Optional[PubMedClient] = None,
+        local_client: Optional[LocalCorpusClient] = None
     ):
         self.semantic_client = semantic_client or SemanticScholarClient()
         self.pubmed_client = pubmed_client or PubMedClient()
+        self.local_client = local_client
 
     async def _search_semantic(self, query: str) -> SearchResult:
         logger.info("Survey: searching Semantic Scholar")
@@ -28,17 +33,41 @@ class SurveyEngine:
         pmids = await self.pubmed_client.search(query, max_results=100)
         return await self.pubmed_client.fetch_details(pmids)
 
-    async def run_survey(self, query: str) -> SearchResult:
+    async def _search_local(self, query: str) -> List[Paper]:
+        if self.local_client is None:
+            return []
+        logger.info("Survey: searching local corpus")
+        result = await self.local_client.search_papers(query, limit=100)
+        return result.papers
+
+    def _dedupe_papers(self, papers: List[Paper]) -> List[Paper]:
+        seen = set()
+        deduped = []
+        for paper in papers:
+            if paper.paper_id in seen:
+                continue
+            seen.add(paper.paper_id)
+            deduped.append(paper)
+        return deduped
+
+    async def run_survey(self, query: str, graph: Optional[CSRGraph] = None) -> SearchResult:
         semantic_task = asyncio.create_task(self._search_semantic(query))
         pubmed_task = asyncio.create_task(self._search_pubmed(query))
+        local_task = asyncio.create_task(self._search_local(query))
 
-        semantic_result, pubmed_papers = await asyncio.gather(
+        semantic_result, pubmed_papers, local_papers = await asyncio.gather(
             semantic_task,
-            pubmed_task
+            pubmed_task,
+            local_task
         )
 
-        combined = list(semantic_result.papers) + list(pubmed_papers)
-        combined.sort(key=lambda paper: paper.citation_count, reverse=True)
+        combined = list(semantic_result.papers) + list(pubmed_papers) + list(local_papers)
+        # Local hits are cached Semantic Scholar papers, so they may repeat live results.
+        combined = self._dedupe_papers(combined)
+        if graph is not None:
+            combined = rank_papers(combined, graph)
+        else:
+            combined.sort(key=lambda paper: paper.citation_count, reverse=True)
         top_papers = combined[:50]
 
         logger.info(f"Survey: returning {len(top_papers)} papers")
@@ -7,6 +7,7 @@ from deep_research.core.consensus import ConsensusAnalyzer
 from deep_research.core.evidence import EvidenceExtractor
 from deep_research.core.gap_analysis import GapAnalyzer
 from deep_research.core.report import ReportGenerator
+from deep_research.storage.annotations import AnnotationStore
 from deep_research.utils.logging import get_logger
 
 
@@ -20,11 +21,22 @@ class SynthesisOrchestrator:
         classifier: Optional[StudyClassifier] = None,
         consensus_analyzer: Optional[ConsensusAnalyzer] = None,
         gap_analyzer: Optional[GapAnalyzer] = None,
-        report_generator: Optional[ReportGenerator] = None
+        report_generator: Optional[ReportGenerator] = None,
+        annotations: Optional[AnnotationStore] = None
     ):
-        self.evidence_extractor = evidence_extractor or EvidenceExtractor()
-        self.classifier = classifier or StudyClassifier()
-        self.consensus_analyzer = consensus_analyzer or ConsensusAnalyzer()
+        # Components share one annotation store, so a paper classified while
+        # extracting evidence is not sent to the LLM again.
+        self.annotations = annotations or AnnotationStore()
+        if classifier is not None and classifier.annotations is None:
+            classifier.annotations = self.annotations
+        self.classifier = classifier or StudyClassifier(annotations=self.annotations)
+        self.evidence_extractor = evidence_extractor or EvidenceExtractor(
+            classifier=self.classifier,
+            annotations=self.annotations
+        )
+        self.consensus_analyzer = consensus_analyzer or ConsensusAnalyzer(
+            annotations=self.annotations
+        )
         self.gap_analyzer = gap_analyzer or GapAnalyzer()
         self.report_generator = report_generator or ReportGenerator()
 
@@ -1,3 +1,18 @@
+from deep_research.storage.annotations import AnnotationStore
 from deep_research.storage.cache import CacheManager
+from deep_research.storage.async_cache import AsyncCacheManager
+from deep_research.storage.crosswalk import IdentityCrosswalk
+from deep_research.storage.edge_store import CSRGraph, EdgeStore
+from deep_research.storage.embedding_store import EmbeddingStore
+from deep_research.storage.memory_cache import LRUCache
 
-__all__ = ["CacheManager"]
+__all__ = [
+    "AnnotationStore",
+    "CacheManager",
+    "AsyncCacheManager",
+    "CSRGraph",
+    "EdgeStore",
+    "EmbeddingStore",
+    "IdentityCrosswalk",
+    "LRUCache"
+]
@@ -0,0 +1,159 @@
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Rows scored per matrix product while training and assigning, to bound memory.
+ASSIGN_CHUNK_SIZE = 8192
+# k-means is trained on at most this many points per list.
+TRAINING_POINTS_PER_LIST = 64
+
+
+class IVFIndex:
+    """Inverted-file index for approximate cosine nearest-neighbour search.
+
+    Vectors are normalized and clustered with spherical k-means into
+    ``num_lists`` lists, stored contiguously by list like a CSR matrix. A
+    query is compared with every centroid and only the ``nprobe`` closest
+    lists are scanned exactly, so a search touches roughly
+    ``nprobe / num_lists`` of the corpus. Raising ``nprobe`` trades speed for
+    recall; ``nprobe == num_lists`` is an exact scan.
+    """
+
+    def __init__(
+        self,
+        ids: List[str],
+        centroids: np.ndarray,
+        offsets: np.ndarray,
+        vectors: np.ndarray,
+        nprobe: int = 8
+    ):
+        self.ids = ids
+        self.centroids = centroids
+        self.offsets = offsets
+        self.vectors = vectors
+        self.nprobe = nprobe
+
+    @property
+    def num_lists(self) -> int:
+        return len(self.centroids)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @classmethod
+    def build(
+        cls,
+        ids: Sequence[str],
+        vectors: np.ndarray,
+        num_lists: Optional[int] = None,
+        nprobe: int = 8,
+        iterations: int = 10,
+        seed: int = 0
+    ) -> "IVFIndex":
+        """Cluster ``vectors`` (one row per ID) into an index.
+
+        Args:
+            ids: Identifier of each row
+            vectors: Embedding matrix, any float dtype
+            num_lists: Number of inverted lists; defaults to sqrt(len(ids))
+            nprobe: Lists scanned per query
+            iterations: k-means iterations
+            seed: Seed for choosing the training sample and initial centroids
+        """
+        if len(ids) != len(vectors):
+            raise ValueError(f"Got {len(ids)} IDs for {len(vectors)} vectors")
+        normalized = _normalize(vectors)
+        if not len(ids):
+            empty = np.zeros((0, normalized.shape[1]), dtype=np.float32)
+            return cls([], empty, np.zeros(1, dtype=np.int64), normalized, nprobe=nprobe)
+
+        rng = np.random.default_rng(seed)
+        if num_lists is None:
+            num_lists = int(np.sqrt(len(ids)))
+        num_lists = max(1, min(num_lists, len(ids)))
+
+        sample_size = min(len(ids), num_lists * TRAINING_POINTS_PER_LIST)
+        sample = normalized[np.sort(rng.choice(len(ids), size=sample_size, replace=False))]
+        sample = sample.astype(np.float32)
+        centroids = sample[rng.choice(sample_size, size=num_lists, replace=False)]
+        for _ in range(iterations):
+            assignment = _nearest(sample, centroids)
+            counts = np.bincount(assignment, minlength=num_lists)
+            order = np.argsort(assignment, kind="stable")
+            starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+            sums = np.zeros_like(centroids)
+            filled = counts > 0
+            sums[filled] = np.add.reduceat(sample[order], starts[filled], axis=0)
+            # Empty lists restart from a random training point.
+            sums[~filled] = sample[rng.choice(sample_size, size=int((~filled).sum()))]
+            centroids = _normalize(sums).astype(np.float32)
+
+        assignment = _nearest(normalized, centroids)
+        order = np.argsort(assignment, kind="stable")
+        offsets = np.zeros(num_lists + 1, dtype=np.int64)
+        np.cumsum(np.bincount(assignment, minlength=num_lists), out=offsets[1:])
+        return cls([ids[i] for i in order], centroids, offsets, normalized[order], nprobe=nprobe)
+
+    def search(self, query: np.ndarray, k: int = 10) -> List[Tuple[str, float]]:
+        """Return up to ``k`` (ID, cosine similarity) pairs, most similar first."""
+        if not self.ids or k <= 0:
+            return []
+        query = np.asarray(query, dtype=np.float32).ravel()
+        query = query / max(float(np.linalg.norm(query)), 1e-12)
+        nprobe = min(self.nprobe, self.num_lists)
+        lists = np.argpartition(-(self.centroids @ query), nprobe - 1)[:nprobe]
+
+        rows = np.concatenate([
+            np.arange(self.offsets[i], self.offsets[i + 1]) for i in lists
+        ])
+        if not len(rows):
+            return []
+        scores = self.vectors[rows].astype(np.float32) @ query
+        k = min(k, len(rows))
+        best = np.argpartition(-scores, k - 1)[:k]
+        best = best[np.argsort(-scores[best], kind="stable")]
+        return [(self.ids[rows[i]], float(scores[i])) for i in best]
+
+    def save(self, path: Path):
+        """Write the index to ``path`` in NumPy's ``.npz`` format."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "wb") as handle:
+            np.savez(
+                handle,
+                ids=np.array(self.ids, dtype=str),
+                centroids=self.centroids,
+                offsets=self.offsets,
+                vectors=self.vectors
+            )
+
+    @classmethod
+    def load(cls, path: Path, nprobe: int = 8) -> "IVFIndex":
+        """Read an index written by ``save``."""
+        with np.load(path) as data:
+            return cls(
+                data["ids"].tolist(),
+                data["centroids"],
+                data["offsets"],
+                data["vectors"],
+                nprobe=nprobe
+            )
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    """Return unit-length rows as float16, normalizing a chunk at a time."""
+    vectors = np.asarray(vectors)
+    normalized = np.empty(vectors.shape, dtype=np.float16)
+    for start in range(0, len(vectors), ASSIGN_CHUNK_SIZE):
+        chunk = vectors[start:start + ASSIGN_CHUNK_SIZE].astype(np.float32)
+        norms = np.linalg.norm(chunk, axis=1, keepdims=True)
+        normalized[start:start + ASSIGN_CHUNK_SIZE] = chunk / np.maximum(norms, 1e-12)
+    return normalized
+
+
+def _nearest(vectors: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+    assignment = np.empty(len(vectors), dtype=np.intp)
+    for start in range(0, len(vectors), ASSIGN_CHUNK_SIZE):
+        chunk = vectors[start:start + ASSIGN_CHUNK_SIZE].astype(np.float32)
+        assignment[start:start + ASSIGN_CHUNK_SIZE] = np.argmax(chunk @ centroids.T, axis=1)
+    return assignment
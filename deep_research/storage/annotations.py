@@ -0,0 +1,138 @@
+import json
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Tuple
+
+from deep_research.utils.singleflight import SingleFlight
+
+AnnotationKey = Tuple[str, str, str, str]
+
+
+class AnnotationStore:
+    """Per-paper LLM annotations shared by the synthesis components.
+
+    Annotations (study type, claims, relevance verdict, stance) are keyed by
+    paper ID, task, prompt version and an optional context such as the
+    question a verdict answers. They live in memory for the lifetime of the
+    store; with a ``db_path`` they are also written through to SQLite and
+    read back in later reviews. Concurrent requests for the same annotation
+    share one computation.
+    """
+
+    def __init__(self, db_path: Optional[Path] = None):
+        self.db_path = db_path
+        self._memory: Dict[AnnotationKey, Any] = {}
+        self._inflight = SingleFlight()
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        if db_path is not None:
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(db_path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._init_db()
+
+    def _init_db(self):
+        """Initialize database schema."""
+        with self._lock, self._conn:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS annotations (
+                    paper_id TEXT NOT NULL,
+                    task TEXT NOT NULL,
+                    prompt_version TEXT NOT NULL,
+                    context TEXT NOT NULL,
+                    value_json TEXT NOT NULL,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    PRIMARY KEY (paper_id, task, prompt_version, context)
+                )
+            """)
+
+    def get(
+        self,
+        paper_id: str,
+        task: str,
+        prompt_version: str = "",
+        context: str = ""
+    ) -> Optional[Any]:
+        """Return a stored annotation, or None if it has not been computed."""
+        key = (paper_id, task, prompt_version, context)
+        with self._lock:
+            if key in self._memory:
+                return self._memory[key]
+            if self._conn is None:
+                return None
+            row = self._conn.execute(
+                "SELECT value_json FROM annotations "
+                "WHERE paper_id = ? AND task = ? AND prompt_version = ? AND context = ?",
+                key
+            ).fetchone()
+            if row is None:
+                return None
+            value = self._memory[key] = json.loads(row[0])
+            return value
+
+    def set(
+        self,
+        paper_id: str,
+        task: str,
+        value: Any,
+        prompt_version: str = "",
+        context: str = ""
+    ):
+        """Store a JSON-serializable annotation."""
+        self.set_many(task, [(paper_id, value)], prompt_version=prompt_version, context=context)
+
+    def set_many(
+        self,
+        task: str,
+        values: Iterable[Tuple[str, Any]],
+        prompt_version: str = "",
+        context: str = ""
+    ):
+        """Store (paper ID, annotation) pairs for one task in a single transaction."""
+        rows = [
+            (paper_id, task, prompt_version, context, value)
+            for paper_id, value in values
+        ]
+        with self._lock:
+            for paper_id, task, version, ctx, value in rows:
+                self._memory[(paper_id, task, version, ctx)] = value
+            if self._conn is None:
+                return
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO annotations "
+                    "(paper_id, task, prompt_version, context, value_json) VALUES (?, ?, ?, ?, ?)",
+                    [row[:4] + (json.dumps(row[4]),) for row in rows]
+                )
+
+    async def get_or_compute(
+        self,
+        paper_id: str,
+        task: str,
+        compute: Callable[[], Awaitable[Any]],
+        prompt_version: str = "",
+        context: str = ""
+    ) -> Any:
+        """Return the stored annotation, computing and storing it on first use."""
+        value = self.get(paper_id, task, prompt_version, context)
+        if value is not None:
+            return value
+
+        async def compute_and_store():
+            result = await compute()
+            self.set(paper_id, task, result, prompt_version=prompt_version, context=context)
+            return result
+
+        key = (paper_id, task, prompt_version, context)
+        return await self._inflight.do(key, compute_and_store)
+
+    def __len__(self) -> int:
+        return len(self._memory)
+
+    def close(self):
+        """Close the underlying database connection, if any."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
@@ -0,0 +1,153 @@
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from deep_research.api.models import Paper, QwenResponse
+from deep_research.storage.cache import CacheManager
+from deep_research.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class AsyncCacheManager:
+    """Non-blocking facade over CacheManager for use inside coroutines.
+
+    All SQLite work runs on one dedicated thread, so the event loop keeps
+    driving HTTP requests while the cache reads or writes. Writes go into a
+    write-behind buffer keyed by paper ID, so repeated writes of the same paper
+    collapse into one row, and are flushed in a single transaction once
+    ``batch_size`` papers are pending or ``flush_interval`` seconds have passed.
+    """
+
+    def __init__(self, cache: CacheManager, batch_size: int = 200, flush_interval: float = 0.5):
+        self.cache = cache
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="deep-research-cache")
+        self._pending: Dict[str, Tuple[Paper, str]] = {}
+        self._timer: Optional[asyncio.Task] = None
+        self._flushes: Set[asyncio.Task] = set()
+
+    def _submit(self, func, *args, **kwargs) -> asyncio.Future:
+        # The executor has a single worker, so jobs run in submission order and a
+        # read submitted after a flush always observes that flush's rows.
+        loop = asyncio.get_running_loop()
+        return loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+
+    async def get(self, paper_id: str, ttl_days: Optional[int] = None) -> Optional[Paper]:
+        return (await self.get_many([paper_id], ttl_days=ttl_days)).get(paper_id)
+
+    async def get_many(
+        self,
+        paper_ids: Iterable[str],
+        ttl_days: Optional[int] = None
+    ) -> Dict[str, Paper]:
+        ids = list(paper_ids)
+        hits = {paper_id: self._pending[paper_id][0] for paper_id in ids if paper_id in self._pending}
+        misses = [paper_id for paper_id in ids if paper_id not in hits]
+        if misses:
+            hits.update(await self._submit(self.cache.get_many, misses, ttl_days=ttl_days))
+        return hits
+
+    async def is_expired(self, paper_id: str, ttl_days: int) -> bool:
+        if paper_id in self._pending:
+            return False
+        return await self._submit(self.cache.is_expired, paper_id, ttl_days)
+
+    async def set(self, paper_id: str, paper: Paper, source: str):
+        self._pending[paper_id] = (paper, source)
+        self._schedule_flush()
+
+    async def set_many(self, papers: Iterable[Paper], source: str):
+        for paper in papers:
+            self._pending[paper.paper_id] = (paper, source)
+        self._schedule_flush()
+
+    async def get_search(
+        self,
+        cache_key: str,
+        ttl_days: Optional[int] = None
+    ) -> Optional[Tuple[List[str], int]]:
+        return await self._submit(self.cache.get_search, cache_key, ttl_days=ttl_days)
+
+    async def set_search(
+        self,
+        cache_key: str,
+        source: str,
+        query: str,
+        result_ids: List[str],
+        total: int
+    ):
+        # Pending papers go first, so a stored search never lists papers the
+        # cache does not have.
+        await self.flush()
+        if any(paper_id in self._pending for paper_id in result_ids):
+            logger.debug(f"Not caching search '{query}' until its papers are written")
+            return
+        await self._submit(self.cache.set_search, cache_key, source, query, result_ids, total)
+
+    async def get_llm_response(self, cache_key: str) -> Optional[QwenResponse]:
+        return await self._submit(self.cache.get_llm_response, cache_key)
+
+    async def set_llm_response(self, cache_key: str, response: QwenResponse):
+        await self._submit(self.cache.set_llm_response, cache_key, response)
+
+    def _schedule_flush(self):
+        if len(self._pending) >= self.batch_size:
+            task = asyncio.create_task(self.flush())
+            self._flushes.add(task)
+            task.add_done_callback(self._flushes.discard)
+        elif self._pending and self._timer is None:
+            self._timer = asyncio.create_task(self._flush_later())
+
+    async def _flush_later(self):
+        await asyncio.sleep(self.flush_interval)
+        self._timer = None
+        await self.flush()
+
+    async def flush(self):
+        """Write every pending paper to SQLite in one transaction per source."""
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, {}
+
+        by_source: Dict[str, list] = {}
+        for paper, source in pending.values():
+            by_source.setdefault(source, []).append(paper)
+
+        jobs = [
+            self._submit(self.cache.set_many, papers, source)
+            for source, papers in by_source.items()
+        ]
+        results = await asyncio.gather(*jobs, return_exceptions=True)
+        errors = {
+            source: result
+            for source, result in zip(by_source, results)
+            if isinstance(result, Exception)
+        }
+        if errors:
+            failed = {
+                paper_id: entry for paper_id, entry in pending.items() if entry[1] in errors
+            }
+            logger.warning(
+                f"Cache flush failed for {len(failed)} papers, keeping them for the next "
+                f"flush: {next(iter(errors.values()))}"
+            )
+            # Writes made since the flush started are newer and win.
+            for paper_id, entry in failed.items():
+                self._pending.setdefault(paper_id, entry)
+            return
+        logger.debug(f"Flushed {len(pending)} papers to cache")
+
+    async def close(self):
+        """Flush pending writes and stop the cache thread."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._flushes:
+            await asyncio.gather(*self._flushes, return_exceptions=True)
+        await self.flush()
+        if self._pending:
+            logger.warning(f"Closing cache with {len(self._pending)} unwritten papers")
+        self._executor.shutdown(wait=True)
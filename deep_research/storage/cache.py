@@ -1,84 +1,458 @@
 import sqlite3
+import hashlib
 import json
+import threading
+import unicodedata
 from pathlib import Path
-from datetime import datetime, timedelta
-from typing import Optional
-from deep_research.api.models import Paper
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional, Tuple
+from deep_research.api.models import Paper, QwenResponse
+from deep_research.config import CacheConfig
+from deep_research.storage.codec import (
+    decode_paper,
+    decode_paper_with_size,
+    encode_paper,
+    encode_paper_with_size
+)
+from deep_research.storage.memory_cache import LRUCache
+
+# Stay well below SQLITE_MAX_VARIABLE_NUMBER on older SQLite builds.
+MAX_QUERY_PARAMS = 500
+# After an eviction the database is trimmed to this fraction of its limit, so
+# that a full cache does not evict on every write.
+EVICTION_LOW_WATER = 0.9
+# Buffered read times are written once this many papers are waiting.
+MAX_PENDING_TOUCHES = 10000
+SQLITE_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+def make_search_key(source: str, query: str, **params) -> str:
+    """Build a stable cache key for a search request.
+
+    The query is Unicode-normalized with whitespace collapsed (case is kept,
+    since PubMed treats upper-case AND/OR/NOT as operators), comma-separated
+    field lists are sorted, and parameters are ordered by name.
+    """
+    normalized_query = " ".join(unicodedata.normalize("NFKC", query).split())
+    normalized_params = {}
+    for name, value in params.items():
+        if value is None:
+            continue
+        if name == "fields" and isinstance(value, str):
+            value = ",".join(sorted(field.strip() for field in value.split(",") if field.strip()))
+        normalized_params[name] = value
+    payload = json.dumps(
+        {"source": source, "query": normalized_query, "params": normalized_params},
+        sort_keys=True,
+        separators=(",", ":")
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def make_llm_key(
+    model: str,
+    prompt: str,
+    temperature: float,
+    max_tokens: int,
+    prompt_version: str = ""
+) -> str:
+    """Build a content-addressed cache key for an LLM completion."""
+    prompt_hash = hashlib.sha256(prompt.encode()).hexdigest()
+    payload = json.dumps(
+        [model, prompt_hash, temperature, max_tokens, prompt_version],
+        separators=(",", ":")
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
 
 
 class CacheManager:
-    """SQLite-based cache for API responses to avoid redundant calls."""
-    
-    def __init__(self, db_path: Path):
+    """SQLite-based cache for API responses to avoid redundant calls.
+
+    A single connection is opened in WAL mode and reused for every call, and
+    the batch methods write all rows in one transaction. Rows hold the
+    compressed binary format from ``codec``. Decoded papers are kept in a
+    bounded in-process LRU in front of SQLite, and when ``max_db_bytes`` is set
+    the least recently accessed rows are evicted once the stored payloads
+    exceed it. Read times are buffered in memory and written with the next
+    write, so reads never write to SQLite themselves.
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        memory_max_entries: int = 2048,
+        memory_max_bytes: int = 64 * 1024 * 1024,
+        max_db_bytes: Optional[int] = None
+    ):
         self.db_path = db_path
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_db_bytes = max_db_bytes
+        self.memory = LRUCache(max_entries=memory_max_entries, max_bytes=memory_max_bytes)
+        self._lock = threading.Lock()
+        self._pending_touches: Dict[str, str] = {}
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
         self._init_db()
-    
+
+    @classmethod
+    def from_config(cls, config: CacheConfig) -> "CacheManager":
+        return cls(
+            config.path,
+            memory_max_entries=config.memory_max_entries,
+            memory_max_bytes=config.memory_max_mb * 1024 * 1024,
+            max_db_bytes=config.max_size_mb * 1024 * 1024 if config.max_size_mb else None
+        )
+
     def _init_db(self):
         """Initialize database schema."""
-        conn = sqlite3.connect(self.db_path)
-        conn.execute("""
-            CREATE TABLE IF NOT EXISTS papers (
+        with self._lock, self._conn:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS papers (
+                    paper_id TEXT PRIMARY KEY,
+                    source TEXT NOT NULL,
+                    data BLOB NOT NULL,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    last_accessed TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+            columns = {row[1] for row in self._conn.execute("PRAGMA table_info(papers)")}
+            if "data_json" in columns:
+                self._migrate_json_rows(columns)
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS search_results (
+                    cache_key TEXT PRIMARY KEY,
+                    source TEXT NOT NULL,
+                    query TEXT NOT NULL,
+                    result_ids TEXT NOT NULL,
+                    total INTEGER NOT NULL,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS llm_responses (
+                    cache_key TEXT PRIMARY KEY,
+                    model TEXT NOT NULL,
+                    response_json TEXT NOT NULL,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_papers_last_accessed ON papers (last_accessed)"
+            )
+            row = self._conn.execute("SELECT COALESCE(SUM(LENGTH(data)), 0) FROM papers").fetchone()
+            self._db_bytes = row[0]
+
+    def _migrate_json_rows(self, columns: set):
+        """Rewrite a pre-binary ``papers`` table into the compressed format.
+
+        Older databases stored ``data_json`` TEXT and may lack ``last_accessed``;
+        rows are re-encoded in batches into a fresh table that replaces the old one.
+        """
+        last_accessed = "last_accessed" if "last_accessed" in columns else "created_at"
+        self._conn.execute("DROP INDEX IF EXISTS idx_papers_last_accessed")
+        self._conn.execute("ALTER TABLE papers RENAME TO papers_json")
+        self._conn.execute("""
+            CREATE TABLE papers (
                 paper_id TEXT PRIMARY KEY,
                 source TEXT NOT NULL,
-                data_json TEXT NOT NULL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                data BLOB NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                last_accessed TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             )
         """)
-        conn.commit()
-        conn.close()
-    
-    def get(self, paper_id: str) -> Optional[Paper]:
+        cursor = self._conn.execute(
+            f"SELECT paper_id, source, data_json, created_at, {last_accessed} FROM papers_json"
+        )
+        while True:
+            batch = cursor.fetchmany(MAX_QUERY_PARAMS)
+            if not batch:
+                break
+            self._conn.executemany(
+                "INSERT INTO papers (paper_id, source, data, created_at, last_accessed) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [
+                    (paper_id, source, encode_paper(decode_paper(data_json)), created, accessed)
+                    for paper_id, source, data_json, created, accessed in batch
+                ]
+            )
+        self._conn.execute("DROP TABLE papers_json")
+
+    def get(self, paper_id: str, ttl_days: Optional[int] = None) -> Optional[Paper]:
         """Retrieve paper from cache by ID.
-        
+
         Args:
             paper_id: Unique identifier for the paper
-            
+            ttl_days: If given, entries older than this are treated as misses
+
         Returns:
             Paper object if found, None otherwise
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.execute("SELECT data_json FROM papers WHERE paper_id = ?", (paper_id,))
-        row = cursor.fetchone()
-        conn.close()
-        
-        if row:
-            return Paper.model_validate_json(row[0])
-        return None
-    
+        return self.get_many([paper_id], ttl_days=ttl_days).get(paper_id)
+
+    def get_many(
+        self,
+        paper_ids: Iterable[str],
+        ttl_days: Optional[int] = None
+    ) -> Dict[str, Paper]:
+        """Retrieve several papers, from memory first and then one query per chunk.
+
+        Args:
+            paper_ids: Identifiers to look up
+            ttl_days: If given, entries older than this are treated as misses
+
+        Returns:
+            Mapping of paper ID to Paper for every cache hit
+        """
+        ids = list(dict.fromkeys(paper_ids))
+        hits = {}
+        with self._lock:
+            misses = []
+            for paper_id in ids:
+                entry = self.memory.get(paper_id)
+                if entry is None:
+                    misses.append(paper_id)
+                    continue
+                paper, created_at = entry
+                if ttl_days is None or not self._is_stale(created_at, ttl_days):
+                    hits[paper_id] = paper
+
+            for paper_id, data, created_at in self._select_rows(misses):
+                # Entries are sized by their JSON, not the smaller compressed blob.
+                paper, size = decode_paper_with_size(data)
+                self.memory.put(paper_id, (paper, created_at), size)
+                if ttl_days is None or not self._is_stale(created_at, ttl_days):
+                    hits[paper_id] = paper
+
+            if hits:
+                now = self._now()
+                self._pending_touches.update((paper_id, now) for paper_id in hits)
+                if len(self._pending_touches) >= MAX_PENDING_TOUCHES:
+                    with self._conn:
+                        self._flush_touches()
+        return hits
+
+    def _select_rows(self, paper_ids: List[str]) -> List[Tuple[str, bytes, str]]:
+        rows = []
+        for start in range(0, len(paper_ids), MAX_QUERY_PARAMS):
+            chunk = paper_ids[start:start + MAX_QUERY_PARAMS]
+            placeholders = ",".join("?" * len(chunk))
+            cursor = self._conn.execute(
+                f"SELECT paper_id, data, created_at FROM papers "
+                f"WHERE paper_id IN ({placeholders})",
+                chunk
+            )
+            rows.extend(cursor.fetchall())
+        return rows
+
+    def _flush_touches(self):
+        """Write buffered read times; the caller holds the lock and a transaction."""
+        if not self._pending_touches:
+            return
+        self._conn.executemany(
+            "UPDATE papers SET last_accessed = ? WHERE paper_id = ?",
+            [(accessed, paper_id) for paper_id, accessed in self._pending_touches.items()]
+        )
+        self._pending_touches.clear()
+
     def set(self, paper_id: str, paper: Paper, source: str):
         """Store paper in cache.
-        
+
         Args:
             paper_id: Unique identifier for the paper
             paper: Paper object to cache
             source: Source of the data (e.g., 'semantic_scholar')
         """
-        conn = sqlite3.connect(self.db_path)
-        conn.execute(
-            "INSERT OR REPLACE INTO papers (paper_id, source, data_json) VALUES (?, ?, ?)",
-            (paper_id, source, paper.model_dump_json())
+        self._write([(paper_id, paper, source)])
+
+    def set_many(self, papers: Iterable[Paper], source: str):
+        """Store several papers, keyed by ``paper.paper_id``, in one transaction.
+
+        Args:
+            papers: Paper objects to cache
+            source: Source of the data (e.g., 'semantic_scholar')
+        """
+        self._write([(paper.paper_id, paper, source) for paper in papers])
+
+    def _write(self, entries: List[Tuple[str, Paper, str]]):
+        if not entries:
+            return
+        now = self._now()
+        encoded = [encode_paper_with_size(paper) for _, paper, _ in entries]
+        rows = [
+            (paper_id, source, data)
+            for (paper_id, _, source), (data, _) in zip(entries, encoded)
+        ]
+
+        with self._lock, self._conn:
+            for (paper_id, paper, _), (_, size) in zip(entries, encoded):
+                self.memory.put(paper_id, (paper, now), size)
+            self._flush_touches()
+            replaced = self._stored_sizes([row[0] for row in rows])
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO papers "
+                "(paper_id, source, data, created_at, last_accessed) "
+                "VALUES (?, ?, ?, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)",
+                rows
+            )
+            written = {row[0]: len(row[2]) for row in rows}
+            self._db_bytes += sum(written.values()) - sum(replaced.values())
+            if self.max_db_bytes is not None and self._db_bytes > self.max_db_bytes:
+                self._evict(int(self.max_db_bytes * EVICTION_LOW_WATER))
+
+    def _stored_sizes(self, paper_ids: List[str]) -> Dict[str, int]:
+        ids = list(dict.fromkeys(paper_ids))
+        sizes = {}
+        for start in range(0, len(ids), MAX_QUERY_PARAMS):
+            chunk = ids[start:start + MAX_QUERY_PARAMS]
+            placeholders = ",".join("?" * len(chunk))
+            cursor = self._conn.execute(
+                f"SELECT paper_id, LENGTH(data) FROM papers "
+                f"WHERE paper_id IN ({placeholders})",
+                chunk
+            )
+            sizes.update(cursor.fetchall())
+        return sizes
+
+    def _evict(self, target_bytes: int):
+        """Delete least recently accessed rows until the payload fits ``target_bytes``."""
+        cursor = self._conn.execute(
+            "SELECT paper_id, LENGTH(data) FROM papers "
+            "ORDER BY last_accessed ASC"
         )
-        conn.commit()
-        conn.close()
-    
+        evicted = []
+        for paper_id, size in cursor:
+            if self._db_bytes <= target_bytes:
+                break
+            evicted.append(paper_id)
+            self._db_bytes -= size
+        cursor.close()
+
+        for start in range(0, len(evicted), MAX_QUERY_PARAMS):
+            chunk = evicted[start:start + MAX_QUERY_PARAMS]
+            placeholders = ",".join("?" * len(chunk))
+            self._conn.execute(f"DELETE FROM papers WHERE paper_id IN ({placeholders})", chunk)
+        for paper_id in evicted:
+            self.memory.pop(paper_id)
+
+    def get_search(
+        self,
+        cache_key: str,
+        ttl_days: Optional[int] = None
+    ) -> Optional[Tuple[List[str], int]]:
+        """Retrieve the ordered result IDs stored for a search.
+
+        Args:
+            cache_key: Key from ``make_search_key``
+            ttl_days: If given, entries older than this are treated as misses
+
+        Returns:
+            Tuple of (result IDs, total hits reported by the source), or None
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT result_ids, total, created_at FROM search_results WHERE cache_key = ?",
+                (cache_key,)
+            ).fetchone()
+
+        if not row:
+            return None
+        result_ids, total, created_at = row
+        if ttl_days is not None and self._is_stale(created_at, ttl_days):
+            return None
+        return json.loads(result_ids), total
+
+    def set_search(
+        self,
+        cache_key: str,
+        source: str,
+        query: str,
+        result_ids: List[str],
+        total: int
+    ):
+        """Store the ordered result IDs of a search.
+
+        Args:
+            cache_key: Key from ``make_search_key``
+            source: Source of the results (e.g., 'pubmed')
+            query: Query text, kept for inspection only
+            result_ids: Result identifiers in the order the source returned them
+            total: Total hits reported by the source
+        """
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO search_results "
+                "(cache_key, source, query, result_ids, total, created_at) "
+                "VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP)",
+                (cache_key, source, query, json.dumps(result_ids), total)
+            )
+
+    def get_llm_response(self, cache_key: str) -> Optional[QwenResponse]:
+        """Retrieve a stored LLM completion.
+
+        Args:
+            cache_key: Key from ``make_llm_key``
+
+        Returns:
+            The cached response, or None
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response_json FROM llm_responses WHERE cache_key = ?",
+                (cache_key,)
+            ).fetchone()
+
+        if not row:
+            return None
+        return QwenResponse.model_validate_json(row[0])
+
+    def set_llm_response(self, cache_key: str, response: QwenResponse):
+        """Store an LLM completion.
+
+        Args:
+            cache_key: Key from ``make_llm_key``
+            response: Completion to cache
+        """
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_responses (cache_key, model, response_json) "
+                "VALUES (?, ?, ?)",
+                (cache_key, response.model, response.model_dump_json())
+            )
+
     def is_expired(self, paper_id: str, ttl_days: int) -> bool:
         """Check if cached paper is expired based on TTL.
-        
+
         Args:
             paper_id: Unique identifier for the paper
             ttl_days: Time-to-live in days
-            
+
         Returns:
             True if expired or not found, False otherwise
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.execute("SELECT created_at FROM papers WHERE paper_id = ?", (paper_id,))
-        row = cursor.fetchone()
-        conn.close()
-        
+        with self._lock:
+            cursor = self._conn.execute(
+                "SELECT created_at FROM papers WHERE paper_id = ?", (paper_id,)
+            )
+            row = cursor.fetchone()
+
         if not row:
             return True
-        
-        created = datetime.fromisoformat(row[0])
-        return datetime.now() - created > timedelta(days=ttl_days)
+
+        return self._is_stale(row[0], ttl_days)
+
+    def _now(self) -> str:
+        # Matches the UTC format SQLite uses for CURRENT_TIMESTAMP.
+        return datetime.now(timezone.utc).strftime(SQLITE_TIMESTAMP_FORMAT)
+
+    def _is_stale(self, created_at: str, ttl_days: int) -> bool:
+        created = datetime.fromisoformat(created_at)
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        return now - created > timedelta(days=ttl_days)
+
+    def close(self):
+        """Write buffered read times and close the underlying database connection."""
+        with self._lock:
+            with self._conn:
+                self._flush_touches()
+            self._conn.close()
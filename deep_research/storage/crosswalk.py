@@ -0,0 +1,129 @@
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from deep_research.api.models import Paper
+
+# Identifier kinds, named after the ExternalIds fields they come from.
+IDENTIFIER_KINDS = ("doi", "pmid", "s2_id", "arxiv")
+
+Identifier = Tuple[str, str]
+
+
+def paper_identifiers(paper: Paper) -> List[Identifier]:
+    """Return a paper's external identifiers as (kind, value) pairs.
+
+    DOIs are case-insensitive, so they are lower-cased.
+    """
+    identifiers = []
+    for kind in IDENTIFIER_KINDS:
+        value = getattr(paper.external_ids, kind)
+        if value:
+            identifiers.append((kind, value.lower() if kind == "doi" else value))
+    return identifiers
+
+
+class IdentityCrosswalk:
+    """Persistent map of equivalent paper identifiers (DOI, PMID, S2 ID, arXiv).
+
+    Identifiers known to name the same paper share a cluster ID. The whole
+    table is loaded into memory on open, so lookups are dictionary hits, and
+    every change is written through to SQLite.
+    """
+
+    def __init__(self, db_path: Path):
+        self.db_path = db_path
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._clusters: Dict[Identifier, str] = {}
+        self._members: Dict[str, Set[Identifier]] = {}
+        self._init_db()
+
+    def _init_db(self):
+        """Initialize database schema and load the crosswalk."""
+        with self._lock, self._conn:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS identifiers (
+                    kind TEXT NOT NULL,
+                    value TEXT NOT NULL,
+                    cluster_id TEXT NOT NULL,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    PRIMARY KEY (kind, value)
+                )
+            """)
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_identifiers_cluster ON identifiers (cluster_id)"
+            )
+            for kind, value, cluster_id in self._conn.execute(
+                "SELECT kind, value, cluster_id FROM identifiers"
+            ):
+                self._clusters[(kind, value)] = cluster_id
+                self._members.setdefault(cluster_id, set()).add((kind, value))
+
+    def resolve(self, identifier: Identifier) -> Optional[str]:
+        """Return the cluster ID of an identifier, or None if it is unknown."""
+        return self._clusters.get(identifier)
+
+    def equivalents(self, identifier: Identifier) -> Set[Identifier]:
+        """Return every identifier known to name the same paper, itself included."""
+        cluster_id = self._clusters.get(identifier)
+        if cluster_id is None:
+            return {identifier}
+        return set(self._members[cluster_id])
+
+    def link(self, identifiers: Iterable[Identifier]) -> Optional[str]:
+        """Record that the identifiers all name the same paper.
+
+        Returns:
+            The cluster ID the identifiers now share, or None if none were given
+        """
+        return self.link_many([identifiers])[0]
+
+    def link_many(self, groups: Iterable[Iterable[Identifier]]) -> List[Optional[str]]:
+        """Record several groups of equivalent identifiers in one transaction."""
+        cluster_ids = []
+        with self._lock, self._conn:
+            for group in groups:
+                cluster_ids.append(self._link(list(dict.fromkeys(group))))
+        return cluster_ids
+
+    def _link(self, identifiers: List[Identifier]) -> Optional[str]:
+        if not identifiers:
+            return None
+        new = [identifier for identifier in identifiers if identifier not in self._clusters]
+        existing = {
+            self._clusters[identifier] for identifier in identifiers if identifier in self._clusters
+        }
+        # The smallest ID wins, so merging is deterministic.
+        target = min(existing | {f"{kind}:{value}" for kind, value in new})
+
+        members = self._members.setdefault(target, set())
+        for cluster_id in existing - {target}:
+            moved = self._members.pop(cluster_id)
+            for identifier in moved:
+                self._clusters[identifier] = target
+            members |= moved
+            self._conn.execute(
+                "UPDATE identifiers SET cluster_id = ? WHERE cluster_id = ?",
+                (target, cluster_id)
+            )
+        for identifier in new:
+            self._clusters[identifier] = target
+            members.add(identifier)
+        self._conn.executemany(
+            "INSERT INTO identifiers (kind, value, cluster_id) VALUES (?, ?, ?)",
+            [(kind, value, target) for kind, value in new]
+        )
+        return target
+
+    def __len__(self) -> int:
+        return len(self._clusters)
+
+    def close(self):
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,250 @@
+import sqlite3
+import threading
+from pathlib import Path
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from deep_research.api.models import ExternalIds, Paper
+from deep_research.storage.cache import MAX_QUERY_PARAMS
+
+DIRECTIONS = ("citations", "references")
+
+
+class CSRGraph:
+    """Citation adjacency in compressed sparse row form.
+
+    Node ``i`` is ``node_ids[i]``; its out-neighbours are
+    ``indices[indptr[i]:indptr[i + 1]]``. An edge ``i -> j`` means that paper
+    ``i`` cites paper ``j``.
+    """
+
+    def __init__(self, node_ids: List[str], indptr: np.ndarray, indices: np.ndarray):
+        self.node_ids = node_ids
+        self.indptr = indptr
+        self.indices = indices
+        self.index: Dict[str, int] = {paper_id: i for i, paper_id in enumerate(node_ids)}
+
+    @property
+    def num_nodes(self) -> int:
+        return len(self.node_ids)
+
+    @property
+    def num_edges(self) -> int:
+        return len(self.indices)
+
+    def out_degree(self) -> np.ndarray:
+        return np.diff(self.indptr)
+
+    def neighbors(self, paper_id: str) -> List[str]:
+        i = self.index[paper_id]
+        return [self.node_ids[j] for j in self.indices[self.indptr[i]:self.indptr[i + 1]]]
+
+    def transpose(self) -> "CSRGraph":
+        """Return the graph with every edge reversed (cited -> citing)."""
+        sources = np.repeat(np.arange(self.num_nodes, dtype=np.int32), self.out_degree())
+        return self.from_edges(self.node_ids, self.indices, sources)
+
+    @classmethod
+    def from_pairs(cls, edges: Iterable[Tuple[str, str]]) -> "CSRGraph":
+        """Build a graph from (citing ID, cited ID) pairs; nodes are sorted by ID."""
+        edges = list(dict.fromkeys(edges))
+        node_ids = sorted({paper_id for edge in edges for paper_id in edge})
+        index = {paper_id: i for i, paper_id in enumerate(node_ids)}
+        sources = np.fromiter((index[citing] for citing, _ in edges), dtype=np.int32, count=len(edges))
+        targets = np.fromiter((index[cited] for _, cited in edges), dtype=np.int32, count=len(edges))
+        return cls.from_edges(node_ids, sources, targets)
+
+    @classmethod
+    def from_edges(cls, node_ids: List[str], sources: np.ndarray, targets: np.ndarray) -> "CSRGraph":
+        order = np.lexsort((targets, sources))
+        counts = np.bincount(sources, minlength=len(node_ids))
+        indptr = np.zeros(len(node_ids) + 1, dtype=np.int64)
+        np.cumsum(counts, out=indptr[1:])
+        return cls(node_ids, indptr, np.asarray(targets, dtype=np.int32)[order])
+
+
+class EdgeStore:
+    """SQLite store of citation edges fetched from the APIs.
+
+    Each fetch of a paper's citations or references is recorded with the
+    number of edges returned and the limit it was requested with, so a later
+    request can tell whether the stored list covers it. The short records that
+    come with citation and reference pages (ID, title, year, citation count)
+    are kept too, so a stored list can be answered without a request. The
+    whole graph can be exported as a ``CSRGraph`` for algorithms that only
+    need the adjacency.
+    """
+
+    def __init__(self, db_path: Path):
+        self.db_path = db_path
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._init_db()
+
+    def _init_db(self):
+        """Initialize database schema."""
+        with self._lock, self._conn:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS citation_edges (
+                    citing_id TEXT NOT NULL,
+                    cited_id TEXT NOT NULL,
+                    fetched_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    UNIQUE (citing_id, cited_id)
+                )
+            """)
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_citation_edges_cited ON citation_edges (cited_id)"
+            )
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS edge_fetches (
+                    paper_id TEXT NOT NULL,
+                    direction TEXT NOT NULL,
+                    edge_count INTEGER NOT NULL,
+                    fetch_limit INTEGER NOT NULL,
+                    fetched_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    PRIMARY KEY (paper_id, direction)
+                )
+            """)
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS linked_papers (
+                    paper_id TEXT PRIMARY KEY,
+                    title TEXT NOT NULL,
+                    year INTEGER,
+                    citation_count INTEGER NOT NULL,
+                    fetched_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+
+    def add_edges(self, paper_id: str, direction: str, related_ids: Iterable[str], limit: int):
+        """Record the result of fetching a paper's citations or references.
+
+        Args:
+            paper_id: Paper whose links were fetched
+            direction: 'citations' (related papers cite it) or 'references'
+                (it cites the related papers)
+            related_ids: Linked paper IDs in the order the API returned them
+            limit: Maximum number of links that were requested
+        """
+        ids = list(dict.fromkeys(related_ids))
+        edges = [self._edge(paper_id, direction, related_id) for related_id in ids]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT INTO citation_edges (citing_id, cited_id) VALUES (?, ?) "
+                "ON CONFLICT (citing_id, cited_id) DO UPDATE SET fetched_at = CURRENT_TIMESTAMP",
+                edges
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO edge_fetches "
+                "(paper_id, direction, edge_count, fetch_limit, fetched_at) "
+                "VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)",
+                (paper_id, direction, len(ids), limit)
+            )
+
+    def get_linked(
+        self,
+        paper_id: str,
+        direction: str,
+        limit: int,
+        ttl_days: Optional[int] = None
+    ) -> Optional[List[str]]:
+        """Return stored citation or reference IDs if they cover ``limit``.
+
+        Args:
+            paper_id: Paper whose links are wanted
+            direction: 'citations' or 'references'
+            limit: Maximum number of links wanted
+            ttl_days: If given, fetches older than this are treated as misses
+
+        Returns:
+            Up to ``limit`` linked paper IDs, or None when the store cannot answer
+        """
+        self._check_direction(direction)
+        with self._lock:
+            fetch = self._conn.execute(
+                "SELECT edge_count, fetch_limit, fetched_at FROM edge_fetches "
+                "WHERE paper_id = ? AND direction = ?",
+                (paper_id, direction)
+            ).fetchone()
+            if fetch is None:
+                return None
+            edge_count, fetch_limit, fetched_at = fetch
+            # A fetch that hit its limit may have been truncated.
+            if limit > fetch_limit and edge_count >= fetch_limit:
+                return None
+            if ttl_days is not None and self._is_stale(fetched_at, ttl_days):
+                return None
+
+            if direction == "citations":
+                query = "SELECT citing_id FROM citation_edges WHERE cited_id = ?"
+            else:
+                query = "SELECT cited_id FROM citation_edges WHERE citing_id = ?"
+            rows = self._conn.execute(f"{query} ORDER BY rowid LIMIT ?", (paper_id, limit))
+            return [row[0] for row in rows]
+
+    def add_linked_papers(self, papers: Iterable[Paper]):
+        """Store the short records returned with citation or reference pages."""
+        rows = [
+            (paper.paper_id, paper.title, paper.year, paper.citation_count)
+            for paper in papers
+            if paper.paper_id
+        ]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO linked_papers "
+                "(paper_id, title, year, citation_count, fetched_at) "
+                "VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)",
+                rows
+            )
+
+    def get_linked_papers(self, paper_ids: Iterable[str]) -> Dict[str, Paper]:
+        """Return the stored short records of linked papers, by paper ID."""
+        ids = list(dict.fromkeys(paper_ids))
+        papers = {}
+        with self._lock:
+            for start in range(0, len(ids), MAX_QUERY_PARAMS):
+                chunk = ids[start:start + MAX_QUERY_PARAMS]
+                placeholders = ",".join("?" * len(chunk))
+                for paper_id, title, year, citation_count in self._conn.execute(
+                    f"SELECT paper_id, title, year, citation_count FROM linked_papers "
+                    f"WHERE paper_id IN ({placeholders})",
+                    chunk
+                ):
+                    papers[paper_id] = Paper(
+                        paper_id=paper_id,
+                        title=title,
+                        year=year,
+                        citation_count=citation_count,
+                        external_ids=ExternalIds(s2_id=paper_id)
+                    )
+        return papers
+
+    def to_csr(self) -> CSRGraph:
+        """Export every stored edge as a CSR adjacency of citing -> cited."""
+        with self._lock:
+            edges = self._conn.execute("SELECT citing_id, cited_id FROM citation_edges").fetchall()
+        return CSRGraph.from_pairs(edges)
+
+    def close(self):
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def _edge(self, paper_id: str, direction: str, related_id: str) -> Tuple[str, str]:
+        self._check_direction(direction)
+        if direction == "citations":
+            return related_id, paper_id
+        return paper_id, related_id
+
+    def _check_direction(self, direction: str):
+        if direction not in DIRECTIONS:
+            raise ValueError(f"Unknown edge direction: {direction}")
+
+    def _is_stale(self, fetched_at: str, ttl_days: int) -> bool:
+        fetched = datetime.fromisoformat(fetched_at)
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        return now - fetched > timedelta(days=ttl_days)
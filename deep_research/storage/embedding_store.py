@@ -0,0 +1,188 @@
+import hashlib
+import re
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from deep_research.storage.cache import MAX_QUERY_PARAMS
+
+# Sentence-transformers model used for paper embeddings unless one is given.
+DEFAULT_MODEL = "all-MiniLM-L6-v2"
+EMBEDDING_DTYPE = np.float16
+
+EmbeddingKey = Tuple[str, str]
+
+
+def text_hash(text: str) -> str:
+    """Return a short stable digest of the text a paper was embedded from."""
+    return hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+
+
+class EmbeddingStore:
+    """Persistent paper embeddings, one append-only float16 matrix per model.
+
+    Vectors are appended to a ``.f16`` file per model in the store directory
+    and read back through a read-only memory map, so lookups return views into
+    the page cache instead of copies. A SQLite index maps (model, paper ID) to
+    the vector's row and the hash of the text it was computed from; a paper
+    whose text changed is re-embedded into a new row and the old row is
+    simply no longer referenced.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path / "index.db", check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._maps: Dict[str, np.memmap] = {}
+        self._dims: Dict[str, int] = {}
+        self._init_db()
+
+    def _init_db(self):
+        """Initialize database schema."""
+        with self._lock, self._conn:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS embedding_models (
+                    model TEXT PRIMARY KEY,
+                    dimension INTEGER NOT NULL
+                )
+            """)
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS embeddings (
+                    model TEXT NOT NULL,
+                    paper_id TEXT NOT NULL,
+                    text_hash TEXT NOT NULL,
+                    row INTEGER NOT NULL,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    PRIMARY KEY (model, paper_id)
+                )
+            """)
+            for model, dimension in self._conn.execute(
+                "SELECT model, dimension FROM embedding_models"
+            ):
+                self._dims[model] = dimension
+
+    def get_many(
+        self,
+        model: str,
+        keys: Sequence[EmbeddingKey]
+    ) -> Dict[EmbeddingKey, np.ndarray]:
+        """Look up stored vectors by (paper ID, text hash).
+
+        Args:
+            model: Name of the model the vectors were computed with
+            keys: (paper ID, text hash) pairs
+
+        Returns:
+            Read-only float16 vector per key whose stored text hash matches
+        """
+        wanted = dict.fromkeys(keys)
+        paper_ids = list(dict.fromkeys(paper_id for paper_id, _ in wanted))
+        with self._lock:
+            rows = []
+            for start in range(0, len(paper_ids), MAX_QUERY_PARAMS):
+                chunk = paper_ids[start:start + MAX_QUERY_PARAMS]
+                placeholders = ",".join("?" * len(chunk))
+                rows.extend(self._conn.execute(
+                    f"SELECT paper_id, text_hash, row FROM embeddings "
+                    f"WHERE model = ? AND paper_id IN ({placeholders})",
+                    [model, *chunk]
+                ))
+            hits = [
+                ((paper_id, digest), row)
+                for paper_id, digest, row in rows
+                if (paper_id, digest) in wanted
+            ]
+            if not hits:
+                return {}
+            matrix = self._matrix(model, max(row for _, row in hits) + 1)
+        return {key: matrix[row] for key, row in hits}
+
+    def export(self, model: str) -> Tuple[List[str], np.ndarray]:
+        """Return every current paper ID for ``model`` and its vectors, row-aligned."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT paper_id, row FROM embeddings WHERE model = ? ORDER BY row",
+                (model,)
+            ).fetchall()
+            if not rows:
+                return [], np.zeros((0, self._dims.get(model, 0)), dtype=EMBEDDING_DTYPE)
+            matrix = self._matrix(model, rows[-1][1] + 1)
+        return [paper_id for paper_id, _ in rows], matrix[[row for _, row in rows]]
+
+    def add_many(self, model: str, keys: Sequence[EmbeddingKey], vectors: np.ndarray):
+        """Append vectors and point their keys at them.
+
+        Raises:
+            ValueError: If the vectors' dimension differs from earlier ones
+                stored for the same model, or their count differs from the keys
+        """
+        vectors = np.asarray(vectors, dtype=EMBEDDING_DTYPE)
+        if vectors.ndim != 2 or len(vectors) != len(keys):
+            raise ValueError(f"Expected {len(keys)} vectors, got array of shape {vectors.shape}")
+        if not len(keys):
+            return
+
+        dimension = vectors.shape[1]
+        with self._lock, self._conn:
+            known = self._dims.get(model)
+            if known is None:
+                self._conn.execute(
+                    "INSERT INTO embedding_models (model, dimension) VALUES (?, ?)",
+                    (model, dimension)
+                )
+                self._dims[model] = dimension
+            elif known != dimension:
+                raise ValueError(
+                    f"Embeddings for {model} have dimension {known}, got {dimension}"
+                )
+
+            first_row = self._append(model, vectors)
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (model, paper_id, text_hash, row) "
+                "VALUES (?, ?, ?, ?)",
+                [
+                    (model, paper_id, digest, first_row + offset)
+                    for offset, (paper_id, digest) in enumerate(keys)
+                ]
+            )
+
+    def close(self):
+        """Close the index and drop the memory maps."""
+        with self._lock:
+            self._maps.clear()
+            self._conn.close()
+
+    def _append(self, model: str, vectors: np.ndarray) -> int:
+        row_bytes = vectors.shape[1] * vectors.itemsize
+        with open(self._matrix_path(model), "ab") as handle:
+            size = handle.seek(0, 2)
+            # Drop a partial row left behind by an interrupted write.
+            if size % row_bytes:
+                handle.truncate(size - size % row_bytes)
+                size -= size % row_bytes
+            handle.write(vectors.tobytes())
+        return size // row_bytes
+
+    def _matrix(self, model: str, rows: int) -> np.ndarray:
+        matrix: Optional[np.memmap] = self._maps.get(model)
+        if matrix is None or len(matrix) < rows:
+            # Remap only when rows were appended since the last mapping.
+            path = self._matrix_path(model)
+            dimension = self._dims[model]
+            row_bytes = dimension * np.dtype(EMBEDDING_DTYPE).itemsize
+            shape = (path.stat().st_size // row_bytes, dimension)
+            matrix = np.memmap(path, dtype=EMBEDDING_DTYPE, mode="r", shape=shape)
+            self._maps[model] = matrix
+        return matrix
+
+    def _matrix_path(self, model: str) -> Path:
+        # The digest keeps names that sanitize alike ("a/b", "a_b") apart.
+        safe_name = re.sub(r"[^A-Za-z0-9_.-]", "_", model)
+        return self.path / f"{safe_name}-{text_hash(model)[:8]}.f16"
+
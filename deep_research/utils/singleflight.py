@@ -0,0 +1,64 @@
+import asyncio
+from typing import Awaitable, Callable, Dict, Hashable, List, TypeVar
+
+T = TypeVar('T')
+V = TypeVar('V')
+
+
+class SingleFlight:
+    """Coalesce concurrent identical requests into one in-flight task.
+
+    Callers that ask for a key while an earlier call for it is still running
+    await the same task instead of starting their own. The key is released as
+    soon as the task finishes, so later calls fetch afresh (or hit a cache).
+    """
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(func())
+            self._register([key], task)
+        # Shield the shared task so one caller being cancelled does not cancel it
+        # for everyone else waiting on the same key.
+        return await asyncio.shield(task)
+
+    async def do_many(
+        self,
+        keys: List[Hashable],
+        func: Callable[[List[Hashable]], Awaitable[Dict[Hashable, V]]]
+    ) -> Dict[Hashable, V]:
+        """Coalesce batch lookups key by key.
+
+        Keys already in flight are awaited from their existing batch; all
+        remaining keys are fetched with a single call to ``func``, which must
+        return a mapping of the keys it found.
+        """
+        tasks = {key: self._inflight[key] for key in keys if key in self._inflight}
+        fresh = [key for key in dict.fromkeys(keys) if key not in tasks]
+        if fresh:
+            task = asyncio.ensure_future(func(fresh))
+            self._register(fresh, task)
+            tasks.update((key, task) for key in fresh)
+
+        results: Dict[Hashable, V] = {}
+        for task in {id(task): task for task in tasks.values()}.values():
+            found = await asyncio.shield(task)
+            results.update((key, value) for key, value in found.items() if key in tasks)
+        return results
+
+    def _register(self, keys: List[Hashable], task: asyncio.Future):
+        for key in keys:
+            self._inflight[key] = task
+
+        def release(_):
+            for key in keys:
+                if self._inflight.get(key) is task:
+                    del self._inflight[key]
+
+        task.add_done_callback(release)
+
+    def __len__(self) -> int:
+        return len(self._inflight)
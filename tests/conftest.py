@@ -1,6 +1,15 @@
 import pytest
 from unittest.mock import Mock
 
+from deep_research.api.semantic_scholar import SemanticScholarClient
+
+
+@pytest.fixture(autouse=True)
+def fast_semantic_scholar(monkeypatch):
+    """Lift the default Semantic Scholar throttle and retry delay in tests"""
+    monkeypatch.setattr(SemanticScholarClient, "CALLS_PER_SECOND", 1000.0)
+    monkeypatch.setattr(SemanticScholarClient, "RETRY_BASE_DELAY", 0.0)
+
 @pytest.fixture
 def mock_qwen_client():
     """Mock Qwen API client for testing"""
@@ -0,0 +1,63 @@
+import numpy as np
+
+from deep_research.storage.ann_index import IVFIndex
+
+
+def _clustered_vectors(n: int, dim: int = 32, clusters: int = 50, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(clusters, dim))
+    return centers[rng.integers(0, clusters, n)] + 0.3 * rng.normal(size=(n, dim))
+
+
+def _exact_top(vectors: np.ndarray, query: np.ndarray, k: int) -> set:
+    normalized = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    return {str(i) for i in np.argsort(-(normalized @ query))[:k]}
+
+
+def test_probing_every_list_is_exact():
+    vectors = _clustered_vectors(2000)
+    ids = [str(i) for i in range(len(vectors))]
+    index = IVFIndex.build(ids, vectors, num_lists=20)
+    index.nprobe = index.num_lists
+
+    query = vectors[7] / np.linalg.norm(vectors[7])
+    hits = index.search(query, k=10)
+
+    assert {paper_id for paper_id, _ in hits} == _exact_top(vectors, query, 10)
+    assert hits[0][0] == "7"
+    scores = [score for _, score in hits]
+    assert scores == sorted(scores, reverse=True)
+
+
+def test_default_probing_has_high_recall():
+    vectors = _clustered_vectors(20000, seed=1)
+    ids = [str(i) for i in range(len(vectors))]
+    index = IVFIndex.build(ids, vectors)
+    rng = np.random.default_rng(2)
+
+    recall = 0.0
+    for row in rng.integers(0, len(vectors), 20):
+        query = vectors[row] + 0.1 * rng.normal(size=vectors.shape[1])
+        query /= np.linalg.norm(query)
+        found = {paper_id for paper_id, _ in index.search(query, k=10)}
+        recall += len(found & _exact_top(vectors, query, 10)) / 10
+
+    assert recall / 20 >= 0.9
+
+
+def test_save_and_load_round_trip(tmp_path):
+    vectors = _clustered_vectors(500)
+    ids = [f"P{i}" for i in range(len(vectors))]
+    index = IVFIndex.build(ids, vectors, num_lists=8)
+    index.save(tmp_path / "corpus.npz")
+
+    loaded = IVFIndex.load(tmp_path / "corpus.npz")
+
+    assert loaded.search(vectors[3], k=5) == index.search(vectors[3], k=5)
+
+
+def test_empty_index_returns_nothing():
+    index = IVFIndex.build([], np.zeros((0, 8)))
+
+    assert len(index) == 0
+    assert index.search(np.ones(8), k=5) == []
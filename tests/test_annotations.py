@@ -0,0 +1,47 @@
+import asyncio
+
+import pytest
+
+from deep_research.storage.annotations import AnnotationStore
+
+
+def test_annotations_are_keyed_by_task_version_and_context():
+    store = AnnotationStore()
+    store.set("P1", "stance", "YES", prompt_version="1", context="Does it work?")
+
+    assert store.get("P1", "stance", "1", "Does it work?") == "YES"
+    assert store.get("P1", "stance", "2", "Does it work?") is None
+    assert store.get("P1", "stance", "1", "Is it safe?") is None
+    assert store.get("P1", "claims", "1", "Does it work?") is None
+
+
+def test_annotations_persist_across_reviews(tmp_path):
+    first = AnnotationStore(tmp_path / "annotations.db")
+    first.set_many("claims", [("P1", ["a", "b"]), ("P2", [])], prompt_version="1")
+    first.close()
+
+    second = AnnotationStore(tmp_path / "annotations.db")
+
+    assert second.get("P1", "claims", "1") == ["a", "b"]
+    assert second.get("P2", "claims", "1") == []
+
+
+@pytest.mark.asyncio
+async def test_get_or_compute_runs_each_annotation_once():
+    store = AnnotationStore()
+    calls = 0
+
+    async def compute():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0)
+        return "RCT"
+
+    results = await asyncio.gather(*(
+        store.get_or_compute("P1", "study_type", compute) for _ in range(3)
+    ))
+    again = await store.get_or_compute("P1", "study_type", compute)
+
+    assert results == ["RCT"] * 3
+    assert again == "RCT"
+    assert calls == 1
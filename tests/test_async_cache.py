@@ -0,0 +1,115 @@
+import asyncio
+import time
+
+import pytest
+
+from deep_research.api.models import Paper
+from deep_research.storage.async_cache import AsyncCacheManager
+from deep_research.storage.cache import CacheManager
+
+
+class SlowCacheManager(CacheManager):
+    def get_many(self, paper_ids, ttl_days=None):
+        time.sleep(0.2)
+        return super().get_many(paper_ids, ttl_days=ttl_days)
+
+
+@pytest.mark.asyncio
+async def test_pending_writes_are_readable_and_coalesced(tmp_path):
+    cache = CacheManager(tmp_path / "test.db")
+    async_cache = AsyncCacheManager(cache, batch_size=100, flush_interval=60)
+
+    await async_cache.set("P1", Paper(paper_id="P1", title="First"), "test")
+    await async_cache.set("P1", Paper(paper_id="P1", title="Second"), "test")
+
+    assert cache.get("P1") is None
+    assert (await async_cache.get("P1")).title == "Second"
+
+    await async_cache.close()
+
+    assert cache.get("P1").title == "Second"
+    count = cache._conn.execute("SELECT COUNT(*) FROM papers").fetchone()[0]
+    assert count == 1
+
+
+@pytest.mark.asyncio
+async def test_flushes_when_batch_is_full(tmp_path):
+    cache = CacheManager(tmp_path / "test.db")
+    async_cache = AsyncCacheManager(cache, batch_size=3, flush_interval=60)
+
+    papers = [Paper(paper_id=f"P{i}", title=f"Paper {i}") for i in range(3)]
+    await async_cache.set_many(papers, "test")
+    await asyncio.gather(*async_cache._flushes)
+
+    assert set(cache.get_many(["P0", "P1", "P2"])) == {"P0", "P1", "P2"}
+    await async_cache.close()
+
+
+@pytest.mark.asyncio
+async def test_flushes_after_interval(tmp_path):
+    cache = CacheManager(tmp_path / "test.db")
+    async_cache = AsyncCacheManager(cache, batch_size=100, flush_interval=0.01)
+
+    await async_cache.set("P1", Paper(paper_id="P1", title="Timed"), "test")
+    await asyncio.sleep(0.1)
+
+    assert cache.get("P1") is not None
+    await async_cache.close()
+
+
+@pytest.mark.asyncio
+async def test_reads_do_not_block_event_loop(tmp_path):
+    cache = SlowCacheManager(tmp_path / "test.db")
+    async_cache = AsyncCacheManager(cache)
+    ticks = []
+
+    async def ticker():
+        for _ in range(5):
+            ticks.append(time.monotonic())
+            await asyncio.sleep(0.02)
+
+    start = time.monotonic()
+    await asyncio.gather(async_cache.get("missing"), ticker())
+
+    assert len(ticks) == 5
+    assert ticks[1] - start < 0.15
+    await async_cache.close()
+
+
+class FailingCacheManager(CacheManager):
+    fail = True
+
+    def set_many(self, papers, source):
+        if self.fail:
+            raise RuntimeError("disk full")
+        super().set_many(papers, source)
+
+
+@pytest.mark.asyncio
+async def test_failed_flush_keeps_papers_for_the_next_one(tmp_path):
+    cache = FailingCacheManager(tmp_path / "test.db")
+    async_cache = AsyncCacheManager(cache, batch_size=100, flush_interval=60)
+
+    await async_cache.set("P1", Paper(paper_id="P1", title="Kept"), "test")
+    await async_cache.flush()
+    assert (await async_cache.get("P1")).title == "Kept"
+
+    cache.fail = False
+    await async_cache.close()
+    assert cache.get("P1").title == "Kept"
+
+
+@pytest.mark.asyncio
+async def test_search_is_stored_only_after_its_papers(tmp_path):
+    cache = FailingCacheManager(tmp_path / "test.db")
+    async_cache = AsyncCacheManager(cache, batch_size=100, flush_interval=60)
+
+    await async_cache.set_many([Paper(paper_id="P1", title="First")], "test")
+    await async_cache.set_search("key", "test", "query", ["P1"], 1)
+    assert cache.get_search("key") is None
+
+    cache.fail = False
+    await async_cache.set_search("key", "test", "query", ["P1"], 1)
+    assert cache.get_search("key") == (["P1"], 1)
+    assert cache.get("P1").title == "First"
+    await async_cache.close()
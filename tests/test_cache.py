@@ -1,6 +1,10 @@
+import sqlite3
+
 import pytest
 from pathlib import Path
-from deep_research.storage.cache import CacheManager
+from deep_research.storage.cache import CacheManager, make_search_key
+from deep_research.storage.codec import FORMAT_ZLIB_V1, encode_paper
+from deep_research.storage.memory_cache import LRUCache
 from deep_research.api.models import Paper, Author
 
 
@@ -89,3 +93,166 @@ def test_cache_update(tmp_path):
     assert retrieved is not None
     assert retrieved.title == "Updated Title"
     assert retrieved.year == 2025
+
+
+def test_cache_set_many_and_get_many(tmp_path):
+    """Test batched writes and reads round-trip in one call each."""
+    cache = CacheManager(tmp_path / "test.db")
+    papers = [Paper(paper_id=f"batch{i}", title=f"Paper {i}") for i in range(1200)]
+
+    cache.set_many(papers, "semantic_scholar")
+    retrieved = cache.get_many([paper.paper_id for paper in papers] + ["missing"])
+
+    assert len(retrieved) == 1200
+    assert "missing" not in retrieved
+    assert retrieved["batch1199"].title == "Paper 1199"
+
+
+def test_cache_get_many_respects_ttl(tmp_path):
+    """Test that stale entries are reported as misses when a TTL is given."""
+    cache = CacheManager(tmp_path / "test.db")
+    cache.set_many([Paper(paper_id="ttl1", title="TTL")], "test")
+
+    assert "ttl1" in cache.get_many(["ttl1"], ttl_days=30)
+    assert cache.get_many(["ttl1"], ttl_days=0) == {}
+    assert cache.get("ttl1", ttl_days=0) is None
+
+
+def test_cache_uses_wal_journal(tmp_path):
+    """Test that the persistent connection runs in WAL mode."""
+    cache = CacheManager(tmp_path / "test.db")
+    mode = cache._conn.execute("PRAGMA journal_mode").fetchone()[0]
+    cache.close()
+
+    assert mode == "wal"
+
+
+def test_memory_tier_serves_repeat_reads(tmp_path, monkeypatch):
+    """Test that a second read is served from the in-process LRU."""
+    cache = CacheManager(tmp_path / "test.db")
+    cache.set("mem1", Paper(paper_id="mem1", title="Memory"), "test")
+    cache.memory.clear()
+
+    first = cache.get("mem1")
+    monkeypatch.setattr(cache, "_select_rows", lambda ids: [])
+    second = cache.get("mem1")
+
+    assert second is first
+
+
+def test_memory_tier_counts_uncompressed_size(tmp_path):
+    """Test that LRU entries are sized by their JSON, not the compressed row."""
+    abstract = "the effect of sleep on memory " * 40
+    paper = Paper(paper_id="big", title="Big", abstract=abstract)
+    json_size = len(paper.model_dump_json(exclude_defaults=True))
+    cache = CacheManager(tmp_path / "test.db")
+
+    cache.set("big", paper, "test")
+    assert cache.memory.total_bytes == json_size
+
+    cache.memory.clear()
+    cache.get("big")
+    assert cache.memory.total_bytes == json_size
+    assert json_size > len(encode_paper(paper))
+
+
+def test_lru_cache_bounds_entries_and_bytes():
+    """Test that the LRU evicts oldest entries past either limit."""
+    lru = LRUCache(max_entries=2, max_bytes=100)
+    lru.put("a", 1, 10)
+    lru.put("b", 2, 10)
+    lru.get("a")
+    lru.put("c", 3, 10)
+
+    assert "b" not in lru
+    assert "a" in lru and "c" in lru
+
+    lru.put("d", 4, 95)
+    assert len(lru) == 1
+    assert lru.total_bytes == 95
+
+
+def test_disk_eviction_drops_least_recently_accessed(tmp_path):
+    """Test that the size limit evicts rows by last access, not insertion."""
+    abstract = " ".join(str(i * 7919 % 10007) for i in range(300))
+    row_size = len(encode_paper(Paper(paper_id="old", title="Old", abstract=abstract)))
+    cache = CacheManager(
+        tmp_path / "test.db",
+        memory_max_entries=0,
+        max_db_bytes=int(row_size * 2.5)
+    )
+    cache.set_many([Paper(paper_id="old", title="Old", abstract=abstract)], "test")
+    cache.set_many([Paper(paper_id="mid", title="Mid", abstract=abstract)], "test")
+    cache._conn.execute("UPDATE papers SET last_accessed = '2000-01-01 00:00:00'")
+    cache.get("old")
+
+    cache.set_many([Paper(paper_id="new", title="New", abstract=abstract)], "test")
+
+    remaining = set(cache.get_many(["old", "mid", "new"]))
+    assert remaining == {"old", "new"}
+
+
+def test_reads_buffer_access_times_until_next_write(tmp_path):
+    """Test that hits do not write to SQLite and their access times land with the next write."""
+    cache = CacheManager(tmp_path / "test.db")
+    cache.set("p1", Paper(paper_id="p1", title="One"), "test")
+    cache._conn.execute("UPDATE papers SET last_accessed = '2000-01-01 00:00:00'")
+    cache._conn.commit()
+    changes = cache._conn.total_changes
+
+    cache.get("p1")
+    cache.get_many(["p1", "missing"])
+
+    assert cache._conn.total_changes == changes
+    accessed = "SELECT last_accessed FROM papers WHERE paper_id = 'p1'"
+    assert cache._conn.execute(accessed).fetchone()[0] == "2000-01-01 00:00:00"
+
+    cache.set("p2", Paper(paper_id="p2", title="Two"), "test")
+    assert cache._conn.execute(accessed).fetchone()[0] > "2000-01-01 00:00:00"
+    cache.close()
+
+
+def test_legacy_json_db_is_migrated(tmp_path):
+    """Test that JSON-era databases are re-encoded into the binary format on open."""
+    db_path = tmp_path / "legacy.db"
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        "CREATE TABLE papers (paper_id TEXT PRIMARY KEY, source TEXT NOT NULL, "
+        "data_json TEXT NOT NULL, created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP)"
+    )
+    conn.execute(
+        "INSERT INTO papers (paper_id, source, data_json) VALUES (?, ?, ?)",
+        ("legacy1", "test", Paper(paper_id="legacy1", title="Legacy").model_dump_json())
+    )
+    conn.commit()
+    conn.close()
+
+    cache = CacheManager(db_path)
+
+    assert cache.get("legacy1").title == "Legacy"
+    columns = {row[1] for row in cache._conn.execute("PRAGMA table_info(papers)")}
+    assert "data" in columns and "data_json" not in columns
+    stored = cache._conn.execute("SELECT data FROM papers").fetchone()[0]
+    assert stored[0] == FORMAT_ZLIB_V1
+
+
+def test_search_results_round_trip_and_expire(tmp_path):
+    """Test that search result IDs are stored in order with their own TTL."""
+    cache = CacheManager(tmp_path / "test.db")
+    key = make_search_key("pubmed", "deep learning", retmax=10)
+    cache.set_search(key, "pubmed", "deep learning", ["3", "1", "2"], 120)
+
+    assert cache.get_search(key, ttl_days=7) == (["3", "1", "2"], 120)
+    assert cache.get_search(key, ttl_days=0) is None
+    assert cache.get_search("missing") is None
+
+
+def test_search_key_is_canonical():
+    """Test that whitespace and field order do not change the key."""
+    key = make_search_key("semantic_scholar", "deep  learning ", limit=10, fields="title,year")
+
+    assert key == make_search_key(
+        "semantic_scholar", "deep learning", fields="year, title", limit=10
+    )
+    assert key != make_search_key("semantic_scholar", "deep learning", limit=20, fields="title,year")
+    assert key != make_search_key("pubmed", "deep learning", limit=10, fields="title,year")
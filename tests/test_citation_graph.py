@@ -1,3 +1,4 @@
+import asyncio
 from datetime import datetime, timedelta, timezone
 from unittest.mock import AsyncMock, Mock
 
@@ -57,3 +58,153 @@ async def test_explore_two_levels_and_threshold():
     assert "seed1" in reference_calls
     assert "seed2" not in citation_calls
     assert "seed2" not in reference_calls
+
+
+@pytest.mark.asyncio
+async def test_explore_expands_level_concurrently_in_deterministic_order():
+    semantic_client = Mock()
+    seeds = [
+        Paper(paper_id=f"seed{i}", title=f"Seed {i}", citation_count=100)
+        for i in range(6)
+    ]
+    in_flight = 0
+    peak = 0
+
+    async def get_citations(paper_id: str, limit: int = 100):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        # Later seeds answer first, so arrival order is the reverse of seed order.
+        await asyncio.sleep(0.01 * (6 - int(paper_id[-1])))
+        in_flight -= 1
+        if paper_id == "seed3":
+            raise RuntimeError("boom")
+        return [Paper(paper_id=f"{paper_id}-c", title="Citation")]
+
+    async def get_references(paper_id: str, limit: int = 100):
+        return [Paper(paper_id=f"{paper_id}-r", title="Reference")]
+
+    semantic_client.get_citations = AsyncMock(side_effect=get_citations)
+    semantic_client.get_references = AsyncMock(side_effect=get_references)
+
+    explorer = CitationGraphExplorer(semantic_client=semantic_client, max_concurrent=3)
+    results = await explorer.explore(seeds, max_depth=1)
+
+    assert peak == 3
+    assert [paper.paper_id for paper in results] == [
+        "seed0-c", "seed0-r",
+        "seed1-c", "seed1-r",
+        "seed2-c", "seed2-r",
+        "seed4-c", "seed4-r",
+        "seed5-c", "seed5-r"
+    ]
+
+
+def _graph_client(graph, delay: float = 0.0):
+    semantic_client = Mock()
+
+    async def get_citations(paper_id: str, limit: int = 100):
+        await asyncio.sleep(delay)
+        return graph.get(paper_id, [])
+
+    async def get_references(paper_id: str, limit: int = 100):
+        return []
+
+    semantic_client.get_citations = AsyncMock(side_effect=get_citations)
+    semantic_client.get_references = AsyncMock(side_effect=get_references)
+    return semantic_client
+
+
+@pytest.mark.asyncio
+async def test_best_first_expands_highest_priority_within_expansion_budget():
+    graph = {
+        "seed": [
+            Paper(paper_id="low", title="Low", year=2000, citation_count=10),
+            Paper(paper_id="high", title="High", year=2020, citation_count=500)
+        ],
+        "high": [Paper(paper_id="high-child", title="High child", citation_count=1)],
+        "low": [Paper(paper_id="low-child", title="Low child", citation_count=1)]
+    }
+    semantic_client = _graph_client(graph)
+    explorer = CitationGraphExplorer(semantic_client=semantic_client, max_concurrent=1)
+
+    seed = Paper(paper_id="seed", title="Seed", citation_count=100)
+    results = await explorer.explore_best_first([seed], max_expansions=2)
+
+    expanded = [call.args[0] for call in semantic_client.get_citations.call_args_list]
+    assert expanded == ["seed", "high"]
+    assert [paper.paper_id for paper in results] == ["high", "low", "high-child"]
+
+
+@pytest.mark.asyncio
+async def test_best_first_stops_at_node_budget():
+    graph = {"seed": [Paper(paper_id=f"n{i}", title=f"N{i}") for i in range(10)]}
+    explorer = CitationGraphExplorer(semantic_client=_graph_client(graph))
+
+    results = await explorer.explore_best_first(
+        [Paper(paper_id="seed", title="Seed")],
+        max_nodes=3
+    )
+
+    assert [paper.paper_id for paper in results] == ["n0", "n1", "n2"]
+
+
+@pytest.mark.asyncio
+async def test_best_first_returns_partial_results_when_time_runs_out():
+    semantic_client = Mock()
+
+    async def get_citations(paper_id: str, limit: int = 100):
+        await asyncio.sleep(5.0 if paper_id == "slow" else 0.01)
+        return [Paper(paper_id=f"{paper_id}-child", title="Child")]
+
+    semantic_client.get_citations = AsyncMock(side_effect=get_citations)
+    semantic_client.get_references = AsyncMock(return_value=[])
+    explorer = CitationGraphExplorer(semantic_client=semantic_client)
+    seeds = [Paper(paper_id=f"fast{i}", title=f"Fast {i}") for i in range(7)]
+    seeds.append(Paper(paper_id="slow", title="Slow"))
+
+    results = await asyncio.wait_for(
+        explorer.explore_best_first(seeds, max_seconds=0.3),
+        timeout=2.0
+    )
+
+    # The slow expansion is abandoned; the fast ones in its batch are kept.
+    assert {paper.paper_id for paper in results} == {f"fast{i}-child" for i in range(7)}
+
+
+@pytest.mark.asyncio
+async def test_explore_records_citation_edges():
+    semantic_client = Mock()
+    semantic_client.get_citations = AsyncMock(
+        return_value=[Paper(paper_id="citing", title="Citing")]
+    )
+    semantic_client.get_references = AsyncMock(
+        return_value=[Paper(paper_id="cited", title="Cited")]
+    )
+    explorer = CitationGraphExplorer(semantic_client=semantic_client)
+
+    await explorer.explore([Paper(paper_id="seed", title="Seed", citation_count=100)], max_depth=1)
+    graph = explorer.graph()
+
+    assert graph.neighbors("citing") == ["seed"]
+    assert graph.neighbors("seed") == ["cited"]
+
+
+@pytest.mark.asyncio
+async def test_iter_related_streams_both_directions():
+    semantic_client = Mock()
+
+    async def iter_citations(paper_id, limit=100, total=None):
+        yield Paper(paper_id="citing", title="Citing")
+
+    async def iter_references(paper_id, limit=100, total=None):
+        yield Paper(paper_id="cited", title="Cited")
+
+    semantic_client.iter_citations = iter_citations
+    semantic_client.iter_references = iter_references
+    explorer = CitationGraphExplorer(semantic_client=semantic_client)
+
+    related = [paper.paper_id async for paper in explorer.iter_related(Paper(paper_id="seed", title="Seed"))]
+
+    assert sorted(related) == ["cited", "citing"]
+    assert set(explorer.edges) == {("citing", "seed"), ("seed", "cited")}
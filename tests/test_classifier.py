@@ -1,3 +1,4 @@
+import asyncio
 from unittest.mock import AsyncMock, Mock
 
 import pytest
@@ -88,3 +89,74 @@ async def test_badges_assigned_from_citations_and_journal_proxy():
     badges = result[0]["badges"]
     assert "HIGHLY CITED" in badges
     assert "RIGOROUS JOURNAL" in badges
+
+
+def _ambiguous_papers(count: int):
+    return [
+        Paper(paper_id=f"A{i}", title=f"Ambiguous study {i}", abstract="No keywords.")
+        for i in range(count)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_llm_fallback_runs_concurrently_up_to_the_limit():
+    in_flight = 0
+    peak = 0
+
+    async def complete(prompt, **kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return QwenResponse(content="Case Study", model="test")
+
+    qwen_client = Mock()
+    qwen_client.complete = AsyncMock(side_effect=complete)
+
+    classifier = StudyClassifier(max_concurrent=3)
+    result = await classifier.classify_studies(_ambiguous_papers(10), qwen_client)
+
+    assert [item["study_type"] for item in result] == ["Case Study"] * 10
+    assert peak == 3
+
+
+@pytest.mark.asyncio
+async def test_batched_mode_parses_json_and_retries_missing_items():
+    prompts = []
+
+    async def complete(prompt, **kwargs):
+        prompts.append(prompt)
+        if "each numbered paper" in prompt:
+            # Paper 1 is unreadable and paper 2 is left out.
+            return QwenResponse(
+                content='```json\n{"0": "RCT", "1": "unsure"}\n```',
+                model="test"
+            )
+        return QwenResponse(content="Opinion", model="test")
+
+    qwen_client = Mock()
+    qwen_client.complete = AsyncMock(side_effect=complete)
+    papers = _ambiguous_papers(3)
+    papers.insert(1, Paper(paper_id="K", title="A cohort study"))
+
+    classifier = StudyClassifier(batch_size=5)
+    result = await classifier.classify_studies(papers, qwen_client)
+
+    assert [item["study_type"] for item in result] == ["RCT", "Observational", "Opinion", "Opinion"]
+    assert len(prompts) == 3
+    assert "[2] Title: Ambiguous study 2" in prompts[0]
+
+
+@pytest.mark.asyncio
+async def test_batched_mode_falls_back_when_the_answer_is_not_json():
+    qwen_client = Mock()
+    qwen_client.complete = AsyncMock(
+        return_value=QwenResponse(content="Observational", model="test")
+    )
+
+    classifier = StudyClassifier(batch_size=4)
+    result = await classifier.classify_studies(_ambiguous_papers(2), qwen_client)
+
+    assert [item["study_type"] for item in result] == ["Observational", "Observational"]
+    assert qwen_client.complete.await_count == 3
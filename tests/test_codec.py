@@ -0,0 +1,51 @@
+import pytest
+
+from deep_research.api.models import Author, ExternalIds, Paper
+from deep_research.storage.codec import FORMAT_ZLIB_V1, decode_paper, encode_paper
+
+
+def _sample_paper():
+    return Paper(
+        paper_id="649def34f8be52c8b66281af98ae884c09aef38b",
+        title="Deep learning for medical image segmentation: a systematic review",
+        abstract=(
+            "Background: deep learning models are increasingly used in clinical imaging. "
+            "Methods: we performed a systematic review of studies published between 2015 "
+            "and 2023. Results: the proposed methods significantly improve performance "
+            "compared with existing approaches. Conclusions: further research is needed."
+        ),
+        year=2023,
+        authors=[Author(name="Jane Doe", author_id="123"), Author(name="John Roe")],
+        venue="Medical Image Analysis",
+        citation_count=42,
+        external_ids=ExternalIds(doi="10.1016/j.media.2023.01.001", pmid="36700001"),
+        publication_types=["JournalArticle", "Review"],
+        publication_date="2023-02-01"
+    )
+
+
+def test_round_trip_preserves_all_fields():
+    paper = _sample_paper()
+
+    encoded = encode_paper(paper)
+
+    assert encoded[0] == FORMAT_ZLIB_V1
+    assert decode_paper(encoded) == paper
+
+
+def test_encoding_is_smaller_than_json():
+    paper = _sample_paper()
+
+    assert len(encode_paper(paper)) < len(paper.model_dump_json()) / 2
+
+
+def test_decodes_legacy_json_payloads():
+    paper = _sample_paper()
+
+    assert decode_paper(paper.model_dump_json()) == paper
+    assert decode_paper(paper.model_dump_json().encode()) == paper
+
+
+def test_unknown_format_raises():
+    with pytest.raises(ValueError, match="Unknown cached paper format"):
+        decode_paper(b"\x7fgarbage")
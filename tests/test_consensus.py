@@ -1,9 +1,13 @@
+import asyncio
+import json
+import re
 from unittest.mock import Mock
 
 import pytest
 
 from deep_research.api.models import Paper, QwenResponse
 from deep_research.core.consensus import ConsensusAnalyzer
+from deep_research.storage.annotations import AnnotationStore
 
 
 def _make_papers(count: int):
@@ -18,13 +22,6 @@ async def test_quantify_consensus_percentages_and_confidence():
     papers = _make_papers(5)
     question = "Does it work?"
 
-    filter_answers = {
-        "Paper 1": "YES",
-        "Paper 2": "YES",
-        "Paper 3": "YES",
-        "Paper 4": "YES",
-        "Paper 5": "YES"
-    }
     stance_answers = {
         "Paper 1": "YES",
         "Paper 2": "NO",
@@ -32,16 +29,14 @@ async def test_quantify_consensus_percentages_and_confidence():
         "Paper 4": "POSSIBLY",
         "Paper 5": "YES"
     }
+    prompts = []
 
     async def complete(prompt: str, max_tokens: int = 4096, temperature: float = 0.7):
-        if prompt.startswith("Does the paper"):
-            for title, answer in filter_answers.items():
-                if title in prompt:
-                    return QwenResponse(content=answer, model="test")
-        if prompt.startswith("What is this paper's answer"):
-            for title, answer in stance_answers.items():
-                if title in prompt:
-                    return QwenResponse(content=answer, model="test")
+        prompts.append(prompt)
+        for title, answer in stance_answers.items():
+            if title in prompt:
+                verdict = {"relevant": True, "stance": answer}
+                return QwenResponse(content=json.dumps(verdict), model="test")
         return QwenResponse(content="NO", model="test")
 
     qwen_client = Mock()
@@ -57,6 +52,8 @@ async def test_quantify_consensus_percentages_and_confidence():
     assert result["mixed_percent"] == pytest.approx(20.0)
     assert result["possibly_percent"] == pytest.approx(20.0)
     assert result["confidence"] == pytest.approx(0.5)
+    # Relevance and stance come from one request per paper.
+    assert len(prompts) == 5
 
 
 @pytest.mark.asyncio
@@ -74,3 +71,130 @@ async def test_quantify_consensus_raises_when_insufficient_data():
 
     with pytest.raises(ValueError, match="INSUFFICIENT DATA"):
         await analyzer.quantify_consensus(papers, question, qwen_client)
+
+
+def _verdicts_for(prompt: str, verdicts: dict) -> dict:
+    """Answer a batched prompt with the verdict of each numbered paper it lists."""
+    entries = re.findall(r"\[(\d+)\] Title: (Paper \d+)", prompt)
+    return {index: verdicts[title] for index, title in entries if title in verdicts}
+
+
+@pytest.mark.asyncio
+async def test_quantify_consensus_bounds_concurrent_requests():
+    papers = _make_papers(12)
+    in_flight = 0
+    peak = 0
+
+    async def complete(prompt: str, max_tokens: int = 4096, temperature: float = 0.7):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return QwenResponse(content='{"relevant": true, "stance": "YES"}', model="test")
+
+    qwen_client = Mock()
+    qwen_client.complete = complete
+
+    analyzer = ConsensusAnalyzer(max_concurrent=3)
+    result = await analyzer.quantify_consensus(papers, "Does it work?", qwen_client)
+
+    assert result["total_papers"] == 12
+    assert result["yes_percent"] == pytest.approx(100.0)
+    assert peak == 3
+
+
+@pytest.mark.asyncio
+async def test_quantify_consensus_batches_and_retries_missing_papers():
+    papers = _make_papers(6)
+    verdicts = {
+        "Paper 1": {"relevant": True, "stance": "YES"},
+        "Paper 2": {"relevant": True, "stance": "NO"},
+        "Paper 3": {"relevant": False},
+        "Paper 4": {"relevant": True, "stance": "YES"},
+        "Paper 5": {"relevant": True, "stance": "MIXED"},
+        "Paper 6": {"relevant": True, "stance": "POSSIBLY"}
+    }
+    batch_prompts = []
+    single_prompts = []
+
+    async def complete(prompt: str, max_tokens: int = 4096, temperature: float = 0.7):
+        if "[0] Title:" in prompt:
+            batch_prompts.append(prompt)
+            # Leave Paper 4 out of its batch's answer.
+            answered = {title: v for title, v in verdicts.items() if title != "Paper 4"}
+            answer = _verdicts_for(prompt, answered)
+            return QwenResponse(content=json.dumps(answer), model="test")
+        single_prompts.append(prompt)
+        for title, verdict in verdicts.items():
+            if f"Title: {title}\n" in prompt:
+                return QwenResponse(content=json.dumps(verdict), model="test")
+        return QwenResponse(content="NO", model="test")
+
+    qwen_client = Mock()
+    qwen_client.complete = complete
+
+    analyzer = ConsensusAnalyzer(batch_size=3)
+    result = await analyzer.quantify_consensus(papers, "Does it work?", qwen_client)
+
+    assert len(batch_prompts) == 2
+    assert len(single_prompts) == 1
+    assert "Paper 4" in single_prompts[0]
+    assert result["total_papers"] == 5
+    assert result["yes_percent"] == pytest.approx(40.0)
+    assert result["no_percent"] == pytest.approx(20.0)
+
+
+@pytest.mark.asyncio
+async def test_quantify_consensus_falls_back_to_separate_questions_and_reuses_verdicts():
+    papers = _make_papers(5)
+    prompts = []
+
+    async def complete(prompt: str, max_tokens: int = 4096, temperature: float = 0.7):
+        prompts.append(prompt)
+        if prompt.startswith("Does the paper"):
+            return QwenResponse(content="YES", model="test")
+        if prompt.startswith("What is this paper's answer"):
+            return QwenResponse(content="MIXED", model="test")
+        return QwenResponse(content="I cannot say.", model="test")
+
+    qwen_client = Mock()
+    qwen_client.complete = complete
+
+    annotations = AnnotationStore()
+    analyzer = ConsensusAnalyzer(annotations=annotations)
+    result = await analyzer.quantify_consensus(papers, "Does it work?", qwen_client)
+
+    assert result["mixed_percent"] == pytest.approx(100.0)
+    assert len(prompts) == 15
+    assert annotations.get("P1", "stance", "2", "Does it work?") == "MIXED"
+
+    prompts.clear()
+    again = await analyzer.quantify_consensus(papers, "Does it work?", qwen_client)
+    assert again == result
+    assert prompts == []
+
+
+@pytest.mark.asyncio
+async def test_batched_prompt_truncates_abstracts():
+    papers = [
+        Paper(paper_id=f"P{i}", title=f"Paper {i}", abstract="x" * 5000 + "TAIL")
+        for i in range(1, 6)
+    ]
+    prompts = []
+
+    async def complete(prompt: str, max_tokens: int = 4096, temperature: float = 0.7):
+        prompts.append(prompt)
+        verdict = {"relevant": True, "stance": "YES"}
+        answer = {str(i): verdict for i in range(5)}
+        return QwenResponse(content=json.dumps(answer), model="test")
+
+    qwen_client = Mock()
+    qwen_client.complete = complete
+
+    analyzer = ConsensusAnalyzer(batch_size=5)
+    result = await analyzer.quantify_consensus(papers, "Does it work?", qwen_client)
+
+    assert result["total_papers"] == 5
+    assert len(prompts) == 1
+    assert "TAIL" not in prompts[0]
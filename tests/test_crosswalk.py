@@ -0,0 +1,42 @@
+from deep_research.api.models import ExternalIds, Paper
+from deep_research.storage.crosswalk import IdentityCrosswalk, paper_identifiers
+
+
+def test_link_groups_identifiers(tmp_path):
+    crosswalk = IdentityCrosswalk(tmp_path / "crosswalk.db")
+    cluster = crosswalk.link([("doi", "10.1/a"), ("pmid", "111")])
+
+    assert crosswalk.resolve(("doi", "10.1/a")) == cluster
+    assert crosswalk.resolve(("pmid", "111")) == cluster
+    assert crosswalk.resolve(("pmid", "222")) is None
+    assert crosswalk.equivalents(("pmid", "111")) == {("doi", "10.1/a"), ("pmid", "111")}
+
+
+def test_link_merges_existing_clusters(tmp_path):
+    crosswalk = IdentityCrosswalk(tmp_path / "crosswalk.db")
+    crosswalk.link([("doi", "10.1/a"), ("pmid", "111")])
+    crosswalk.link([("s2_id", "s2-1"), ("arxiv", "2101.00001")])
+
+    cluster = crosswalk.link([("pmid", "111"), ("s2_id", "s2-1")])
+
+    assert len(crosswalk.equivalents(("arxiv", "2101.00001"))) == 4
+    assert {crosswalk.resolve(key) for key in crosswalk.equivalents(("doi", "10.1/a"))} == {cluster}
+
+
+def test_crosswalk_persists_across_instances(tmp_path):
+    IdentityCrosswalk(tmp_path / "crosswalk.db").link([("doi", "10.1/a"), ("pmid", "111")])
+
+    reopened = IdentityCrosswalk(tmp_path / "crosswalk.db")
+
+    assert len(reopened) == 2
+    assert reopened.resolve(("doi", "10.1/a")) == reopened.resolve(("pmid", "111"))
+
+
+def test_paper_identifiers_lowercase_doi():
+    paper = Paper(
+        paper_id="P1",
+        title="Paper",
+        external_ids=ExternalIds(doi="10.1/ABC", pmid="111")
+    )
+
+    assert paper_identifiers(paper) == [("doi", "10.1/abc"), ("pmid", "111")]
@@ -1,5 +1,12 @@
+import difflib
+import random
+import string
+
+import pytest
+
 from deep_research.api.models import ExternalIds, Paper
-from deep_research.core.deduplication import DeduplicationEngine
+from deep_research.core.deduplication import DeduplicationEngine, DeduplicationIndex, TitleIndex
+from deep_research.storage.crosswalk import IdentityCrosswalk
 
 
 def test_deduplicate_by_external_ids_keeps_first():
@@ -46,3 +53,179 @@ def test_deduplicate_by_title_similarity():
     result = DeduplicationEngine().deduplicate(papers)
 
     assert [paper.paper_id for paper in result] == ["P1", "P3"]
+
+
+def _reference_deduplicate_titles(titles):
+    """The original full pairwise scan, kept as the behavioural reference."""
+    kept = []
+    for title in titles:
+        if not any(difflib.SequenceMatcher(None, title, other).ratio() > 0.95 for other in kept):
+            kept.append(title)
+    return kept
+
+
+def _perturb(rng, title):
+    chars = list(title)
+    for _ in range(rng.randint(1, 6)):
+        position = rng.randrange(len(chars) + 1)
+        operation = rng.choice(["insert", "delete", "replace"])
+        if operation == "insert" or not chars:
+            chars.insert(position, rng.choice(string.ascii_lowercase + " "))
+        elif operation == "delete":
+            del chars[min(position, len(chars) - 1)]
+        else:
+            chars[min(position, len(chars) - 1)] = rng.choice(string.ascii_lowercase)
+    return "".join(chars)
+
+
+def test_title_index_matches_full_scan():
+    rng = random.Random(7)
+    vocabulary = [
+        "deep", "learning", "for", "clinical", "outcomes", "a", "survey", "of",
+        "neural", "networks", "in", "medicine", "randomized", "trial", "the", "effect",
+        "on", "patients", "with", "diabetes", "meta", "analysis", "review"
+    ]
+    titles = ["", "", "ab", "abc", "abd", "x"]
+    for _ in range(300):
+        if titles and rng.random() < 0.4:
+            titles.append(_perturb(rng, rng.choice(titles)))
+        else:
+            titles.append(" ".join(rng.choice(vocabulary) for _ in range(rng.randint(1, 14))))
+    rng.shuffle(titles)
+
+    index = TitleIndex()
+    kept = []
+    for title in titles:
+        if not index.contains_similar(title):
+            kept.append(title)
+            index.add(title)
+
+    assert kept == _reference_deduplicate_titles(titles)
+    assert len(kept) < len(titles)
+
+
+def test_duplicates_are_merged_into_the_richest_record():
+    papers = [
+        Paper(
+            paper_id="s2",
+            title="Exercise and cognition in older adults",
+            year=2021,
+            citation_count=40,
+            external_ids=ExternalIds(doi="10.1/ex", s2_id="s2")
+        ),
+        Paper(
+            paper_id="PMID:111",
+            title="Exercise and cognition in older adults.",
+            abstract="A randomized trial of exercise.",
+            publication_date="2021-05-02",
+            publication_types=["Randomized Controlled Trial"],
+            external_ids=ExternalIds(pmid="111")
+        )
+    ]
+
+    result = DeduplicationEngine().deduplicate(papers)
+
+    assert len(result) == 1
+    merged = result[0]
+    assert merged.paper_id == "s2"
+    assert merged.abstract == "A randomized trial of exercise."
+    assert merged.citation_count == 40
+    assert merged.publication_date == "2021-05-02"
+    assert merged.publication_types == ["Randomized Controlled Trial"]
+    assert merged.external_ids == ExternalIds(doi="10.1/ex", pmid="111", s2_id="s2")
+
+
+def test_shared_identifiers_merge_transitively():
+    papers = [
+        Paper(paper_id="A", title="Alpha", external_ids=ExternalIds(doi="10.1/a")),
+        Paper(paper_id="B", title="Beta", external_ids=ExternalIds(pmid="1")),
+        Paper(paper_id="C", title="Gamma", external_ids=ExternalIds(doi="10.1/A", pmid="1"))
+    ]
+
+    result = DeduplicationEngine().deduplicate(papers)
+
+    assert [paper.paper_id for paper in result] == ["A"]
+    assert result[0].external_ids.pmid == "1"
+
+
+def test_crosswalk_links_records_across_runs(tmp_path):
+    crosswalk = IdentityCrosswalk(tmp_path / "crosswalk.db")
+    DeduplicationEngine(crosswalk=crosswalk).deduplicate([
+        Paper(paper_id="S1", title="First title", external_ids=ExternalIds(doi="10.1/x", pmid="9"))
+    ])
+
+    engine = DeduplicationEngine(crosswalk=IdentityCrosswalk(tmp_path / "crosswalk.db"))
+    result = engine.deduplicate([
+        Paper(paper_id="S1", title="A retitled record", external_ids=ExternalIds(doi="10.1/x")),
+        Paper(paper_id="PMID:9", title="Unrelated wording", external_ids=ExternalIds(pmid="9"))
+    ])
+
+    assert [paper.paper_id for paper in result] == ["S1"]
+    assert result[0].external_ids.pmid == "9"
+
+
+def test_titles_do_not_merge_records_with_different_identifiers():
+    title = "Long-term effects of aerobic exercise on memory in older adults, Part "
+    papers = [
+        Paper(paper_id="A", title=title + "1", external_ids=ExternalIds(doi="10.1/part1")),
+        Paper(paper_id="B", title=title + "2", external_ids=ExternalIds(doi="10.1/part2")),
+        Paper(paper_id="C", title=title + "1.", external_ids=ExternalIds(pmid="5"))
+    ]
+
+    result = DeduplicationEngine().deduplicate(papers)
+
+    # C has no DOI to conflict with, so its title still joins it to A.
+    assert [paper.paper_id for paper in result] == ["A", "B"]
+    assert result[0].external_ids.pmid == "5"
+
+
+def test_title_matches_are_not_written_to_the_crosswalk(tmp_path):
+    crosswalk = IdentityCrosswalk(tmp_path / "crosswalk.db")
+    result = DeduplicationEngine(crosswalk=crosswalk).deduplicate([
+        Paper(paper_id="S1", title="Sleep and memory", external_ids=ExternalIds(doi="10.1/x")),
+        Paper(paper_id="PMID:9", title="Sleep and memory.", external_ids=ExternalIds(pmid="9")),
+        Paper(paper_id="S1", title="Sleep & memory", external_ids=ExternalIds(arxiv="2101.1"))
+    ])
+
+    assert [paper.paper_id for paper in result] == ["S1"]
+    assert crosswalk.equivalents(("doi", "10.1/x")) == {("doi", "10.1/x"), ("arxiv", "2101.1")}
+    assert crosswalk.resolve(("pmid", "9")) is None
+
+
+def test_index_add_reports_new_papers_across_calls():
+    index = DeduplicationIndex()
+    first = Paper(paper_id="P1", title="Sleep and memory", external_ids=ExternalIds(doi="10.1/a"))
+
+    assert index.add(first)
+    assert index.add(Paper(paper_id="P2", title="Diet and mood"))
+    assert not index.add(Paper(paper_id="PMID:5", title="Sleep and memory."))
+    assert not index.add(
+        Paper(paper_id="P9", title="Other", external_ids=ExternalIds(doi="10.1/A"))
+    )
+    assert not index.add(Paper(paper_id="P2", title="Diet and mood (preprint)"))
+    assert len(index) == 2
+
+
+def test_index_save_and_load_round_trip(tmp_path):
+    index = DeduplicationIndex()
+    index.add(Paper(paper_id="P1", title="Sleep and memory", external_ids=ExternalIds(pmid="1")))
+    index.add(Paper(paper_id="P2", title="Diet and mood", external_ids=ExternalIds(doi="10.1/b")))
+    # Links the two earlier groups.
+    index.add(
+        Paper(paper_id="P3", title="Bridge", external_ids=ExternalIds(pmid="1", doi="10.1/b"))
+    )
+    index.save(tmp_path / "index.json")
+
+    restored = DeduplicationIndex.load(tmp_path / "index.json")
+
+    assert len(restored) == 1
+    assert not restored.add(Paper(paper_id="X", title="Diet and mood!"))
+    assert restored.add(Paper(paper_id="Y", title="Something else entirely"))
+
+
+def test_index_load_rejects_unknown_version(tmp_path):
+    path = tmp_path / "index.json"
+    path.write_text('{"version": 99}')
+
+    with pytest.raises(ValueError):
+        DeduplicationIndex.load(path)
@@ -0,0 +1,90 @@
+import sqlite3
+
+import numpy as np
+import pytest
+from deep_research.api.models import Paper
+from deep_research.storage.edge_store import CSRGraph, EdgeStore
+
+
+def test_add_and_get_edges_in_both_directions(tmp_path):
+    store = EdgeStore(tmp_path / "edges.db")
+    store.add_edges("p1", "references", ["r1", "r2"], limit=100)
+    store.add_edges("p1", "citations", ["c1"], limit=100)
+
+    assert store.get_linked("p1", "references", limit=100) == ["r1", "r2"]
+    assert store.get_linked("p1", "citations", limit=100) == ["c1"]
+    assert store.get_linked("p1", "references", limit=1) == ["r1"]
+
+
+def test_linked_paper_records_round_trip(tmp_path):
+    store = EdgeStore(tmp_path / "edges.db")
+    store.add_linked_papers([
+        Paper(paper_id="r1", title="First", year=2020, citation_count=3),
+        Paper(paper_id="r2", title="Second")
+    ])
+
+    papers = store.get_linked_papers(["r2", "r1", "unknown"])
+
+    assert set(papers) == {"r1", "r2"}
+    first = papers["r1"]
+    assert (first.title, first.year, first.citation_count) == ("First", 2020, 3)
+    assert papers["r2"].external_ids.s2_id == "r2"
+
+
+def test_unfetched_paper_is_a_miss(tmp_path):
+    store = EdgeStore(tmp_path / "edges.db")
+    # Edges learned from another paper's fetch do not make p1's list complete.
+    store.add_edges("c1", "references", ["p1"], limit=100)
+
+    assert store.get_linked("p1", "citations", limit=100) is None
+
+
+def test_truncated_fetch_does_not_cover_larger_limit(tmp_path):
+    store = EdgeStore(tmp_path / "edges.db")
+    store.add_edges("full", "references", ["r1", "r2"], limit=2)
+    store.add_edges("short", "references", ["r1"], limit=2)
+
+    assert store.get_linked("full", "references", limit=5) is None
+    assert store.get_linked("short", "references", limit=5) == ["r1"]
+
+
+def test_stale_fetch_is_a_miss(tmp_path):
+    store = EdgeStore(tmp_path / "edges.db")
+    store.add_edges("p1", "references", ["r1"], limit=100)
+
+    conn = sqlite3.connect(tmp_path / "edges.db")
+    with conn:
+        conn.execute("UPDATE edge_fetches SET fetched_at = datetime('now', '-10 days')")
+    conn.close()
+
+    assert store.get_linked("p1", "references", limit=100, ttl_days=30) == ["r1"]
+    assert store.get_linked("p1", "references", limit=100, ttl_days=7) is None
+
+
+def test_unknown_direction_raises(tmp_path):
+    store = EdgeStore(tmp_path / "edges.db")
+    with pytest.raises(ValueError, match="Unknown edge direction"):
+        store.add_edges("p1", "cocitations", ["r1"], limit=100)
+
+
+def test_to_csr_exports_adjacency(tmp_path):
+    store = EdgeStore(tmp_path / "edges.db")
+    store.add_edges("a", "references", ["b", "c"], limit=100)
+    store.add_edges("c", "citations", ["b"], limit=100)
+
+    graph = store.to_csr()
+
+    assert graph.node_ids == ["a", "b", "c"]
+    assert graph.num_edges == 3
+    assert graph.neighbors("a") == ["b", "c"]
+    assert graph.neighbors("b") == ["c"]
+    assert graph.neighbors("c") == []
+    assert graph.out_degree().tolist() == [2, 1, 0]
+    assert graph.transpose().neighbors("c") == ["a", "b"]
+
+
+def test_csr_from_edges_sorts_rows():
+    graph = CSRGraph.from_edges(["x", "y"], np.array([1, 0, 1]), np.array([0, 1, 1]))
+
+    assert graph.indptr.tolist() == [0, 1, 3]
+    assert graph.indices.tolist() == [1, 0, 1]
@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+
+from deep_research.storage.embedding_store import EmbeddingStore, text_hash
+
+
+def test_round_trip_returns_memory_mapped_views(tmp_path):
+    store = EmbeddingStore(tmp_path / "embeddings")
+    keys = [("P1", text_hash("alpha")), ("P2", text_hash("beta"))]
+    store.add_many("model", keys, np.array([[1.0, 0.0, 0.5], [0.0, 1.0, 0.25]]))
+
+    vectors = store.get_many("model", keys)
+
+    np.testing.assert_array_equal(vectors[keys[0]], np.array([1.0, 0.0, 0.5], dtype=np.float16))
+    np.testing.assert_array_equal(vectors[keys[1]], np.array([0.0, 1.0, 0.25], dtype=np.float16))
+    assert not vectors[keys[0]].flags.owndata
+    assert not vectors[keys[0]].flags.writeable
+
+
+def test_changed_text_or_model_misses(tmp_path):
+    store = EmbeddingStore(tmp_path / "embeddings")
+    store.add_many("model", [("P1", text_hash("old"))], np.ones((1, 2)))
+
+    assert store.get_many("model", [("P1", text_hash("new"))]) == {}
+    assert store.get_many("other-model", [("P1", text_hash("old"))]) == {}
+
+    store.add_many("model", [("P1", text_hash("new"))], np.zeros((1, 2)))
+    vectors = store.get_many("model", [("P1", text_hash("new"))])
+    np.testing.assert_array_equal(vectors[("P1", text_hash("new"))], np.zeros(2))
+
+
+def test_vectors_persist_across_instances(tmp_path):
+    key = ("P1", text_hash("alpha"))
+    EmbeddingStore(tmp_path / "embeddings").add_many("org/model", [key], np.full((1, 4), 0.5))
+
+    vectors = EmbeddingStore(tmp_path / "embeddings").get_many("org/model", [key])
+
+    np.testing.assert_array_equal(vectors[key], np.full(4, 0.5))
+
+
+def test_add_rejects_mismatched_dimension(tmp_path):
+    store = EmbeddingStore(tmp_path / "embeddings")
+    store.add_many("model", [("P1", "h1")], np.ones((1, 3)))
+
+    with pytest.raises(ValueError):
+        store.add_many("model", [("P2", "h2")], np.ones((1, 4)))
+    with pytest.raises(ValueError):
+        store.add_many("model", [("P2", "h2"), ("P3", "h3")], np.ones((1, 3)))
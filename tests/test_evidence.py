@@ -49,7 +49,33 @@ async def test_extract_evidence_strength_and_filtering():
     assert strengths["P1"] == "STRONG"
     assert strengths["P2"] == "MODERATE"
     assert result[0]["claims"] == ["claim 1"]
-    assert qwen_client.complete.await_count == 4
+    # Claims are only extracted for papers that are not rated WEAK.
+    assert qwen_client.complete.await_count == 2
     assert qwen_client.complete.call_args_list[0].args[0] == (
         "Extract 1-3 key findings from this paper. Title: RCT Study. Abstract: A. Return as JSON array."
     )
+
+
+@pytest.mark.asyncio
+async def test_low_cited_papers_are_neither_classified_nor_extracted():
+    papers = [
+        Paper(paper_id="P1", title="Ambiguous", abstract="A", citation_count=10),
+        Paper(paper_id="P2", title="Ambiguous", abstract="B", citation_count=49),
+        Paper(paper_id="P3", title="Cited", abstract="C", citation_count=60)
+    ]
+    classified = []
+
+    class RecordingClassifier(StubClassifier):
+        async def classify_studies(self, papers, qwen_client):
+            classified.extend(paper.paper_id for paper in papers)
+            return await super().classify_studies(papers, qwen_client)
+
+    qwen_client = Mock()
+    qwen_client.complete = AsyncMock(return_value=QwenResponse(content='["claim"]', model="test"))
+
+    extractor = EvidenceExtractor(classifier=RecordingClassifier({"P3": "Observational"}))
+    result = await extractor.extract_evidence(papers, qwen_client)
+
+    assert classified == ["P3"]
+    assert [item["paper"].paper_id for item in result] == ["P3"]
+    qwen_client.complete.assert_awaited_once()
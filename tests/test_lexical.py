@@ -0,0 +1,96 @@
+import random
+import sys
+import types
+from typing import Any, cast
+
+import pytest
+
+from deep_research.api.models import Paper
+
+
+def _install_sentence_transformers_stub() -> None:
+    if "sentence_transformers" in sys.modules:
+        return
+
+    stub = types.ModuleType("sentence_transformers")
+    cast(Any, stub).SentenceTransformer = object
+    cast(Any, stub).util = types.SimpleNamespace(cos_sim=lambda *args, **kwargs: [])
+    sys.modules["sentence_transformers"] = stub
+
+
+_install_sentence_transformers_stub()
+
+from deep_research.core.lexical import LexicalPrefilter, bm25_scores
+
+
+class CountingScorer:
+    """Treats papers about sleep as relevant and counts every paper it embeds."""
+
+    def __init__(self):
+        self.embedded = 0
+
+    def paper_text(self, paper: Paper) -> str:
+        return paper.title
+
+    async def score(self, query, papers):
+        self.embedded += len(papers)
+        return [
+            0.9 if "sleep" in paper.title or "slumber" in paper.title else 0.1
+            for paper in papers
+        ]
+
+    async def score_papers(self, query, papers, threshold: float = 0.6):
+        scores = await self.score(query, papers)
+        return [paper for paper, score in zip(papers, scores) if score >= threshold]
+
+
+def _pool(size: int, relevant: int, seed: int = 0):
+    rng = random.Random(seed)
+    filler = ["diet", "exercise", "mood", "cohort", "trial", "outcomes", "adults", "risk"]
+    papers = []
+    for i in range(size):
+        words = rng.sample(filler, 4)
+        if i < relevant:
+            # A few relevant papers share no words with the query.
+            words.append("slumber" if i % 10 == 0 else "sleep quality")
+        papers.append(Paper(paper_id=f"P{i}", title=" ".join(words)))
+    rng.shuffle(papers)
+    return papers
+
+
+def test_bm25_prefers_documents_with_rare_query_terms():
+    scores = bm25_scores(
+        "sleep memory",
+        ["sleep and memory", "memory of diet", "diet and mood", "sleep sleep memory memory"]
+    )
+
+    assert scores[2] == 0
+    assert scores[0] > scores[1]
+    assert scores.argmax() in (0, 3)
+
+
+@pytest.mark.asyncio
+async def test_screen_embeds_a_fraction_of_a_large_pool():
+    papers = _pool(5000, relevant=100)
+    scorer = CountingScorer()
+    prefilter = LexicalPrefilter(recall_target=0.95, sample_size=200, min_candidates=100)
+
+    kept = await prefilter.screen("sleep quality in adults", papers, scorer)
+
+    assert scorer.embedded <= 500
+    recall = await prefilter.measure_recall("sleep quality in adults", papers, CountingScorer())
+    # Only the "slumber" papers, with no query term at all, may be lost.
+    assert recall >= 0.9
+    assert len(kept) == round(recall * 100)
+
+
+@pytest.mark.asyncio
+async def test_small_pools_are_scored_in_full():
+    papers = _pool(250, relevant=20)
+    scorer = CountingScorer()
+
+    prefilter = LexicalPrefilter(sample_size=200, min_candidates=100)
+    kept = await prefilter.screen("sleep", papers, scorer)
+
+    assert scorer.embedded == 250
+    assert len(kept) == 20
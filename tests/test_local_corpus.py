@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+from deep_research.api.local_corpus import LocalCorpusClient
+from deep_research.api.models import Paper
+from deep_research.storage.cache import CacheManager
+from deep_research.storage.embedding_store import DEFAULT_MODEL, EmbeddingStore, text_hash
+
+
+class AxisModel:
+    """Embeds the query onto a fixed axis so the nearest papers are known."""
+
+    def __init__(self, vector):
+        self.vector = np.asarray(vector, dtype=float)
+        self.encode_calls = []
+
+    def encode(self, text):
+        self.encode_calls.append(text)
+        return self.vector
+
+
+@pytest.mark.asyncio
+async def test_search_papers_returns_nearest_cached_papers(tmp_path):
+    cache = CacheManager(tmp_path / "cache.db")
+    store = EmbeddingStore(tmp_path / "embeddings")
+    papers = [Paper(paper_id=f"P{i}", title=f"Paper {i}") for i in range(3)]
+    cache.set_many(papers, "semantic_scholar")
+    store.add_many(
+        DEFAULT_MODEL,
+        [(paper.paper_id, text_hash(paper.title)) for paper in papers],
+        np.array([[1.0, 0.0], [0.6, 0.8], [0.0, 1.0]])
+    )
+
+    model = AxisModel([1.0, 0.1])
+    client = LocalCorpusClient(cache, store, model=model, nprobe=3)
+    result = await client.search_papers("query", limit=2)
+
+    assert [paper.paper_id for paper in result.papers] == ["P0", "P1"]
+    assert result.total == 3
+    assert model.encode_calls == ["query"]
+
+    offset_result = await client.search_papers("query", limit=2, offset=2)
+    assert [paper.paper_id for paper in offset_result.papers] == ["P2"]
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_refresh_picks_up_new_embeddings(tmp_path):
+    cache = CacheManager(tmp_path / "cache.db")
+    store = EmbeddingStore(tmp_path / "embeddings")
+    client = LocalCorpusClient(cache, store, model=AxisModel([1.0, 0.0]))
+
+    assert (await client.search_papers("query")).papers == []
+
+    cache.set_many([Paper(paper_id="P1", title="New")], "pubmed")
+    store.add_many(DEFAULT_MODEL, [("P1", text_hash("New"))], np.array([[1.0, 0.0]]))
+    await client.refresh()
+
+    assert [paper.paper_id for paper in (await client.search_papers("query")).papers] == ["P1"]
+    await client.close()
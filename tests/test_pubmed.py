@@ -2,6 +2,8 @@ import pytest
 import httpx
 import respx
 from deep_research.api.pubmed import PubMedClient
+from deep_research.storage.async_cache import AsyncCacheManager
+from deep_research.storage.cache import CacheManager
 
 
 @pytest.mark.asyncio
@@ -60,3 +62,66 @@ async def test_pubmed_fetch_details():
     assert len(papers) == 1
     assert papers[0].title == "Test Article"
     assert papers[0].abstract == "Test abstract text"
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_pubmed_search_served_from_cache(tmp_path):
+    client = PubMedClient(cache=CacheManager(tmp_path / "cache.db"))
+
+    route = respx.get("https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esearch.fcgi").mock(
+        return_value=httpx.Response(200, json={
+            "esearchresult": {"count": "2", "idlist": ["12345", "67890"]}
+        })
+    )
+
+    first = await client.search("machine learning", max_results=10)
+    second = await client.search("machine learning", max_results=10)
+
+    assert route.call_count == 1
+    assert first == second == ["12345", "67890"]
+
+
+def _efetch_xml(*records):
+    articles = "".join(
+        f"<PubmedArticle><MedlineCitation><PMID>{pmid}</PMID><Article>"
+        f"<ArticleTitle>{title}</ArticleTitle></Article></MedlineCitation></PubmedArticle>"
+        for pmid, title in records
+    )
+    return f"<PubmedArticleSet>{articles}</PubmedArticleSet>"
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_pubmed_fetch_details_only_requests_uncached(tmp_path):
+    client = PubMedClient(cache=CacheManager(tmp_path / "cache.db"))
+
+    route = respx.get("https://eutils.ncbi.nlm.nih.gov/entrez/eutils/efetch.fcgi").mock(
+        side_effect=[
+            httpx.Response(200, text=_efetch_xml(("111", "First"))),
+            httpx.Response(200, text=_efetch_xml(("222", "Second")))
+        ]
+    )
+
+    await client.fetch_details(["111"])
+    papers = await client.fetch_details(["222", "111"])
+
+    assert route.call_count == 2
+    assert route.calls[1].request.url.params["id"] == "222"
+    assert [paper.paper_id for paper in papers] == ["PMID:222", "PMID:111"]
+    assert papers[1].title == "First"
+
+
+@pytest.mark.asyncio
+async def test_close_stops_the_cache_thread_it_created(tmp_path):
+    cache = CacheManager(tmp_path / "cache.db")
+    owned = PubMedClient(cache=cache)
+    shared_facade = AsyncCacheManager(cache)
+    borrowing = PubMedClient(cache=shared_facade)
+
+    await owned.close()
+    await borrowing.close()
+
+    assert owned.cache._executor._shutdown
+    assert not shared_facade._executor._shutdown
+    await shared_facade.close()
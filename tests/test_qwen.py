@@ -3,6 +3,7 @@ import httpx
 import respx
 from deep_research.api.qwen import QwenClient
 from deep_research.config import APIConfig
+from deep_research.storage.cache import CacheManager
 
 
 @pytest.fixture
@@ -63,3 +64,55 @@ async def test_qwen_invalid_api_key(qwen_config):
     
     with pytest.raises(Exception, match="401|Invalid API key|Unauthorized"):
         await client.complete("Test prompt")
+
+
+def _completion(content: str):
+    return httpx.Response(200, json={
+        "choices": [{"message": {"content": content}}],
+        "model": "qwen/qwen3-max",
+        "usage": {}
+    })
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_qwen_cached_across_clients(qwen_config, tmp_path):
+    route = respx.post("https://test.api.com/v1/chat/completions").mock(
+        side_effect=[_completion("First"), _completion("Second"), _completion("Third")]
+    )
+
+    first_client = QwenClient(qwen_config, cache=CacheManager(tmp_path / "cache.db"))
+    first = await first_client.complete("Classify this", temperature=0.0)
+    await first_client.close()
+
+    second_client = QwenClient(qwen_config, cache=CacheManager(tmp_path / "cache.db"))
+    repeat = await second_client.complete("Classify this", temperature=0.0)
+    new_version = await second_client.complete(
+        "Classify this", temperature=0.0, prompt_version="v2"
+    )
+
+    assert first.content == repeat.content == "First"
+    assert new_version.content == "Second"
+    assert route.call_count == 2
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_qwen_skips_cache_above_max_temperature(qwen_config, tmp_path):
+    route = respx.post("https://test.api.com/v1/chat/completions").mock(
+        side_effect=[_completion("A"), _completion("B"), _completion("C"), _completion("D")]
+    )
+    client = QwenClient(
+        qwen_config,
+        cache=CacheManager(tmp_path / "cache.db"),
+        cache_max_temperature=0.2
+    )
+
+    sampled = [await client.complete("Brainstorm", temperature=0.9) for _ in range(2)]
+    forced = [
+        await client.complete("Brainstorm", temperature=0.9, use_cache=True) for _ in range(2)
+    ]
+
+    assert [response.content for response in sampled] == ["A", "B"]
+    assert [response.content for response in forced] == ["C", "C"]
+    assert route.call_count == 3
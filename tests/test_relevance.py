@@ -1,10 +1,14 @@
+import asyncio
 import sys
+import threading
 import types
 from typing import Any, cast
 
+import numpy as np
 import pytest
 
 from deep_research.api.models import Paper
+from deep_research.storage.embedding_store import EmbeddingStore
 
 
 def _install_sentence_transformers_stub() -> None:
@@ -41,6 +45,7 @@ async def test_score_papers_filters_and_sorts(monkeypatch):
     def fake_cos_sim(query_embedding, paper_embeddings):
         return [[0.2, 0.75, 0.65]]
 
+    monkeypatch.setattr(relevance, "_models", {})
     monkeypatch.setattr(relevance, "SentenceTransformer", fake_transformer)
     monkeypatch.setattr(relevance.util, "cos_sim", fake_cos_sim)
 
@@ -56,3 +61,92 @@ async def test_score_papers_filters_and_sorts(monkeypatch):
     assert [paper.paper_id for paper in result] == ["P2", "P3"]
     assert dummy_model.encode_calls[0] == "test query"
     assert dummy_model.encode_calls[1] == ["Alpha A1", "Beta", "Gamma G"]
+
+
+def test_model_is_loaded_lazily_and_shared(monkeypatch):
+    loaded = []
+
+    def fake_transformer(name):
+        loaded.append(name)
+        return DummyModel()
+
+    monkeypatch.setattr(relevance, "_models", {})
+    monkeypatch.setattr(relevance, "SentenceTransformer", fake_transformer)
+
+    first = relevance.RelevanceScorer()
+    second = relevance.RelevanceScorer()
+    assert loaded == []
+
+    assert first.model is second.model
+    assert loaded == [relevance.DEFAULT_MODEL]
+
+
+@pytest.mark.asyncio
+async def test_score_papers_encodes_batches_off_the_event_loop(monkeypatch):
+    loop_thread = threading.get_ident()
+    encode_threads = []
+
+    class ThreadRecordingModel(DummyModel):
+        def encode(self, texts, convert_to_tensor: bool = True):
+            encode_threads.append(threading.get_ident())
+            return super().encode(texts, convert_to_tensor)
+
+    def fake_cos_sim(query_embedding, paper_embeddings):
+        return [[0.9] * len(paper_embeddings)]
+
+    monkeypatch.setattr(relevance.util, "cos_sim", fake_cos_sim)
+    model = ThreadRecordingModel()
+    scorer = relevance.RelevanceScorer(batch_size=2, model=model)
+    papers = [Paper(paper_id=f"P{i}", title=f"Title {i}") for i in range(5)]
+
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0)
+
+    ticking = asyncio.create_task(ticker())
+    result = await scorer.score_papers("query", papers)
+    ticking.cancel()
+
+    assert len(result) == 5
+    assert model.encode_calls[1:] == [["Title 0", "Title 1"], ["Title 2", "Title 3"], ["Title 4"]]
+    assert loop_thread not in encode_threads
+    assert ticks > 0
+
+
+@pytest.mark.asyncio
+async def test_embedding_store_skips_papers_already_encoded(monkeypatch, tmp_path):
+    class VectorModel(DummyModel):
+        def encode(self, texts, convert_to_tensor: bool = False):
+            self.encode_calls.append(texts)
+            if isinstance(texts, str):
+                return np.array([1.0, 0.0])
+            return np.array([[1.0, 0.0] if "match" in text else [0.0, 1.0] for text in texts])
+
+    def fake_cos_sim(query_embedding, paper_embeddings):
+        norms = np.linalg.norm(paper_embeddings, axis=1) * np.linalg.norm(query_embedding)
+        return [paper_embeddings @ query_embedding / norms]
+
+    monkeypatch.setattr(relevance.util, "cos_sim", fake_cos_sim)
+    store = EmbeddingStore(tmp_path / "embeddings")
+    papers = [
+        Paper(paper_id="P1", title="A match"),
+        Paper(paper_id="P2", title="Unrelated")
+    ]
+
+    first_model = VectorModel()
+    first = relevance.RelevanceScorer(model=first_model, embedding_store=store)
+    assert [paper.paper_id for paper in await first.score_papers("query", papers)] == ["P1"]
+    assert first_model.encode_calls[0] == ["A match", "Unrelated"]
+
+    changed = papers + [Paper(paper_id="P3", title="Another match")]
+    changed[1] = Paper(paper_id="P2", title="Now a match")
+    second_model = VectorModel()
+    second = relevance.RelevanceScorer(model=second_model, embedding_store=store)
+    result = await second.score_papers("query", changed)
+
+    assert [paper.paper_id for paper in result] == ["P1", "P2", "P3"]
+    assert second_model.encode_calls == [["Now a match", "Another match"], "query"]
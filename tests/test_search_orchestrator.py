@@ -1,11 +1,30 @@
+import sys
+import types
+from typing import Any, cast
 from unittest.mock import AsyncMock, Mock
 
 import pytest
 
-from deep_research.api.models import Paper, SearchResult
+from deep_research.api.models import ExternalIds, Paper, SearchResult
+from deep_research.config import SearchConfig
 from deep_research.core.search_orchestrator import SearchOrchestrator
 
 
+def _install_sentence_transformers_stub() -> None:
+    if "sentence_transformers" in sys.modules:
+        return
+
+    stub = types.ModuleType("sentence_transformers")
+    cast(Any, stub).SentenceTransformer = object
+    cast(Any, stub).util = types.SimpleNamespace(cos_sim=lambda *args, **kwargs: [])
+    sys.modules["sentence_transformers"] = stub
+
+
+_install_sentence_transformers_stub()
+
+from deep_research.core.screening import ScreeningPipeline
+
+
 @pytest.mark.asyncio
 async def test_run_full_search_workflow_and_deduplication():
     survey_engine = Mock()
@@ -53,3 +72,56 @@ async def test_run_full_search_workflow_and_deduplication():
     assert result.total == 4
     assert {paper.paper_id for paper in result.papers} == {"P1", "P2", "P3", "P4"}
     citation_graph.explore.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_cross_source_duplicates_reach_screening_and_are_merged():
+    semantic = Paper(
+        paper_id="S1",
+        title="Sleep and memory consolidation",
+        external_ids=ExternalIds(doi="10.1/sleep")
+    )
+    pubmed = Paper(
+        paper_id="PMID:7",
+        title="Sleep and memory consolidation.",
+        abstract="We studied sleep.",
+        external_ids=ExternalIds(doi="10.1/SLEEP", pmid="7")
+    )
+
+    survey_engine = Mock()
+    survey_engine.run_survey = AsyncMock(
+        return_value=SearchResult(papers=[semantic, pubmed], total=2, offset=0)
+    )
+    strategy_generator = Mock()
+    strategy_generator.generate_strategy = AsyncMock(return_value={})
+    query_builder = Mock()
+    query_builder.execute_queries = AsyncMock(return_value=[semantic])
+    citation_graph = Mock()
+    citation_graph.explore = AsyncMock(return_value=[])
+
+    orchestrator = SearchOrchestrator(
+        survey_engine=survey_engine,
+        strategy_generator=strategy_generator,
+        query_builder=query_builder,
+        citation_graph=citation_graph
+    )
+    search_result = await orchestrator.run_full_search("sleep")
+
+    assert [paper.paper_id for paper in search_result.papers] == ["S1", "PMID:7"]
+    # The same paper from two sources seeds the citation search once.
+    citation_graph.explore.assert_awaited_once_with([semantic], max_depth=2)
+
+    quality_checker = Mock()
+    quality_checker.filter_by_quality = Mock(side_effect=lambda papers, config: papers)
+    relevance_scorer = Mock()
+    relevance_scorer.score_papers = AsyncMock(side_effect=lambda query, papers, threshold: papers)
+    pipeline = ScreeningPipeline(
+        quality_checker=quality_checker,
+        relevance_scorer=relevance_scorer
+    )
+    screened = await pipeline.run_screening(search_result.papers, "sleep", SearchConfig())
+
+    assert len(screened) == 1
+    assert screened[0].paper_id == "S1"
+    assert screened[0].abstract == "We studied sleep."
+    assert screened[0].external_ids.pmid == "7"
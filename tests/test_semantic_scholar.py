@@ -1,7 +1,15 @@
+import asyncio
+import json
+import time
+
 import pytest
 import httpx
 import respx
+from deep_research.api.models import Paper
 from deep_research.api.semantic_scholar import SemanticScholarClient
+from deep_research.storage.cache import CacheManager
+from deep_research.storage.edge_store import EdgeStore
+from deep_research.utils.rate_limiter import RateLimiter
 
 
 @pytest.mark.asyncio
@@ -66,3 +74,252 @@ async def test_get_citations():
     citations = await client.get_citations("test123", limit=10)
     assert len(citations) == 1
     assert citations[0].paper_id == "cite1"
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_get_paper_cache_hit_skips_network(tmp_path):
+    cache = CacheManager(tmp_path / "cache.db")
+    cache.set_many([Paper(paper_id="cached1", title="Cached Paper")], "semantic_scholar")
+    client = SemanticScholarClient(cache=cache)
+
+    route = respx.get("https://api.semanticscholar.org/graph/v1/paper/cached1")
+
+    paper = await client.get_paper("cached1")
+    assert paper.title == "Cached Paper"
+    assert not route.called
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_repeated_search_served_from_cache(tmp_path):
+    client = SemanticScholarClient(cache=CacheManager(tmp_path / "cache.db"))
+
+    route = respx.get("https://api.semanticscholar.org/graph/v1/paper/search").mock(
+        return_value=httpx.Response(200, json={
+            "data": [
+                {"paperId": "s1", "title": "First"},
+                {"paperId": "s2", "title": "Second"}
+            ],
+            "total": 2
+        })
+    )
+
+    first = await client.search_papers("machine learning", limit=10)
+    second = await client.search_papers("machine  learning", limit=10)
+
+    assert route.call_count == 1
+    assert [paper.paper_id for paper in second.papers] == ["s1", "s2"]
+    assert second.total == first.total == 2
+
+
+@pytest.mark.asyncio
+async def test_concurrent_citation_requests_are_coalesced():
+    client = SemanticScholarClient()
+    calls = []
+
+    async def get(url, params=None, headers=None):
+        calls.append(url)
+        await asyncio.sleep(0.01)
+        return httpx.Response(
+            200,
+            json={"data": [{"citingPaper": {"paperId": "cite1", "title": "Citing"}}]},
+            request=httpx.Request("GET", url)
+        )
+
+    client.client.get = get
+
+    results = await asyncio.gather(*[client.get_citations("test123") for _ in range(3)])
+
+    assert len(calls) == 1
+    assert all(result[0].paper_id == "cite1" for result in results)
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_get_papers_batches_only_uncached_ids(tmp_path):
+    cache = CacheManager(tmp_path / "cache.db")
+    cache.set_many([Paper(paper_id="cached", title="Cached")], "semantic_scholar")
+    client = SemanticScholarClient(cache=cache)
+
+    def respond(request):
+        ids = json.loads(request.content)["ids"]
+        return httpx.Response(200, json=[
+            None if paper_id.endswith("7") else {"paperId": paper_id, "title": f"T {paper_id}"}
+            for paper_id in ids
+        ])
+
+    route = respx.post("https://api.semanticscholar.org/graph/v1/paper/batch").mock(
+        side_effect=respond
+    )
+
+    ids = ["cached"] + [f"p{i}" for i in range(1200)]
+    papers = await client.get_papers(ids)
+
+    assert route.call_count == 3
+    requested = [json.loads(call.request.content)["ids"] for call in route.calls]
+    assert sorted(len(batch) for batch in requested) == [200, 500, 500]
+    assert all("cached" not in batch for batch in requested)
+    assert papers[0].title == "Cached"
+    assert [paper.paper_id for paper in papers[1:4]] == ["p0", "p1", "p2"]
+    assert all(not paper.paper_id.endswith("7") for paper in papers)
+    assert len(papers) == 1 + 1200 - 120
+
+
+def _citation_pages(total: int, gate: asyncio.Event = None):
+    requested = []
+
+    async def get(url, params=None, headers=None):
+        offset, limit = params["offset"], params["limit"]
+        requested.append(offset)
+        if gate is not None and offset >= 200:
+            await gate.wait()
+        ids = range(offset, min(offset + limit, total))
+        payload = {"offset": offset, "data": [
+            {"citingPaper": {"paperId": f"c{i}", "title": f"Citing {i}"}} for i in ids
+        ]}
+        if offset + limit < total:
+            payload["next"] = offset + limit
+        return httpx.Response(200, json=payload, request=httpx.Request("GET", url))
+
+    return get, requested
+
+
+@pytest.mark.asyncio
+async def test_get_citations_pages_beyond_first_page():
+    client = SemanticScholarClient()
+    client.LINK_PAGE_SIZE = 100
+    client.client.get, requested = _citation_pages(total=250)
+
+    papers = await client.get_citations("test123", limit=1000)
+
+    # Without a known count, each page waits for the previous one's "next".
+    assert requested == [0, 100, 200]
+    assert sorted(int(paper.paper_id[1:]) for paper in papers) == list(range(250))
+
+
+@pytest.mark.asyncio
+async def test_iter_citations_requests_pages_covered_by_known_count_at_once():
+    client = SemanticScholarClient()
+    client.LINK_PAGE_SIZE = 100
+    gate = asyncio.Event()
+    client.client.get, requested = _citation_pages(total=450, gate=gate)
+
+    seen = []
+    async for paper in client.iter_citations("test123", limit=1000, total=350):
+        seen.append(paper.paper_id)
+        if len(seen) == 200:
+            # Pages 200 and 300 were requested together, before either returned.
+            await asyncio.sleep(0.05)
+            assert sorted(requested) == [0, 100, 200, 300]
+            gate.set()
+
+    # The count was stale; the page at 400 followed the "next" at 300.
+    assert sorted(requested) == [0, 100, 200, 300, 400]
+    assert len(seen) == 450
+
+
+@pytest.mark.asyncio
+async def test_get_citations_stops_at_limit():
+    client = SemanticScholarClient()
+    client.LINK_PAGE_SIZE = 100
+    client.client.get, requested = _citation_pages(total=1000)
+
+    papers = await client.get_citations("test123", limit=150)
+
+    assert sorted(requested) == [0, 100]
+    assert len(papers) == 150
+
+
+@pytest.mark.asyncio
+async def test_iter_citations_yields_pages_as_they_arrive():
+    client = SemanticScholarClient()
+    client.LINK_PAGE_SIZE = 100
+    gate = asyncio.Event()
+    client.client.get, _ = _citation_pages(total=300, gate=gate)
+
+    seen = []
+    async for paper in client.iter_citations("test123", limit=300):
+        seen.append(paper.paper_id)
+        if len(seen) == 200:
+            # The third page is still blocked, yet two pages were delivered.
+            gate.set()
+
+    assert len(seen) == 300
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_known_citation_edges_skip_citation_request(tmp_path):
+    cache = CacheManager(tmp_path / "cache.db")
+    client = SemanticScholarClient(cache=cache, edge_store=EdgeStore(tmp_path / "cache.db"))
+
+    route = respx.get("https://api.semanticscholar.org/graph/v1/paper/test123/citations").mock(
+        return_value=httpx.Response(200, json={
+            "data": [{"citingPaper": {
+                "paperId": "cite1", "title": "Citing", "year": 2023, "citationCount": 4
+            }}]
+        })
+    )
+    batch = respx.post("https://api.semanticscholar.org/graph/v1/paper/batch")
+
+    first = await client.get_citations("test123", limit=10)
+    again = await client.get_citations("test123", limit=10)
+
+    assert route.call_count == 1
+    assert batch.call_count == 0
+    assert again == first
+    assert again[0].year == 2023
+    assert again[0].citation_count == 4
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_rate_limiter_spaces_requests():
+    client = SemanticScholarClient(rate_limiter=RateLimiter(calls_per_second=20))
+    respx.get(url__regex=r".*/paper/p\d/references").mock(
+        return_value=httpx.Response(200, json={"data": []})
+    )
+
+    start = time.monotonic()
+    await asyncio.gather(*[client.get_references(f"p{i}") for i in range(4)])
+
+    assert time.monotonic() - start >= 0.15
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_rate_limited_requests_are_retried():
+    route = respx.get("https://api.semanticscholar.org/graph/v1/paper/test123/references").mock(
+        side_effect=[
+            httpx.Response(429),
+            httpx.Response(429, headers={"Retry-After": "0"}),
+            httpx.Response(200, json={"data": [{"citedPaper": {"paperId": "r1", "title": "R"}}]})
+        ]
+    )
+    client = SemanticScholarClient()
+
+    papers = await client.get_references("test123")
+
+    assert route.call_count == 3
+    assert [paper.paper_id for paper in papers] == ["r1"]
+
+
+def test_client_is_throttled_by_default():
+    assert SemanticScholarClient().rate_limiter.calls_per_second == 1000.0
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_get_papers_caches_alias_ids(tmp_path):
+    client = SemanticScholarClient(cache=CacheManager(tmp_path / "cache.db"))
+    route = respx.post("https://api.semanticscholar.org/graph/v1/paper/batch").mock(
+        return_value=httpx.Response(200, json=[{"paperId": "s2abc", "title": "Aliased"}])
+    )
+
+    first = await client.get_papers(["DOI:10.1/x"])
+    again = await client.get_papers(["DOI:10.1/x"])
+
+    assert route.call_count == 1
+    assert [paper.paper_id for paper in again] == [paper.paper_id for paper in first] == ["s2abc"]
+    await client.close()
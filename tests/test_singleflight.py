@@ -0,0 +1,72 @@
+import asyncio
+
+import pytest
+
+from deep_research.utils.singleflight import SingleFlight
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_task():
+    flight = SingleFlight()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "value"
+
+    results = await asyncio.gather(*[flight.do("key", fetch) for _ in range(5)])
+
+    assert results == ["value"] * 5
+    assert len(calls) == 1
+    assert len(flight) == 0
+
+
+@pytest.mark.asyncio
+async def test_key_released_after_completion():
+    flight = SingleFlight()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        return len(calls)
+
+    assert await flight.do("key", fetch) == 1
+    assert await flight.do("key", fetch) == 2
+
+
+@pytest.mark.asyncio
+async def test_errors_propagate_to_every_waiter():
+    flight = SingleFlight()
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    results = await asyncio.gather(
+        flight.do("key", fail),
+        flight.do("key", fail),
+        return_exceptions=True
+    )
+
+    assert all(isinstance(result, ValueError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_do_many_only_fetches_keys_not_in_flight():
+    flight = SingleFlight()
+    batches = []
+
+    async def fetch(keys):
+        batches.append(sorted(keys))
+        await asyncio.sleep(0.01)
+        return {key: key.upper() for key in keys}
+
+    first, second = await asyncio.gather(
+        flight.do_many(["a", "b"], fetch),
+        flight.do_many(["b", "c"], fetch)
+    )
+
+    assert first == {"a": "A", "b": "B"}
+    assert second == {"b": "B", "c": "C"}
+    assert batches == [["a", "b"], ["c"]]
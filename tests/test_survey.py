@@ -5,6 +5,7 @@ import pytest
 
 from deep_research.api.models import Paper, SearchResult
 from deep_research.core.survey import SurveyEngine
+from deep_research.storage.edge_store import CSRGraph
 
 
 @pytest.mark.asyncio
@@ -59,3 +60,96 @@ async def test_run_survey_parallel_and_top_50():
     semantic_client.search_papers.assert_called_once()
     pubmed_client.search.assert_called_once()
     pubmed_client.fetch_details.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_run_survey_ranks_by_graph_when_given():
+    semantic_client = Mock()
+    pubmed_client = Mock()
+    papers = [
+        Paper(paper_id="popular", title="Popular", citation_count=500),
+        Paper(paper_id="central", title="Central", citation_count=5)
+    ]
+    semantic_client.search_papers = AsyncMock(
+        return_value=SearchResult(papers=papers, total=2, offset=0)
+    )
+    pubmed_client.search = AsyncMock(return_value=[])
+    pubmed_client.fetch_details = AsyncMock(return_value=[])
+    graph = CSRGraph.from_pairs([("a", "central"), ("b", "central"), ("c", "central")])
+
+    engine = SurveyEngine(semantic_client=semantic_client, pubmed_client=pubmed_client)
+    result = await engine.run_survey("test query", graph=graph)
+
+    assert [paper.paper_id for paper in result.papers] == ["central", "popular"]
+
+
+@pytest.mark.asyncio
+async def test_run_survey_includes_local_corpus_results():
+    semantic_client = Mock()
+    pubmed_client = Mock()
+    local_client = Mock()
+    semantic_client.search_papers = AsyncMock(
+        return_value=SearchResult(
+            papers=[Paper(paper_id="S1", title="Remote", citation_count=3)],
+            total=1,
+            offset=0
+        )
+    )
+    pubmed_client.search = AsyncMock(return_value=[])
+    pubmed_client.fetch_details = AsyncMock(return_value=[])
+    local_client.search_papers = AsyncMock(
+        return_value=SearchResult(
+            papers=[Paper(paper_id="L1", title="Local", citation_count=9)],
+            total=1,
+            offset=0
+        )
+    )
+
+    engine = SurveyEngine(
+        semantic_client=semantic_client,
+        pubmed_client=pubmed_client,
+        local_client=local_client
+    )
+    result = await engine.run_survey("test query")
+
+    assert [paper.paper_id for paper in result.papers] == ["L1", "S1"]
+    local_client.search_papers.assert_awaited_once_with("test query", limit=100)
+
+
+@pytest.mark.asyncio
+async def test_run_survey_drops_local_results_repeating_remote_ones():
+    semantic_client = Mock()
+    pubmed_client = Mock()
+    local_client = Mock()
+    semantic_client.search_papers = AsyncMock(
+        return_value=SearchResult(
+            papers=[
+                Paper(paper_id="S1", title="Remote", citation_count=30),
+                Paper(paper_id="S2", title="Other", citation_count=5)
+            ],
+            total=2,
+            offset=0
+        )
+    )
+    pubmed_client.search = AsyncMock(return_value=[])
+    pubmed_client.fetch_details = AsyncMock(return_value=[])
+    local_client.search_papers = AsyncMock(
+        return_value=SearchResult(
+            papers=[
+                Paper(paper_id="S1", title="Remote (cached)", citation_count=28),
+                Paper(paper_id="L1", title="Local", citation_count=9)
+            ],
+            total=2,
+            offset=0
+        )
+    )
+
+    engine = SurveyEngine(
+        semantic_client=semantic_client,
+        pubmed_client=pubmed_client,
+        local_client=local_client
+    )
+    result = await engine.run_survey("test query")
+
+    assert [paper.paper_id for paper in result.papers] == ["S1", "L1", "S2"]
+    assert result.papers[0].title == "Remote"
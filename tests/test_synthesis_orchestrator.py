@@ -2,7 +2,8 @@ from unittest.mock import AsyncMock, Mock
 
 import pytest
 
-from deep_research.api.models import Paper
+from deep_research.api.models import Paper, QwenResponse
+from deep_research.core.classifier import StudyClassifier
 from deep_research.core.synthesis_orchestrator import SynthesisOrchestrator
 
 
@@ -94,3 +95,78 @@ async def test_synthesize_skips_consensus_for_non_binary_query():
 
     consensus_analyzer.quantify_consensus.assert_not_called()
     assert result["consensus"] == {}
+
+
+@pytest.mark.asyncio
+async def test_synthesize_classifies_each_paper_once():
+    papers = [
+        Paper(paper_id="P1", title="Ambiguous 1", abstract="No keywords.", citation_count=80),
+        Paper(paper_id="P2", title="Ambiguous 2", abstract="No keywords.", citation_count=80)
+    ]
+    prompts = []
+
+    async def complete(prompt, **kwargs):
+        prompts.append(prompt)
+        if prompt.startswith("Classify the study type"):
+            return QwenResponse(content="Observational", model="test")
+        return QwenResponse(content='["finding"]', model="test")
+
+    qwen_client = Mock()
+    qwen_client.complete = AsyncMock(side_effect=complete)
+    gap_analyzer = Mock()
+    gap_analyzer.analyze_gaps = AsyncMock(return_value={
+        "themes": [],
+        "technologies": [],
+        "matrix": [],
+        "gaps": []
+    })
+    report_generator = Mock()
+    report_generator.generate_report = Mock(return_value="REPORT")
+
+    orchestrator = SynthesisOrchestrator(
+        gap_analyzer=gap_analyzer,
+        report_generator=report_generator
+    )
+    result = await orchestrator.synthesize(papers, "exercise outcomes", qwen_client)
+
+    classify_prompts = [p for p in prompts if p.startswith("Classify the study type")]
+    assert len(classify_prompts) == 2
+    assert [item["study_type"] for item in result["classifications"]] == ["Observational"] * 2
+    assert [item["claims"] for item in result["evidence"]] == [["finding"], ["finding"]]
+
+
+@pytest.mark.asyncio
+async def test_injected_classifier_shares_the_annotation_store():
+    papers = [
+        Paper(paper_id="P1", title="Ambiguous 1", abstract="No keywords.", citation_count=80),
+        Paper(paper_id="P2", title="Ambiguous 2", abstract="No keywords.", citation_count=80)
+    ]
+    prompts = []
+
+    async def complete(prompt, **kwargs):
+        prompts.append(prompt)
+        if prompt.startswith("Classify the study type"):
+            return QwenResponse(content="Observational", model="test")
+        return QwenResponse(content='["finding"]', model="test")
+
+    qwen_client = Mock()
+    qwen_client.complete = AsyncMock(side_effect=complete)
+    gap_analyzer = Mock()
+    gap_analyzer.analyze_gaps = AsyncMock(return_value={
+        "themes": [],
+        "technologies": [],
+        "matrix": [],
+        "gaps": []
+    })
+    classifier = StudyClassifier(max_concurrent=2)
+
+    orchestrator = SynthesisOrchestrator(
+        classifier=classifier,
+        gap_analyzer=gap_analyzer,
+        report_generator=Mock(generate_report=Mock(return_value="REPORT"))
+    )
+    await orchestrator.synthesize(papers, "exercise outcomes", qwen_client)
+
+    assert classifier.annotations is orchestrator.annotations
+    classify_prompts = [p for p in prompts if p.startswith("Classify the study type")]
+    assert len(classify_prompts) == 2